@@ -0,0 +1,101 @@
+"""
+Trajectory output: preallocated float64 buffers vs per-step list.append.
+
+Times the NumPy (non-Numba) integrate_rk4 and simulate_photon loops and
+measures their tracemalloc peak against the list-based loops they replaced.
+For simulate_photon the buffer saves memory only: the Python-level Kerr RK4
+step dominates the loop, and the buffered loop also carries the drift
+monitor's bookkeeping, so the speed-up column shows no gain (at or a little
+below 1x).
+
+Run from the repository root:
+
+    python benchmarks/bench_buffers.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from blackhole import kernels
+from blackhole.kerr import horizon_radius, initial_state, rk4_step as kerr_rk4_step
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import initial_slope, integrate_rk4, rk4_step
+
+
+# --------------------------------------------------
+# The list-based loops, as they were before the buffers
+# --------------------------------------------------
+def integrate_rk4_lists(r0=10.0, b=3.0, M=1.0, dphi=0.001, max_steps=20000):
+    u, du = 1.0/r0, float(initial_slope(r0, b, M))
+    phi_vals, r_vals = [], []
+    phi = np.pi
+    for _ in range(max_steps):
+        r = 1/u
+        if r <= 1.51*M or r > 50:
+            break
+        phi_vals.append(phi)
+        r_vals.append(r)
+        u, du = rk4_step(u, du, dphi, M)
+        phi += dphi
+    return np.array(phi_vals), np.array(r_vals)
+
+
+def simulate_photon_lists(r0, phi0, b, M=1.0, a=0.0, dt=0.01, max_steps=50000):
+    r_plus = horizon_radius(M, a)
+    state = initial_state(r0, phi0, b)
+    r_vals, phi_vals = [r0], [phi0]
+    for _ in range(max_steps):
+        r, phi, pr, pphi = state
+        if r <= r_plus*1.05 or r > r0*1.5:
+            break
+        r_vals.append(r)
+        phi_vals.append(phi)
+        state = kerr_rk4_step(state, dt, M, a)
+    return np.array(r_vals), np.array(phi_vals)
+
+
+def measure(run, repeat=5):
+    """Best wall time of `repeat` untraced runs and tracemalloc peak (traced run)"""
+    elapsed = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+CASES = [
+    ('integrate_rk4 (near-critical b, dphi = 5e-4)',
+     lambda: integrate_rk4_lists(b=5.19616, dphi=0.0005, max_steps=100000),
+     lambda: integrate_rk4(b=5.19616, dphi=0.0005, max_steps=100000)),
+    ('simulate_photon (50k steps)',
+     lambda: simulate_photon_lists(15.0, np.pi, 6.0, 1.0, 0.7),
+     lambda: simulate_photon(15.0, np.pi, 6.0, 1.0, 0.7)),
+]
+
+
+def main():
+    kernels.USE_NUMBA = False
+    print(f"{'case':44s} {'lists':>16s} {'buffers':>16s} {'speed-up':>9s} "
+          f"{'memory saved':>13s}")
+    for name, old, new in CASES:
+        t_old, m_old = measure(old)
+        t_new, m_new = measure(new)
+        print(f"{name:44s} {t_old:6.2f}s {m_old/2**20:6.1f}MiB "
+              f"{t_new:6.2f}s {m_new/2**20:6.1f}MiB {t_old/t_new:8.2f}x "
+              f"{1 - m_new/m_old:12.0%}")
+
+
+if __name__ == "__main__":
+    main()
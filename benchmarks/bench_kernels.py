@@ -0,0 +1,58 @@
+"""
+Per-step cost of the RK4 hot loops: Numba kernels vs the NumPy fallback.
+
+Run from the repository root:
+
+    python benchmarks/bench_kernels.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from blackhole import kernels
+from blackhole.kerr import simulate_photon
+from blackhole.newton import compute_trajectory
+from blackhole.schwarzschild import integrate_rk4
+
+CASES = [
+    ('compute_trajectory', lambda: compute_trajectory(steps=3000), lambda out: len(out[0])),
+    ('integrate_rk4', lambda: integrate_rk4(r0=10.0, b=8.0), lambda out: len(out[1])),
+    ('simulate_photon', lambda: simulate_photon(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=20000),
+     lambda out: len(out[2])),
+]
+
+
+def time_per_step(run, count, repeats):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = run()
+        best = min(best, time.perf_counter() - start)
+    return best / count(out)
+
+
+def main():
+    if not kernels.HAVE_NUMBA:
+        print("Numba is not installed: only the NumPy fallback can be timed")
+
+    print(f"{'loop':20s} {'numpy ns/step':>14s} {'numba ns/step':>14s} {'speedup':>8s}")
+    for name, run, count in CASES:
+        kernels.USE_NUMBA = False
+        t_numpy = time_per_step(run, count, repeats=3)
+
+        if kernels.HAVE_NUMBA:
+            kernels.USE_NUMBA = True
+            run()  # compile (or load from the on-disk cache)
+            t_numba = time_per_step(run, count, repeats=20)
+            print(f"{name:20s} {t_numpy*1e9:14.0f} {t_numba*1e9:14.0f} {t_numpy/t_numba:7.0f}x")
+        else:
+            print(f"{name:20s} {t_numpy*1e9:14.0f} {'-':>14s} {'-':>8s}")
+
+
+if __name__ == "__main__":
+    main()
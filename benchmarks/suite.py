@@ -0,0 +1,267 @@
+"""
+Benchmark suite for the hot paths, with a JSON history.
+
+Run from the repository root:
+
+    python benchmarks/suite.py run [--quick] [--filter rk4] [--repeats 3]
+    python benchmarks/suite.py compare [--threshold 0.1] [--baseline -2]
+
+Every case runs at a few sizes (steps, rays or frames). For each size, `run`
+records the best wall time over --repeats calls (after one warm-up call, so
+Numba compilation is not timed), the rate of right-hand-side evaluations per
+second (frames per second for the GIF render) and the tracemalloc peak of
+one extra traced call. The run is appended to the history file, together
+with the commit, the Python and NumPy versions and whether Numba was used.
+
+`compare` checks the latest record against an earlier one (by default the
+one before it) and exits with status 1 if a case became slower, or peaked
+higher in memory, by more than the threshold. Sweep cases trace only the
+parent process.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from blackhole import kernels
+from blackhole.kerr import simulate_photon
+from blackhole.kerr3d import trace_camera
+from blackhole.newton import compute_trajectory
+from blackhole.schwarzschild import integrate_photon_orbit, integrate_rk4, integrate_rk4_batch
+from blackhole.sweep import sweep
+
+DEFAULT_HISTORY = os.path.join(ROOT, 'benchmarks', 'results', 'history.json')
+DEFAULT_THRESHOLD = 0.10
+
+# Changes smaller than these are noise, whatever the relative change
+TIME_FLOOR = 1e-3
+MEMORY_FLOOR = 64*1024
+
+
+# --------------------------------------------------
+# Cases: size -> (call, count of work units in its result)
+# --------------------------------------------------
+def bench_compute_trajectory(steps):
+    return (lambda: compute_trajectory(-10.0, 3.0, steps=steps),
+            lambda out: 4*len(out[0]))
+
+
+def bench_integrate_rk4(steps):
+    # Just above b_crit: the ray winds around the photon sphere for all steps
+    return (lambda: integrate_rk4(10.0, 5.196152, dphi=0.0005, max_steps=steps),
+            lambda out: 4*len(out[1]))
+
+
+def bench_integrate_photon_orbit(b):
+    return lambda: integrate_photon_orbit(b), lambda out: len(out[0])
+
+
+def bench_simulate_photon(steps):
+    return (lambda: simulate_photon(15.0, np.pi, 6.0, 1.0, 0.7, max_steps=steps),
+            lambda out: 4*len(out[2]))
+
+
+def bench_photon_sphere_sweep(rays):
+    bs = np.linspace(4.0, 7.0, rays)
+    return (lambda: sweep(integrate_photon_orbit, bs),
+            lambda out: sum(len(run[0]) for run in out))
+
+
+def bench_integrate_rk4_batch(rays):
+    bs = np.linspace(4.0, 8.0, rays)
+    return lambda: integrate_rk4_batch(bs), lambda out: 4*int(out[2].sum())
+
+
+def bench_trace_camera(pixels):
+    return (lambda: trace_camera(pixels, pixels, inclination=60.0, a=0.9),
+            lambda out: 4*int(out['steps'].sum()))
+
+
+def bench_gif_render(frames):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from blackhole.animation import PathAnimation
+
+    phi, r = integrate_rk4(10.0, 3.0)
+    x, y = r*np.cos(phi), r*np.sin(phi)
+
+    def render():
+        fig, ax = plt.subplots(figsize=(6, 6))
+        ax.set_xlim(-12, 12)
+        ax.set_ylim(-8, 8)
+        ax.scatter(0, 0, color='black', s=80)
+        anim = PathAnimation(fig)
+        anim.add_path(ax, x, y, lw=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            n = anim.save(os.path.join(tmp, 'ray.gif'), frames=frames)
+        plt.close(fig)
+        return n
+
+    return render, lambda out: out
+
+
+# (name, parameter, sizes, unit, bench); --quick runs the first size only
+CASES = [
+    ('compute_trajectory', 'steps', [3000, 30000], 'rhs', bench_compute_trajectory),
+    ('integrate_rk4', 'steps', [5000, 20000], 'rhs', bench_integrate_rk4),
+    ('integrate_photon_orbit', 'b', [8.0, 5.196], 'rhs', bench_integrate_photon_orbit),
+    ('simulate_photon', 'steps', [5000, 20000], 'rhs', bench_simulate_photon),
+    ('photon_sphere_sweep', 'rays', [13, 64], 'rhs', bench_photon_sphere_sweep),
+    ('integrate_rk4_batch', 'rays', [64, 512], 'rhs', bench_integrate_rk4_batch),
+    ('trace_camera', 'pixels', [64, 256], 'rhs', bench_trace_camera),
+    ('gif_render', 'frames', [30, 120], 'frames', bench_gif_render),
+]
+
+
+# --------------------------------------------------
+# Measurement
+# --------------------------------------------------
+def measure(call, repeats):
+    """(best wall time, result, tracemalloc peak bytes)"""
+    out = call()
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = call()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, out, peak
+
+
+def run_cases(names=None, quick=False, repeats=3, echo=print):
+    """{'<case>[<param>=<size>]': result dict} for the selected cases"""
+    results = {}
+    for name, param, sizes, unit, bench in CASES:
+        if names and not any(pattern in name for pattern in names):
+            continue
+        for size in sizes[:1] if quick else sizes:
+            call, count = bench(size)
+            wall, out, peak = measure(call, repeats)
+            work = count(out)
+            key = f"{name}[{param}={size}]"
+            results[key] = {'case': name, 'param': param, 'size': size, 'unit': unit,
+                            'count': work, 'wall_time': wall, 'rate': work/wall,
+                            'peak_bytes': peak}
+            echo(f"{key:40s} {wall*1e3:10.2f} ms {work/wall:12.3g} {unit}/s "
+                 f"{peak/2**20:8.2f} MiB")
+    return results
+
+
+# --------------------------------------------------
+# History
+# --------------------------------------------------
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def make_record(results):
+    return {'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'commit': git_commit(), 'python': platform.python_version(),
+            'numpy': np.__version__, 'numba': kernels.USE_NUMBA,
+            'machine': platform.machine(), 'cpus': os.cpu_count(),
+            'results': results}
+
+
+def load_history(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def append_history(path, record):
+    history = load_history(path) + [record]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, path)
+    return history
+
+
+def compare(old, new, threshold=DEFAULT_THRESHOLD):
+    """
+    Rows (key, metric, old, new, relative change, regressed) for the cases
+    present in both records. Wall time and peak memory are checked; a change
+    below TIME_FLOOR / MEMORY_FLOOR never counts as a regression.
+    """
+    rows = []
+    for key, result in new['results'].items():
+        before = old['results'].get(key)
+        if before is None:
+            continue
+        for metric, floor in (('wall_time', TIME_FLOOR), ('peak_bytes', MEMORY_FLOOR)):
+            a, b = before[metric], result[metric]
+            change = (b - a)/a if a else 0.0
+            rows.append((key, metric, a, b, change, change > threshold and b - a > floor))
+    return rows
+
+
+# --------------------------------------------------
+# Command line
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hot-path benchmarks with a JSON history")
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('run', help="run the suite and append to the history")
+    p.add_argument('--filter', action='append', help="only cases containing this text")
+    p.add_argument('--quick', action='store_true', help="smallest size of each case only")
+    p.add_argument('--repeats', type=int, default=3)
+
+    p = sub.add_parser('compare', help="flag regressions of the latest run")
+    p.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                   help="relative slowdown / memory growth that counts as a regression")
+    p.add_argument('--baseline', type=int, default=-2,
+                   help="history index to compare the latest run against")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        print(f"Numba: {'on' if kernels.USE_NUMBA else 'off'}")
+        results = run_cases(args.filter, args.quick, args.repeats)
+        history = append_history(args.history, make_record(results))
+        print(f"Recorded run {len(history) - 1} in {args.history}")
+        return 0
+
+    history = load_history(args.history)
+    if len(history) < 2:
+        print(f"Need at least two runs in {args.history} to compare")
+        return 2
+    old, new = history[args.baseline], history[-1]
+    print(f"{old['commit']} ({old['timestamp']}) -> {new['commit']} ({new['timestamp']})")
+
+    regressions = 0
+    for key, metric, a, b, change, regressed in compare(old, new, args.threshold):
+        flag = 'REGRESSION' if regressed else ''
+        print(f"{key:40s} {metric:10s} {a:12.4g} {b:12.4g} {change:+8.1%} {flag}")
+        regressions += regressed
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
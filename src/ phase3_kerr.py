@@ -7,6 +7,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from blackhole.decimate import plot_path
+
 # -------------------------------
 # 1. Black hole parameters
 # -------------------------------
@@ -68,7 +70,7 @@ for _ in range(steps):
 # 6. Plot trajectory
 # -------------------------------
 plt.figure(figsize=(8, 8))
-plt.plot(x_vals, y_vals, color="blue", linewidth=2, label=f"Light Ray (Kerr, a={a})")
+plot_path(plt.gca(), x_vals, y_vals, color="blue", linewidth=2, label=f"Light Ray (Kerr, a={a})")
 plt.scatter(0, 0, color="black", s=100, label="Kerr Black Hole", zorder=5)
 plt.xlabel("x (spatial coordinate)", fontsize=12)
 plt.ylabel("y (impact parameter)", fontsize=12)
@@ -92,8 +94,8 @@ plt.show()
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.animation import PillowWriter
+
+from blackhole.animation import PathAnimation
 
 # -------------------------------
 # Phase 3: Kerr Animation
@@ -142,49 +144,25 @@ for _ in range(steps):
     x_vals.append(x_temp)
     y_vals.append(y_temp)
 
-# Create animation
+# Create animation: static axes drawn once, the ray blitted on top
 fig, ax = plt.subplots(figsize=(8, 8))
-
-def init():
-    ax.clear()
-    ax.set_xlim(-11, 11)
-    ax.set_ylim(-5, 5)
-    ax.set_xlabel("x (spatial coordinate)", fontsize=12)
-    ax.set_ylabel("y (impact parameter)", fontsize=12)
-    ax.set_title("Phase 3: Light Deflection near Kerr Black Hole", 
-                 fontsize=14, fontweight='bold')
-    ax.grid(True, alpha=0.3)
-    ax.set_aspect('equal')
-    # Draw black hole
-    ax.scatter(0, 0, color="black", s=200, label="Kerr Black Hole", zorder=5)
-    ax.legend(fontsize=11)
-    return []
-
-def animate(frame):
-    # Clear previous lines
-    for line in ax.lines[:]:
-        line.remove()
-    for collection in ax.collections[1:]:  # Keep the black hole (first collection)
-        collection.remove()
-    
-    # Plot trajectory up to current frame (show every 5th frame for speed)
-    idx = min(frame * 5, len(x_vals))
-    if idx > 0:
-        line, = ax.plot(x_vals[:idx], y_vals[:idx], color="blue", linewidth=2, label=f"Light Ray (Kerr, a={a})")
-        # Current position marker
-        point = ax.scatter(x_vals[idx-1], y_vals[idx-1], color="red", s=100, zorder=10)
-        return [line, point]
-    
-    return []
-
-# Create animation
-frames = len(x_vals) // 5
-anim = animation.FuncAnimation(fig, animate, init_func=init, frames=frames, 
-                              interval=20, blit=False, repeat=True)
+ax.set_xlim(-11, 11)
+ax.set_ylim(-5, 5)
+ax.set_xlabel("x (spatial coordinate)", fontsize=12)
+ax.set_ylabel("y (impact parameter)", fontsize=12)
+ax.set_title("Phase 3: Light Deflection near Kerr Black Hole",
+             fontsize=14, fontweight='bold')
+ax.grid(True, alpha=0.3)
+ax.set_aspect('equal')
+# Draw black hole
+ax.scatter(0, 0, color="black", s=200, label="Kerr Black Hole", zorder=5)
+ax.legend(fontsize=11)
+
+anim = PathAnimation(fig)
+anim.add_path(ax, x_vals, y_vals, markersize=10, color="blue", linewidth=2)
 
 # Save animation
 print("Saving Phase 3 animation...")
-writer = PillowWriter(fps=30)
-anim.save("phase3_kerr_animation.gif", writer=writer)
+anim.save("phase3_kerr_animation.gif", duration=5, fps=30)
 print("Phase 3 animation saved as 'phase3_kerr_animation.gif'")
 plt.close()
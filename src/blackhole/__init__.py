@@ -0,0 +1,7 @@
+"""
+Black hole light bending - importable library core.
+
+The phase scripts in src/ produce the plots and animations; the modules in
+this package hold the integrators so they can be reused (and batched) without
+running a whole simulation on import.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from blackhole.cli import main
+
+sys.exit(main())
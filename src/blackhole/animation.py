@@ -0,0 +1,164 @@
+"""
+Shared trajectory animation engine.
+
+The scripts used to animate with FuncAnimation and
+line.set_data(x[:frame], y[:frame]) over frames=len(x): every frame redraws
+the whole figure and the whole path so far, O(N^2) in trajectory length, and
+there is one frame per integration step. Here instead:
+
+- the static part of the figure (axes, grid, hole, labels) is drawn once
+  and cached as a background image;
+- each frame draws only the path segment added since the previous frame on
+  top of that cache (true blitting) and folds it back into the cache, so a
+  frame costs O(new points) whatever the trajectory length;
+- the moving markers, and any overlay artists (trails, status text), are
+  drawn last and are not kept in the cache;
+- segments are drawn through the decimated path (blackhole.decimate);
+- the number of frames comes from a target frame count or a duration and
+  fps (frame_indices), not from the step count.
+
+Frames are RGBA uint8 arrays; save_gif writes them the same way
+matplotlib's PillowWriter does.
+
+    anim = PathAnimation(fig)
+    anim.add_path(ax, x, y, color='blue', lw=2)
+    anim.save('ray.gif', duration=4, fps=30)
+"""
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from blackhole.decimate import DEFAULT_PX, decimate_indices, pixel_size
+
+DEFAULT_FRAMES = 120
+
+
+def frame_indices(n_points, frames=None, duration=None, fps=30):
+    """
+    End index (exclusive) of the visible path for every frame.
+
+    frames, or duration * fps, sets the frame count (DEFAULT_FRAMES if neither
+    is given); it is capped at n_points. The last frame shows the whole path.
+    """
+    if frames is None:
+        frames = int(round(duration*fps)) if duration is not None else DEFAULT_FRAMES
+    frames = max(1, min(int(frames), n_points))
+    return np.unique(np.linspace(1, n_points, frames).round().astype(int))
+
+
+class PathAnimation:
+    """Blitted, incrementally drawn trajectories on a matplotlib figure"""
+
+    def __init__(self, fig, dpi=None):
+        self.fig = fig
+        if dpi is not None:
+            fig.set_dpi(dpi)
+        if not isinstance(fig.canvas, FigureCanvasAgg):
+            FigureCanvasAgg(fig)
+        self.paths = []
+        self.overlays = []
+
+    def add_path(self, ax, x, y, marker='ro', markersize=8, decimate=True, head_kw=None,
+                 **line_kw):
+        """
+        Animate (x, y) on ax. line_kw style the path; marker (None for no
+        marker), markersize and head_kw (more Line2D properties) style the
+        moving head.
+
+        With decimate the drawn segments only go through the points that
+        decimate_indices keeps at the axes' current pixel size (set the
+        limits first); the head and the timing still follow every point.
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if decimate and len(x) > 2:
+            kept = decimate_indices(x, y, DEFAULT_PX*pixel_size(ax, x, y))
+        else:
+            kept = np.arange(len(x))
+        line, = ax.plot([], [], animated=True, **line_kw)
+        head = None
+        if marker is not None:
+            head, = ax.plot([], [], marker, markersize=markersize, animated=True,
+                            **(head_kw or {}))
+        self.paths.append((ax, x, y, line, head, kept))
+        return line, head
+
+    def add_overlay(self, ax, artists, update, path=None):
+        """
+        Artists redrawn on every frame over the paths and never cached.
+        update(i) sets them up for head index i of path (an add_path order
+        index, default the last path added) before they are drawn.
+        """
+        for artist in artists:
+            artist.set_animated(True)
+        if path is None:
+            path = len(self.paths) - 1
+        self.overlays.append((ax, list(artists), update, path))
+
+    def frames(self, frames=None, duration=None, fps=30, start=0, stop=None):
+        """
+        Yield one RGBA (H, W, 4) uint8 array per frame.
+
+        Paths of different lengths advance in proportion, so they all finish
+        on the last frame. Only frames start..stop-1 are yielded; the earlier
+        ones are still drawn into the cached background (without copying the
+        canvas out), so frame k is the same bytes whatever start is.
+        """
+        n_points = max(len(path[1]) for path in self.paths)
+        ends = frame_indices(n_points, frames, duration, fps)
+        stop = len(ends) if stop is None else min(stop, len(ends))
+
+        canvas = self.fig.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(self.fig.bbox)
+        drawn = [0]*len(self.paths)
+
+        for k in range(stop):
+            canvas.restore_region(background)
+
+            # New segments, overlapping the previous one by a point so the
+            # path stays connected; then they become part of the background
+            for i, (ax, x, y, line, _, kept) in enumerate(self.paths):
+                end = -(-ends[k]*len(x)//n_points)
+                if end > drawn[i]:
+                    begin = max(drawn[i] - 1, 0)
+                    inner = kept[np.searchsorted(kept, begin, 'right'):
+                                 np.searchsorted(kept, end - 1)]
+                    pts = np.r_[begin, inner, end - 1]
+                    line.set_data(x[pts], y[pts])
+                    ax.draw_artist(line)
+                    drawn[i] = end
+            background = canvas.copy_from_bbox(self.fig.bbox)
+            if k < start:
+                continue
+
+            for i, (ax, x, y, _, head, _) in enumerate(self.paths):
+                if head is not None and drawn[i] > 0:
+                    head.set_data([x[drawn[i] - 1]], [y[drawn[i] - 1]])
+                    ax.draw_artist(head)
+            for ax, artists, update, i in self.overlays:
+                if drawn[i] > 0:
+                    update(drawn[i] - 1)
+                    for artist in artists:
+                        ax.draw_artist(artist)
+
+            yield np.asarray(canvas.buffer_rgba()).copy()
+
+    def frame_count(self, frames=None, duration=None, fps=30):
+        n_points = max(len(path[1]) for path in self.paths)
+        return len(frame_indices(n_points, frames, duration, fps))
+
+    def save(self, path, frames=None, duration=None, fps=30):
+        """Render and write a GIF; returns the number of frames"""
+        images = list(self.frames(frames, duration, fps))
+        save_gif(path, images, fps)
+        return len(images)
+
+
+def save_gif(path, images, fps=30):
+    """Write RGBA frames as a looping GIF (same encoding as PillowWriter)"""
+    from PIL import Image
+
+    frames = [Image.frombuffer('RGBA', (img.shape[1], img.shape[0]), img.tobytes(),
+                               'raw', 'RGBA', 0, 1) for img in images]
+    frames[0].save(path, save_all=True, append_images=frames[1:],
+                   duration=int(1000/fps), loop=0)
@@ -0,0 +1,95 @@
+"""
+Preallocated trajectory output buffers.
+
+The integrators write each recorded point straight into contiguous float64
+rows instead of appending boxed floats to Python lists and copying them into
+an array at the end. Capacity starts small, doubles when full (bounded by the
+most points the integrator can record) and the result is trimmed to the
+points actually written.
+"""
+
+import numpy as np
+
+INITIAL_CAPACITY = 4096
+
+
+def recorded_points(steps, record_every=1):
+    """Most points a loop of `steps` iterations records with the given stride"""
+    return -(-steps // record_every)
+
+
+class TrajectoryBuffer:
+    """Growable (ncols, capacity) float64 buffer; the caller tracks the count"""
+
+    def __init__(self, ncols, max_points, initial=INITIAL_CAPACITY):
+        self.max_points = max(int(max_points), 1)
+        self.data = np.empty((ncols, min(initial, self.max_points)))
+
+    @property
+    def rows(self):
+        """One 1-D view per column, for fast scalar writes in the step loop"""
+        return tuple(self.data)
+
+    def grow(self, n):
+        """Double the capacity keeping the first n points; returns new rows"""
+        capacity = min(2*self.data.shape[1], self.max_points)
+        data = np.empty((self.data.shape[0], capacity))
+        data[:, :n] = self.data[:, :n]
+        self.data = data
+        return self.rows
+
+    def trim(self, n):
+        """Contiguous copies of the first n points of every column"""
+        return tuple(row[:n].copy() for row in self.data)
+
+
+class BatchBuffer:
+    """
+    Paths of a batch of rays whose active set only shrinks.
+
+    Every ray is active from the first row until it stops. append() writes
+    one row: the values of the active rays only, into growable (ncols,
+    capacity) storage; the active ids are kept only when the set shrinks.
+    trim() scatters the rows to a flat ray-major layout, so storage is the
+    number of points recorded, not rows x rays.
+    """
+
+    def __init__(self, ncols, n_rays, initial=INITIAL_CAPACITY):
+        self.data = np.empty((ncols, initial))
+        self.counts = np.zeros(n_rays, dtype=int)
+        self.filled = 0
+        self.n_rows = 0
+        self.segments = []  # (first row, active ids)
+
+    def append(self, ids, *columns):
+        """Record one row: columns[k][j] is column k of ray ids[j]"""
+        if not self.segments or len(ids) != len(self.segments[-1][1]):
+            self.segments.append((self.n_rows, np.array(ids)))
+        end = self.filled + len(ids)
+        if end > self.data.shape[1]:
+            data = np.empty((self.data.shape[0], max(2*self.data.shape[1], end)))
+            data[:, :self.filled] = self.data[:, :self.filled]
+            self.data = data
+        for row, values in zip(self.data, columns):
+            row[self.filled:end] = values
+        self.filled = end
+        self.counts[ids] += 1
+        self.n_rows += 1
+
+    def trim(self):
+        """
+        ncols flat arrays of length counts.sum(), ray after ray, each ray's
+        points in row order; np.split(col, np.cumsum(counts)[:-1]) gives the
+        rays one by one.
+        """
+        offsets = np.r_[0, np.cumsum(self.counts)[:-1]]
+        out = np.empty((self.data.shape[0], self.filled))
+        ends = [first for first, _ in self.segments[1:]] + [self.n_rows]
+        pos = 0
+        for (first, ids), last in zip(self.segments, ends):
+            block = (last - first)*len(ids)
+            if block:
+                index = offsets[ids] + np.arange(first, last)[:, None]
+                out[:, index] = self.data[:, pos:pos + block].reshape(-1, last - first, len(ids))
+                pos += block
+        return tuple(out)
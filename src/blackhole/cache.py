@@ -0,0 +1,244 @@
+"""
+Content-addressed on-disk cache for integrator results.
+
+A result is keyed by a SHA-256 of the solver's qualified name, a hash of the
+source of every blackhole module and of the solver's own module (so editing
+a solver or anything it calls, kernels included, invalidates its entries),
+the kernel backend (Numba or the NumPy fallback, which can differ in the
+last bits), CACHE_VERSION and every argument after defaults are applied, so
+integrate_rk4(10.0, 3.0) and integrate_rk4(b=3.0) share an entry. Each entry
+is a directory of files, one per returned item: arrays, scalars and strings
+(fates) as .npy (the latter two round-trip as 0-d arrays), dicts (stats=True)
+as .json. Anything else is rejected by put with a TypeError.
+
+The cache is capped at max_bytes; entries are touched on every hit and the
+least recently used ones are evicted first. Hits, misses, stores and
+evictions are counted per TrajectoryCache instance.
+
+    from blackhole.cache import cached
+    phi, r = cached(integrate_rk4)(r0=10.0, b=3.0)
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import uuid
+
+import numpy as np
+
+from blackhole import kernels
+from blackhole.lookup import default_cache_dir
+
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 512*1024**2
+DISABLE_ENV = 'BLACKHOLE_DISABLE_CACHE'
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_DEFAULT = None
+
+
+@functools.lru_cache(maxsize=None)
+def _package_hash():
+    """Hash of the source of every module in the blackhole package"""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if name.endswith('.py'):
+            with open(os.path.join(PACKAGE_DIR, name), 'rb') as f:
+                digest.update(name.encode() + b'\0' + f.read())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _module_hash(module_name):
+    try:
+        source = inspect.getsource(sys.modules[module_name])
+    except (KeyError, OSError, TypeError):
+        source = ''
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _source_hash(func):
+    """Hash of the blackhole package plus the module defining func"""
+    parts = (_package_hash(), _module_hash(func.__module__))
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:16]
+
+
+def _canonical(value):
+    """Stable text for an argument; arrays are hashed by dtype, shape and bytes"""
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return f"ndarray({value.dtype.str},{value.shape},{digest})"
+    if isinstance(value, (list, tuple)):
+        return '(' + ','.join(_canonical(v) for v in value) + ')'
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    if isinstance(value, (np.integer, np.bool_)):
+        return repr(value.item())
+    return repr(value)
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"cannot cache a {type(value).__name__} inside a dict")
+
+
+def _save_item(stem, item):
+    if isinstance(item, dict):
+        with open(f"{stem}.json", 'w') as f:
+            json.dump(item, f, default=_json_default)
+        return
+    array = np.asarray(item)
+    if array.dtype.hasobject:
+        raise TypeError(f"cannot cache a {type(item).__name__}: results must be "
+                        "arrays, scalars, strings or dicts of those")
+    np.save(f"{stem}.npy", array)
+
+
+def _load_item(path):
+    if path.endswith('.json'):
+        with open(path) as f:
+            return json.load(f)
+    item = np.load(path, allow_pickle=False)
+    return item.item() if item.ndim == 0 else item
+
+
+def cache_key(func, *args, **kwargs):
+    """Hex key for func(*args, **kwargs)"""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    parts = [f"v{CACHE_VERSION}", f"{func.__module__}.{func.__qualname__}",
+             _source_hash(func), 'numba' if kernels.USE_NUMBA else 'numpy']
+    parts += [f"{name}={_canonical(value)}" for name, value in bound.arguments.items()]
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+class TrajectoryCache:
+    """Directory of cached results with an LRU size cap"""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or os.path.join(default_cache_dir(), 'trajectories')
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        entry = self._entry(key)
+        try:
+            names = sorted(name for name in os.listdir(entry)
+                           if name.endswith(('.npy', '.json')))
+            items = [_load_item(os.path.join(entry, name)) for name in names]
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(entry)
+        self.hits += 1
+
+        if names and names[0].startswith('value.'):
+            return items[0]
+        return tuple(items)
+
+    def put(self, key, value):
+        """Store a result (an array, scalar, string or dict, or a tuple of them)"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._entry(f".tmp-{uuid.uuid4().hex}")
+        os.makedirs(tmp)
+        try:
+            if isinstance(value, tuple):
+                for i, item in enumerate(value):
+                    _save_item(os.path.join(tmp, f"item_{i:03d}"), item)
+            else:
+                _save_item(os.path.join(tmp, 'value'), value)
+        except TypeError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        try:
+            os.replace(tmp, self._entry(key))
+        except OSError:
+            # Another process stored the same key first
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.stores += 1
+        self.evict()
+
+    def entries(self):
+        """[(last_used, size_bytes, path)] for every stored entry"""
+        out = []
+        if not os.path.isdir(self.directory):
+            return out
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith('.tmp-') or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                out.append((os.stat(path).st_mtime, size, path))
+            except OSError:
+                continue
+        return out
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        for _, _, path in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def call(self, func, *args, **kwargs):
+        """func(*args, **kwargs), served from the cache when possible"""
+        key = cache_key(func, *args, **kwargs)
+        value = self.get(key)
+        if value is None:
+            value = func(*args, **kwargs)
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        entries = self.entries()
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'stores': self.stores,
+                'evictions': self.evictions,
+                'hit_rate': self.hits/lookups if lookups else 0.0,
+                'entries': len(entries), 'bytes': sum(size for _, size, _ in entries)}
+
+
+def default_cache():
+    """Process-wide cache in <cache dir>/trajectories"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = TrajectoryCache()
+    return _DEFAULT
+
+
+class cached:
+    """
+    Wrap an integrator so its results go through the cache (a class rather
+    than a closure so wrapped functions still pickle for the sweep pool).
+    With BLACKHOLE_DISABLE_CACHE set the wrapper just calls func.
+    """
+
+    def __init__(self, func, cache=None):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.cache = cache
+
+    def __call__(self, *args, **kwargs):
+        if os.environ.get(DISABLE_ENV):
+            return self.func(*args, **kwargs)
+        return (self.cache or default_cache()).call(self.func, *args, **kwargs)
@@ -0,0 +1,250 @@
+"""
+Command-line entry point: python -m blackhole <command> [options]
+
+Commands
+    newton          phase 1 Newtonian ray (RK4, Euler or a symplectic --method)
+    schwarzschild   phase 2 Schwarzschild ray, u(phi) RK4
+    compare         phase 3 Euler vs RK4 from the same initial conditions
+    photon-sphere   analytic b scan, table deflections and critical impact
+                    parameter (--check integrates)
+    kerr            phase 5 Kerr ray for +a and -a
+
+Every command is compute-only by default: it prints a JSON summary (or
+writes it with --json PATH) and saves the arrays with --npz PATH. Nothing
+here imports matplotlib unless --render PATH is given, and the physics
+modules are imported by the command that needs them, so `--help` and
+compute runs start fast.
+"""
+
+import argparse
+import json
+import time
+
+
+# --------------------------------------------------
+# Commands: each returns (summary dict, arrays dict, render function)
+# --------------------------------------------------
+def run_newton(args):
+    import numpy as np
+    from blackhole.newton import compute_trajectory
+
+    x, y, stats = compute_trajectory(args.x0, args.y0, args.vx0, args.vy0, 1.0, args.M,
+                                     args.dt, args.steps, args.r_cutoff, stats=True,
+                                     method=args.method)
+    r = np.hypot(x, y)
+    summary = {'method': args.method, 'points': len(x), 'closest': float(r.min()),
+               'final': [float(x[-1]), float(y[-1])],
+               'energy_drift': stats['constraint_error'],
+               'angular_momentum_drift': stats['angular_momentum_error']}
+    if len(x) > 1:
+        summary['deflection'] = float(np.arctan2(y[-1] - y[-2], x[-1] - x[-2])
+                                      - np.arctan2(args.vy0, args.vx0))
+
+    def render(ax):
+        ax.set_title(f"Newtonian light deflection ({args.method})")
+        return [(x, y, 'Light ray')]
+    return summary, {'x': x, 'y': y}, render
+
+
+def run_schwarzschild(args):
+    import numpy as np
+    from blackhole.analytic import critical_impact_parameter
+    from blackhole.schwarzschild import integrate_rk4, ray_fate
+
+    phi, r = integrate_rk4(args.r0, args.b, args.M, args.dphi, args.max_steps)
+    x, y = r*np.cos(phi), r*np.sin(phi)
+    summary = {'points': len(r), 'closest': float(r.min()),
+               'fate': ray_fate(args.b, args.r0, args.M),
+               'b_crit': float(critical_impact_parameter(args.M))}
+
+    def render(ax):
+        ax.set_title(f"Schwarzschild light bending (RK4), b = {args.b}")
+        return [(x, y, 'Light ray')]
+    return summary, {'phi': phi, 'r': r, 'x': x, 'y': y}, render
+
+
+def run_compare(args):
+    import numpy as np
+    from blackhole.schwarzschild import integrate_euler, integrate_rk4
+
+    x_e, y_e = integrate_euler(args.x0, args.y0, 1.0, 0.0, args.M, args.dt)
+    r0, phi0 = np.hypot(args.x0, args.y0), np.arctan2(args.y0, args.x0)
+    phi, r = integrate_rk4(r0, args.b, args.M, args.dphi)
+    phi = phi - np.pi + phi0
+    x_r, y_r = r*np.cos(phi), r*np.sin(phi)
+
+    summary = {'euler': {'points': len(x_e), 'closest': float(np.hypot(x_e, y_e).min())},
+               'rk4': {'points': len(r), 'closest': float(r.min())}}
+
+    def render(ax):
+        ax.set_title("Euler vs RK4 (same initial conditions)")
+        return [(x_e, y_e, 'Euler'), (x_r, y_r, 'RK4')]
+    return summary, {'x_euler': x_e, 'y_euler': y_e, 'x_rk4': x_r, 'y_rk4': y_r}, render
+
+
+def run_photon_sphere(args):
+    import numpy as np
+    from blackhole.analytic import critical_impact_parameter
+    from blackhole.critical import schwarzschild_critical_impact, schwarzschild_fates
+    from blackhole.lookup import deflection_table
+    from blackhole.schwarzschild import integrate_photon_orbit
+    from blackhole.sweep import sweep
+
+    # Fates, periapses and b_crit come from the turning points and deflections
+    # from the cached table; rays are only integrated with --check or if
+    # they are drawn
+    bs = np.linspace(args.b_min, args.b_max, args.n)
+    fates, closest = schwarzschild_fates(bs, args.M, check=args.check, workers=args.workers)
+    deflection = deflection_table()(bs, args.M)[0]
+    search = schwarzschild_critical_impact(args.b_min, args.b_max, args.M, tol=args.tol,
+                                           check=args.check)
+
+    summary = {'b': bs.tolist(), 'fate': fates.tolist(),
+               'closest': [None if np.isnan(r) else float(r) for r in closest],
+               'deflection': [None if np.isnan(a) else float(a) for a in deflection],
+               'b_crit': search['b_crit'], 'integrations': search['integrations'],
+               'b_crit_theory': float(critical_impact_parameter(args.M))}
+    if args.check:
+        summary['b_crit_integrated'] = search['integrated']['b_crit']
+        summary['integrations'] = search['integrated']['integrations'] + len(bs)
+
+    def render(ax):
+        ax.set_title("Photon sphere scan")
+        runs = sweep(integrate_photon_orbit, bs, workers=args.workers, M=args.M)
+        return [(run[0], run[1], f"b = {b:.2f}") for b, run in zip(bs, runs)]
+    arrays = {'b': bs, 'fate': fates, 'closest': closest, 'deflection': deflection}
+    return summary, arrays, render
+
+
+def run_kerr(args):
+    import numpy as np
+    from blackhole.kerr import critical_impact_parameter, simulate_photon
+
+    summary, arrays, paths = {}, {}, []
+    for name, spin in (('prograde', args.a), ('retrograde', -args.a)):
+        x, y, r, phi, fate = simulate_photon(args.r0, np.pi, args.b, args.M, spin,
+                                             args.dt, args.max_steps)
+        summary[name] = {'a': spin, 'points': len(r), 'fate': fate,
+                         'closest': float(r.min()),
+                         'b_crit': float(critical_impact_parameter(args.M, spin))}
+        arrays.update({f'{name}_x': x, f'{name}_y': y, f'{name}_r': r, f'{name}_phi': phi})
+        paths.append((x, y, f"a = {spin:+g}"))
+
+    def render(ax):
+        ax.set_title(f"Kerr light bending, b = {args.b}")
+        return paths
+    return summary, arrays, render
+
+
+COMMANDS = {
+    'newton': run_newton,
+    'schwarzschild': run_schwarzschild,
+    'compare': run_compare,
+    'photon-sphere': run_photon_sphere,
+    'kerr': run_kerr,
+}
+
+
+# --------------------------------------------------
+# Arguments
+# --------------------------------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m blackhole',
+                                     description="Black hole light bending simulations")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def command(name, help):
+        p = sub.add_parser(name, help=help)
+        p.add_argument('--M', type=float, default=1.0, help="black hole mass")
+        p.add_argument('--json', metavar='PATH', help="write the summary here instead of stdout")
+        p.add_argument('--npz', metavar='PATH', help="save the arrays as .npz")
+        p.add_argument('--render', metavar='PATH', help="also plot the rays (imports matplotlib)")
+        p.add_argument('--dpi', type=int, default=150)
+        return p
+
+    p = command('newton', "Newtonian ray (phase 1)")
+    p.add_argument('--x0', type=float, default=-10.0)
+    p.add_argument('--y0', type=float, default=1.0)
+    p.add_argument('--vx0', type=float, default=1.0)
+    p.add_argument('--vy0', type=float, default=0.0)
+    p.add_argument('--dt', type=float, default=0.01)
+    p.add_argument('--steps', type=int, default=3000)
+    p.add_argument('--r-cutoff', type=float, default=0.5)
+    p.add_argument('--method', default='rk4',
+                   choices=('euler', 'rk4', 'verlet', 'yoshida4', 'forest_ruth', 'pefrl'))
+
+    p = command('schwarzschild', "Schwarzschild ray (phase 2)")
+    p.add_argument('--r0', type=float, default=10.0)
+    p.add_argument('--b', type=float, default=3.0)
+    p.add_argument('--dphi', type=float, default=0.001)
+    p.add_argument('--max-steps', type=int, default=20000)
+
+    p = command('compare', "Euler vs RK4 (phase 3)")
+    p.add_argument('--x0', type=float, default=-10.0)
+    p.add_argument('--y0', type=float, default=1.0)
+    p.add_argument('--b', type=float, default=3.0)
+    p.add_argument('--dt', type=float, default=0.01, help="Euler time step")
+    p.add_argument('--dphi', type=float, default=0.001, help="RK4 angular step")
+
+    p = command('photon-sphere', "critical impact parameter scan")
+    p.add_argument('--b-min', type=float, default=4.0)
+    p.add_argument('--b-max', type=float, default=7.0)
+    p.add_argument('--n', type=int, default=13)
+    p.add_argument('--tol', type=float, default=1e-8, help="bisection tolerance of --check")
+    p.add_argument('--check', action='store_true',
+                   help="also integrate every ray and bisect the integrated fate")
+    p.add_argument('--workers', type=int, default=None)
+
+    p = command('kerr', "Kerr ray, prograde and retrograde (phase 5)")
+    p.add_argument('--a', type=float, default=0.7, help="spin")
+    p.add_argument('--b', type=float, default=4.5)
+    p.add_argument('--r0', type=float, default=15.0)
+    p.add_argument('--dt', type=float, default=0.01)
+    p.add_argument('--max-steps', type=int, default=50000)
+    return parser
+
+
+# --------------------------------------------------
+# Output
+# --------------------------------------------------
+def render_paths(render, path, dpi):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from blackhole.decimate import plot_path
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.scatter(0, 0, color='black', s=80, zorder=5)
+    for x, y, label in render(ax):
+        plot_path(ax, x, y, lw=1.5, label=label)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    if len(ax.lines) <= 10:
+        ax.legend()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    start = time.perf_counter()
+    summary, arrays, render = COMMANDS[args.command](args)
+    summary = {'command': args.command, **summary,
+               'wall_time': time.perf_counter() - start}
+
+    if args.npz:
+        import numpy as np
+        np.savez(args.npz, **arrays)
+        summary['npz'] = args.npz
+    if args.render:
+        render_paths(render, args.render, args.dpi)
+        summary['render'] = args.render
+
+    text = json.dumps(summary, indent=2)
+    if args.json:
+        with open(args.json, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
@@ -0,0 +1,128 @@
+"""
+Per-run configuration objects.
+
+The phase scripts used to keep the physics in module globals (M, dt, steps,
+a, r_plus), so a process could only hold one configuration and importing a
+script re-ran its simulation. A config is a frozen dataclass with every input
+of one run; run(config) integrates it with the matching library solver,
+optionally through the trajectory cache. Configs are hashable and picklable,
+so several of them can live in one process, be swept over a worker pool or
+key a dict of results.
+
+    from blackhole.config import KerrConfig, run
+    prograde = run(KerrConfig(a=0.7))
+    retrograde = run(KerrConfig(a=0.7).flipped())
+"""
+
+import dataclasses
+from dataclasses import dataclass
+
+import numpy as np
+
+from blackhole import kerr, newton, schwarzschild
+from blackhole.cache import cached
+
+
+@dataclass(frozen=True)
+class NewtonConfig:
+    """Phase 1: Newtonian ray in (x, y); method is one of newton.METHODS"""
+    x0: float = -10.0
+    y0: float = 1.0
+    vx0: float = 1.0
+    vy0: float = 0.0
+    G: float = 1.0
+    M: float = 1.0
+    dt: float = 0.01
+    steps: int = 3000
+    r_cutoff: float = 0.5
+    method: str = 'rk4'
+
+    solver = staticmethod(newton.compute_trajectory)
+
+    def arguments(self):
+        """Keyword arguments of the solver call"""
+        return dataclasses.asdict(self)
+
+
+@dataclass(frozen=True)
+class NewtonEulerConfig(NewtonConfig):
+    """Phase 1, v1.0: Newtonian ray, forward Euler"""
+    r_cutoff: float = 1.5
+    method: str = 'euler'
+
+
+@dataclass(frozen=True)
+class EulerConfig:
+    """Phases 2/3: pseudo-Newtonian Schwarzschild ray, forward Euler in (x, y)"""
+    x0: float = -10.0
+    y0: float = 1.0
+    vx0: float = 1.0
+    vy0: float = 0.0
+    M: float = 1.0
+    dt: float = 0.01
+    max_steps: int = 5000
+    r_max: float = 50.0
+    clamp: bool = True
+
+    solver = staticmethod(schwarzschild.integrate_euler)
+
+    def arguments(self):
+        return dataclasses.asdict(self)
+
+
+@dataclass(frozen=True)
+class SchwarzschildConfig:
+    """Phases 2/3: Schwarzschild ray, RK4 on u(phi)"""
+    r0: float = 10.0
+    b: float = 3.0
+    M: float = 1.0
+    dphi: float = 0.001
+    max_steps: int = 20000
+    check_every: int = 0
+    project: bool = False
+    max_drift: float = None
+
+    solver = staticmethod(schwarzschild.integrate_rk4)
+
+    def arguments(self):
+        return dataclasses.asdict(self)
+
+
+@dataclass(frozen=True)
+class KerrConfig:
+    """Phase 5: simplified equatorial Kerr ray, fixed-step RK4"""
+    r0: float = 15.0
+    phi0: float = np.pi
+    b: float = 4.5
+    M: float = 1.0
+    a: float = 0.7
+    dt: float = 0.01
+    max_steps: int = 50000
+    check_every: int = 0
+    project: bool = False
+    max_drift: float = None
+
+    solver = staticmethod(kerr.simulate_photon)
+
+    @property
+    def r_plus(self):
+        """Outer event horizon"""
+        return kerr.horizon_radius(self.M, self.a)
+
+    @property
+    def r_ergo(self):
+        """Equatorial ergosphere radius"""
+        return kerr.ergosphere_radius(self.M, self.a)
+
+    def flipped(self):
+        """The same ray around a hole spinning the other way"""
+        return dataclasses.replace(self, a=-self.a)
+
+    def arguments(self):
+        return dataclasses.asdict(self)
+
+
+def run(config, cache=False):
+    """Integrate one config; with cache the result goes through the trajectory cache"""
+    solver = cached(config.solver) if cache else config.solver
+    return solver(**config.arguments())
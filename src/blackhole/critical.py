@@ -0,0 +1,116 @@
+"""
+Root-finding search for the critical impact parameter.
+
+Capture/escape is a step function of b, so the search brackets the jump and
+bisects it: every integration halves the bracket, and locating b_crit to
+tol costs about log2((b_hi - b_lo)/tol) integrations instead of a dense grid.
+
+Schwarzschild rays need no integration at all: analytic.photon_fate reads
+the fate off the turning points. schwarzschild_critical_impact and
+schwarzschild_fates use it, and run the integrating path only as an
+explicit check.
+"""
+
+import time
+
+import numpy as np
+
+from blackhole.analytic import critical_impact_parameter, photon_fate
+from blackhole.schwarzschild import ray_fate
+from blackhole.sweep import sweep
+
+
+def find_critical_impact(fate, b_lo, b_hi, tol=1e-10, max_iter=200):
+    """
+    Bisect the capture/escape boundary of fate(b) inside [b_lo, b_hi].
+
+    fate(b) is any single-ray classifier returning 'captured' for captured
+    rays (e.g. schwarzschild.ray_fate, kerr.equatorial_fate, or a lambda
+    around simulate_photon). b_lo must be captured and b_hi must not be.
+
+    Returns a dict with 'b_crit', the final 'bracket', 'iterations',
+    'integrations' and 'wall_time' (seconds).
+    """
+    start = time.perf_counter()
+    if fate(b_lo) != 'captured':
+        raise ValueError(f"b_lo = {b_lo} is not captured")
+    if fate(b_hi) == 'captured':
+        raise ValueError(f"b_hi = {b_hi} is captured")
+    integrations = 2
+
+    iterations = 0
+    while b_hi - b_lo > tol and iterations < max_iter:
+        b_mid = 0.5*(b_lo + b_hi)
+        if b_mid in (b_lo, b_hi):
+            break  # bracket at floating-point resolution
+        if fate(b_mid) == 'captured':
+            b_lo = b_mid
+        else:
+            b_hi = b_mid
+        iterations += 1
+        integrations += 1
+
+    return {
+        'b_crit': 0.5*(b_lo + b_hi),
+        'bracket': (b_lo, b_hi),
+        'iterations': iterations,
+        'integrations': integrations,
+        'wall_time': time.perf_counter() - start,
+    }
+
+
+# --------------------------------------------------
+# Schwarzschild: the analytic oracle first, integration as a check
+# --------------------------------------------------
+def schwarzschild_critical_impact(b_lo, b_hi, M=1.0, tol=1e-10, check=False):
+    """
+    find_critical_impact for Schwarzschild rays, without integrating.
+
+    The bracket is validated with photon_fate and b_crit is sqrt(27) M
+    exactly, so 'iterations' and 'integrations' are 0. With check the
+    integrating bisection over schwarzschild.ray_fate runs as well; its
+    result dict is returned under 'integrated'.
+    """
+    start = time.perf_counter()
+    fate_lo, fate_hi = photon_fate([b_lo, b_hi], M)[0]
+    if fate_lo != 'captured':
+        raise ValueError(f"b_lo = {b_lo} is not captured")
+    if fate_hi == 'captured':
+        raise ValueError(f"b_hi = {b_hi} is captured")
+
+    b_crit = float(critical_impact_parameter(M))
+    result = {'b_crit': b_crit, 'bracket': (b_crit, b_crit), 'iterations': 0,
+              'integrations': 0, 'wall_time': time.perf_counter() - start}
+    if check:
+        result['integrated'] = find_critical_impact(lambda b: ray_fate(b, M=M),
+                                                    b_lo, b_hi, tol=tol)
+    return result
+
+
+def _ray_fate(ray, M=1.0):
+    b, r0 = ray
+    return ray_fate(b, r0, M)
+
+
+def schwarzschild_fates(bs, M=1.0, r0=np.inf, check=False, workers=None):
+    """
+    (fate, r_min) of incoming rays from photon_fate, vectorized over bs and r0.
+
+    With check every ray is also integrated (schwarzschild.ray_fate from its
+    r0, or 10 M where r0 is infinite, over the sweep pool) and a
+    RuntimeError lists the b where the two disagree; critical rays may end
+    either way and forbidden starts are not integrated.
+    """
+    fate, r_min = photon_fate(bs, M, r0)
+    if check:
+        bs = np.broadcast_to(np.asarray(bs, dtype=float), fate.shape).ravel()
+        r0 = np.asarray(r0, dtype=float)
+        starts = np.broadcast_to(np.where(np.isfinite(r0), r0, 10.0), fate.shape).ravel()
+        todo = [i for i, exact in enumerate(fate.ravel())
+                if exact not in ('critical', 'forbidden')]
+        integrated = sweep(_ray_fate, [(bs[i], starts[i]) for i in todo], workers, M=M)
+        wrong = [float(bs[i]) for i, found in zip(todo, integrated)
+                 if fate.ravel()[i] != found]
+        if wrong:
+            raise RuntimeError(f"integrated fates disagree with photon_fate at b = {wrong}")
+    return fate, r_min
@@ -0,0 +1,115 @@
+"""
+Trajectory decimation before plotting.
+
+Integrators record tens of thousands of points, most of them on nearly
+straight far-field stretches that render to the same pixels. decimate()
+runs Ramer-Douglas-Peucker with a tolerance given in screen pixels, so a
+point is only dropped if the simplified polyline stays within that distance
+of it on the rendered figure. Curved parts (periapsis, loops around the
+photon sphere) keep their points automatically; on top of that, points
+within DENSE_WITHIN times the path's closest approach to the hole use a
+tolerance DENSE_FACTOR times smaller.
+
+    plot_path(ax, x, y, color='blue')   # instead of ax.plot(x, y, ...)
+"""
+
+import numpy as np
+
+DEFAULT_PX = 0.25
+DENSE_WITHIN = 1.5
+DENSE_FACTOR = 0.1
+
+
+def rdp_mask(x, y, tol, scale=None):
+    """
+    Ramer-Douglas-Peucker keep-mask for the polyline (x, y).
+
+    A point's distance from the chord is divided by scale (per point, default
+    1) before comparing with tol. Iterative, vectorized per chord.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n = len(x)
+    keep = np.zeros(n, dtype=bool)
+    if n <= 2:
+        keep[:] = True
+        return keep
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        px, py = x[i + 1:j] - x[i], y[i + 1:j] - y[i]
+        chord = np.hypot(dx, dy)
+        if chord > 0:
+            dist = np.abs(px*dy - py*dx)/chord
+        else:
+            dist = np.hypot(px, py)
+        if scale is not None:
+            dist = dist/scale[i + 1:j]
+
+        k = int(np.argmax(dist))
+        if dist[k] > tol:
+            k += i + 1
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    return keep
+
+
+def pixel_size(ax, x, y):
+    """Data units per screen pixel on ax (the larger of the two axes)"""
+    bbox = ax.get_window_extent()
+    if ax.get_autoscalex_on():
+        x_span = np.nanmax(x) - np.nanmin(x)
+    else:
+        x_span = abs(np.diff(ax.get_xlim())[0])
+    if ax.get_autoscaley_on():
+        y_span = np.nanmax(y) - np.nanmin(y)
+    else:
+        y_span = abs(np.diff(ax.get_ylim())[0])
+    return max(x_span/max(bbox.width, 1), y_span/max(bbox.height, 1))
+
+
+def decimate_indices(x, y, tol, dense=True, max_points=None):
+    """
+    Indices of the points kept for tolerance tol (data units).
+
+    dense tightens the tolerance near the path's closest approach to the
+    origin (the hole). With max_points the tolerance is doubled until the
+    result fits.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    index = np.flatnonzero(finite)
+
+    scale = None
+    if dense and len(x):
+        r = np.hypot(x, y)
+        scale = np.where(r <= DENSE_WITHIN*r.min(), DENSE_FACTOR, 1.0)
+
+    while True:
+        keep = rdp_mask(x, y, tol, scale)
+        if max_points is None or keep.sum() <= max(max_points, 2) or tol <= 0:
+            return index[keep]
+        tol *= 2
+
+
+def decimate(x, y, tol=None, ax=None, px=DEFAULT_PX, dense=True, max_points=None):
+    """
+    Simplified (x, y) for plotting. The tolerance is tol in data units or,
+    with ax, px screen pixels on that axes.
+    """
+    if tol is None:
+        tol = px*pixel_size(ax, x, y) if ax is not None else 0.0
+    idx = decimate_indices(x, y, tol, dense, max_points)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
+
+def plot_path(ax, x, y, *args, px=DEFAULT_PX, dense=True, max_points=None, **kwargs):
+    """ax.plot of the decimated path; returns the Line2D list like ax.plot"""
+    xd, yd = decimate(x, y, ax=ax, px=px, dense=dense, max_points=max_points)
+    return ax.plot(xd, yd, *args, **kwargs)
@@ -0,0 +1,86 @@
+"""
+Parallel frame rendering and figure export.
+
+Rendering is the slow part of every script: PillowWriter draws GIF frames
+one after another on one core, and 300 dpi PNGs are saved back to back.
+Here the figures are built inside worker processes (through sweep). Animation
+workers return RGBA frames that the parent encodes in order; figure workers
+save their own file with savefig, so PNG metadata such as the DPI is kept.
+Serial export (workers=1) runs exactly the same code in this process, so the
+files are byte-identical whatever the worker count.
+
+Work is described by picklable builders, i.e. module-level functions:
+
+- animations: build() -> PathAnimation. The frame range is split into one
+  contiguous block per worker; a worker replays the cached-background draws
+  of the frames before its block (cheap: no canvas copies) and then renders
+  its own frames.
+- figures: build() -> matplotlib Figure, saved with savefig options.
+"""
+
+import math
+
+from blackhole.animation import save_gif
+from blackhole.sweep import default_workers, sweep
+
+
+# --------------------------------------------------
+# Animations
+# --------------------------------------------------
+def _render_block(block, build, frames, duration, fps):
+    import matplotlib.pyplot as plt
+
+    start, stop = block
+    anim = build()
+    images = list(anim.frames(frames, duration, fps, start=start, stop=stop))
+    plt.close(anim.fig)
+    return images
+
+
+def render_frames(build, frames=None, duration=None, fps=30, workers=None):
+    """All frames of build()'s animation as RGBA arrays, in order"""
+    import matplotlib.pyplot as plt
+
+    probe = build()
+    n_frames = probe.frame_count(frames, duration, fps)
+    plt.close(probe.fig)
+
+    if workers is None:
+        workers = default_workers()
+    n_blocks = max(1, min(workers, n_frames))
+    size = math.ceil(n_frames/n_blocks)
+    blocks = [(lo, min(lo + size, n_frames)) for lo in range(0, n_frames, size)]
+
+    chunks = sweep(_render_block, blocks, workers=workers, min_parallel=2,
+                   build=build, frames=frames, duration=duration, fps=fps)
+    return [image for chunk in chunks for image in chunk]
+
+
+def export_gif(build, path, frames=None, duration=None, fps=30, workers=None):
+    """Render build()'s animation over worker processes and write a GIF"""
+    images = render_frames(build, frames, duration, fps, workers)
+    save_gif(path, images, fps)
+    return len(images)
+
+
+# --------------------------------------------------
+# Figures
+# --------------------------------------------------
+def save_figure(job, dpi=100, **savefig_kw):
+    """Build and save one (build, path) job; returns the path"""
+    import matplotlib.pyplot as plt
+
+    build, path = job
+    fig = build()
+    fig.savefig(path, dpi=dpi, **savefig_kw)
+    plt.close(fig)
+    return path
+
+
+def export_figures(jobs, dpi=100, workers=None, **savefig_kw):
+    """
+    Save [(build, path), ...] over worker processes, each worker writing its
+    own files. Returns the paths written, in order.
+    """
+    return sweep(save_figure, jobs, workers=workers, min_parallel=2, dpi=dpi,
+                 **savefig_kw)
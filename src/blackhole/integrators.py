@@ -0,0 +1,223 @@
+"""
+Generic ODE steppers shared by the Schwarzschild and Kerr solvers.
+
+All right-hand sides have the form f(t, y) -> dy/dt with y a 1-D NumPy array.
+
+integrate_adaptive can watch events: functions g(t, y) whose sign change
+inside an accepted step is root-located on the Dormand-Prince continuous
+extension, so a run stops exactly on an event surface (or reports where it
+crossed one) however long its steps are, at no extra right-hand-side cost.
+"""
+
+import numpy as np
+
+
+# --------------------------------------------------
+# Dormand-Prince 5(4) tableau
+# --------------------------------------------------
+DP_C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+# 5th order weights (same as the last row of A: first-same-as-last)
+DP_B = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+# Difference between the 5th and embedded 4th order weights
+DP_E = np.array([71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# Continuous extension (Shampine): y(t + s h) = y + h K^T DP_P [s, s^2, s^3, s^4]
+DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+
+
+def dopri45_stages(f, t, y, h, k1):
+    """dopri45_step returning all seven slopes: (y_new, err, [k1, ..., k7])"""
+    k = [k1]
+    for i in range(1, 7):
+        dy = sum(a*kj for a, kj in zip(DP_A[i], k) if a != 0.0)
+        k.append(f(t + DP_C[i]*h, y + h*dy))
+    y_new = y + h*sum(b*kj for b, kj in zip(DP_B, k) if b != 0.0)
+    err = h*sum(e*kj for e, kj in zip(DP_E, k) if e != 0.0)
+    return y_new, err, k
+
+
+def dopri45_step(f, t, y, h, k1):
+    """
+    One Dormand-Prince step from (t, y) with slope k1 = f(t, y).
+
+    Returns (y_new, err, k7) where err is the embedded error estimate and
+    k7 = f(t + h, y_new) can be reused as k1 of the next step (FSAL).
+    """
+    y_new, err, k = dopri45_stages(f, t, y, h, k1)
+    return y_new, err, k[6]
+
+
+def dense_output(t, y, h, k):
+    """
+    The 4th order interpolant of the step (t, y) -> t + h with slopes k, as
+    a function of t_star inside the step.
+    """
+    Q = np.array(k).T @ DP_P
+
+    def interp(t_star):
+        s = (t_star - t)/h
+        return y + h*(Q @ np.array([s, s**2, s**3, s**4]))
+    return interp
+
+
+# --------------------------------------------------
+# Events
+# --------------------------------------------------
+def make_event(name, g, direction=0, terminal=True):
+    """
+    Event of integrate_adaptive: a zero of g(t, y) crossed upwards
+    (direction > 0), downwards (< 0) or either way (0). A terminal event
+    ends the run at the crossing.
+    """
+    return {'name': name, 'g': g, 'direction': direction, 'terminal': terminal}
+
+
+def crosses(g0, g1, direction=0):
+    """Whether g goes through zero from g0 to g1 in the given direction"""
+    up = g0 < 0 <= g1
+    down = g0 > 0 >= g1
+    if direction > 0:
+        return up
+    if direction < 0:
+        return down
+    return up or down
+
+
+def locate_event(g, interp, t0, g0, t1, g1, tol=1e-15, iterations=100):
+    """
+    Root of g(t, interp(t)) between t0 and t1, where g has the values g0 and
+    g1 of opposite sign, by the Illinois variant of regula falsi.
+    Returns (t_star, y_star).
+    """
+    if g1 == 0.0:
+        return t1, interp(t1)
+    side = 0
+    t_star = t1
+    for _ in range(iterations):
+        t_prev, t_star = t_star, (t0*g1 - t1*g0)/(g1 - g0)
+        g_star = g(t_star, interp(t_star))
+        if g_star == 0.0 or abs(t_star - t_prev) <= tol*max(1.0, abs(t_star)):
+            break
+        if (g_star > 0) == (g1 > 0):
+            t1, g1 = t_star, g_star
+            if side == -1:
+                g0 /= 2
+            side = -1
+        else:
+            t0, g0 = t_star, g_star
+            if side == 1:
+                g1 /= 2
+            side = 1
+    return t_star, interp(t_star)
+
+
+def error_norm(err, y, y_new, rtol, atol):
+    """RMS of the error scaled by atol + rtol*|y|"""
+    scale = atol + rtol*np.maximum(np.abs(y), np.abs(y_new))
+    return np.sqrt(np.mean((err/scale)**2))
+
+
+# --------------------------------------------------
+# Adaptive integration
+# --------------------------------------------------
+def integrate_adaptive(f, t0, y0, h0=0.01, rtol=1e-8, atol=1e-10,
+                       max_steps=100000, h_max=np.inf, stop=None, events=()):
+    """
+    Adaptive Dormand-Prince 5(4) integration with error control.
+
+    stop(t, y) is checked on every accepted state; the first state for which
+    it returns True ends the integration and is not recorded, matching the
+    fixed-step loops (check, then record).
+
+    events (see make_event) are checked on every accepted step. Each crossing
+    is located on the step's interpolant and appended to stats['events'] as
+    {'name', 't', 'y'}; the first terminal one ends the run with its exact
+    state as the last recorded point, and its name goes to stats['event'].
+
+    Returns (ts, ys, stats) with ys of shape (n, len(y0)) and stats a dict of
+    accepted / rejected steps, right-hand-side evaluations (nfev), the
+    events and the last state reached (t_end, y_end), recorded or not.
+    """
+    t = float(t0)
+    y = np.asarray(y0, dtype=float)
+    h = float(h0)
+    direction = np.sign(h) or 1.0
+    stats = {'accepted': 0, 'rejected': 0, 'nfev': 1, 't_end': t, 'y_end': y,
+             'events': [], 'event': None}
+
+    ts, ys = [], []
+    if stop is not None and stop(t, y):
+        stats['nfev'] = 0
+        return np.array(ts), np.empty((0, len(y))), stats
+    ts.append(t)
+    ys.append(y)
+    g_vals = [event['g'](t, y) for event in events]
+
+    k1 = f(t, y)
+    while stats['accepted'] < max_steps and stats['rejected'] < max_steps:
+        y_new, err, k = dopri45_stages(f, t, y, h, k1)
+        k7 = k[6]
+        stats['nfev'] += 6
+        err_norm = error_norm(err, y, y_new, rtol, atol)
+
+        if not np.isfinite(err_norm):
+            factor = MIN_FACTOR
+        elif err_norm == 0.0:
+            factor = MAX_FACTOR
+        else:
+            factor = min(MAX_FACTOR, max(MIN_FACTOR, SAFETY*err_norm**-0.2))
+
+        if err_norm <= 1.0:
+            stats['accepted'] += 1
+            if events:
+                hits = []
+                for i, event in enumerate(events):
+                    g_new = event['g'](t + h, y_new)
+                    if crosses(g_vals[i], g_new, event['direction']):
+                        hits.append((*locate_event(event['g'], dense_output(t, y, h, k),
+                                                   t, g_vals[i], t + h, g_new), event))
+                    g_vals[i] = g_new
+                for t_event, y_event, event in sorted(hits, key=lambda hit: direction*hit[0]):
+                    stats['events'].append({'name': event['name'], 't': t_event,
+                                            'y': y_event})
+                    if event['terminal']:
+                        stats['event'] = event['name']
+                        t, y = t_event, y_event
+                        ts.append(t)
+                        ys.append(y)
+                        break
+                if stats['event'] is not None:
+                    break
+            t, y, k1 = t + h, y_new, k7
+            if stop is not None and stop(t, y):
+                break
+            ts.append(t)
+            ys.append(y)
+        else:
+            stats['rejected'] += 1
+            factor = min(factor, 1.0)
+
+        h = direction*min(abs(h)*factor, h_max)
+
+    stats['t_end'], stats['y_end'] = t, y
+    return np.array(ts), np.array(ys), stats
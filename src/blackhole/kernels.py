@@ -0,0 +1,333 @@
+"""
+Optional Numba-compiled kernels for the RK4 hot loops.
+
+When Numba is importable the integrators in newton.py, schwarzschild.py and
+kerr.py hand their inner loop to the @njit functions below (compiled once,
+cached on disk next to this file). Without Numba, or with the environment
+variable BLACKHOLE_DISABLE_NUMBA set, they keep using their NumPy code.
+
+The kernels work on plain floats and write into preallocated output arrays,
+so nothing is allocated per step.
+"""
+
+import math
+import os
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator: return the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+USE_NUMBA = HAVE_NUMBA and not os.environ.get('BLACKHOLE_DISABLE_NUMBA')
+
+
+# --------------------------------------------------
+# Newtonian ray (phase 1)
+# --------------------------------------------------
+@njit(cache=True)
+def newton_accel(x, y, G, M):
+    r = math.sqrt(x*x + y*y)
+    r3 = r*r*r
+    return -2*G*M*x/r3, -2*G*M*y/r3
+
+
+@njit(cache=True)
+def newton_trajectory(x, y, vx, vy, G, M, dt, steps, r_cutoff, record_every, xs, ys):
+    """
+    Hand-unrolled RK4 of compute_trajectory; returns (points written, steps
+    taken, final x, y, vx, vy)
+    """
+    n = 0
+    taken = steps
+    for step in range(steps):
+        if math.sqrt(x*x + y*y) < r_cutoff:
+            taken = step
+            break
+
+        ax1, ay1 = newton_accel(x, y, G, M)
+        k1_vx, k1_vy = ax1*dt, ay1*dt
+        k1_x, k1_y = vx*dt, vy*dt
+
+        ax2, ay2 = newton_accel(x + 0.5*k1_x, y + 0.5*k1_y, G, M)
+        k2_vx, k2_vy = ax2*dt, ay2*dt
+        k2_x, k2_y = (vx + 0.5*k1_vx)*dt, (vy + 0.5*k1_vy)*dt
+
+        ax3, ay3 = newton_accel(x + 0.5*k2_x, y + 0.5*k2_y, G, M)
+        k3_vx, k3_vy = ax3*dt, ay3*dt
+        k3_x, k3_y = (vx + 0.5*k2_vx)*dt, (vy + 0.5*k2_vy)*dt
+
+        ax4, ay4 = newton_accel(x + k3_x, y + k3_y, G, M)
+        k4_vx, k4_vy = ax4*dt, ay4*dt
+        k4_x, k4_y = (vx + k3_vx)*dt, (vy + k3_vy)*dt
+
+        vx += (k1_vx + 2*k2_vx + 2*k3_vx + k4_vx)/6
+        vy += (k1_vy + 2*k2_vy + 2*k3_vy + k4_vy)/6
+        x += (k1_x + 2*k2_x + 2*k3_x + k4_x)/6
+        y += (k1_y + 2*k2_y + 2*k3_y + k4_y)/6
+
+        if step % record_every == 0:
+            xs[n] = x
+            ys[n] = y
+            n += 1
+    return n, taken, x, y, vx, vy
+
+
+@njit(cache=True)
+def newton_split(x, y, vx, vy, G, M, dt, steps, r_cutoff, record_every, c, d, xs, ys):
+    """
+    Drift-kick splitting loop of integrate_symplectic: per step, for each i
+    drift x += c[i] dt v then kick v += d[i] dt a(x). The acceleration is
+    reused across a zero drift (first-same-as-last). Returns (points written,
+    steps taken, force evaluations, final x, y, vx, vy).
+    """
+    n = 0
+    taken = steps
+    nfev = 0
+    ax, ay = 0.0, 0.0
+    stale = True
+    for step in range(steps):
+        if math.sqrt(x*x + y*y) < r_cutoff:
+            taken = step
+            break
+        for i in range(len(c)):
+            if c[i] != 0.0:
+                x += c[i]*dt*vx
+                y += c[i]*dt*vy
+                stale = True
+            if d[i] != 0.0:
+                if stale:
+                    ax, ay = newton_accel(x, y, G, M)
+                    nfev += 1
+                    stale = False
+                vx += d[i]*dt*ax
+                vy += d[i]*dt*ay
+
+        if step % record_every == 0:
+            xs[n] = x
+            ys[n] = y
+            n += 1
+    return n, taken, nfev, x, y, vx, vy
+
+
+# --------------------------------------------------
+# Schwarzschild u(phi)
+# --------------------------------------------------
+@njit(cache=True)
+def schwarzschild_rk4_step(u, du, dphi, M):
+    k1 = dphi*(-u + 3*M*u*u)
+    l1 = dphi*du
+    u2, du2 = u + 0.5*l1, du + 0.5*k1
+    k2 = dphi*(-u2 + 3*M*u2*u2)
+    l2 = dphi*du2
+    u3, du3 = u + 0.5*l2, du + 0.5*k2
+    k3 = dphi*(-u3 + 3*M*u3*u3)
+    l3 = dphi*du3
+    u4, du4 = u + l3, du + k3
+    k4 = dphi*(-u4 + 3*M*u4*u4)
+    l4 = dphi*du4
+    return u + (l1 + 2*l2 + 2*l3 + l4)/6, du + (k1 + 2*k2 + 2*k3 + k4)/6
+
+
+@njit(cache=True)
+def schwarzschild_project(u, du, b, M):
+    """One Newton step onto du^2 + u^2 (1 - 2Mu) = 1/b^2 along its gradient"""
+    C = du*du + u*u*(1 - 2*M*u) - 1/(b*b)
+    gu = 2*u - 6*M*u*u
+    gdu = 2*du
+    g2 = gu*gu + gdu*gdu
+    if g2 == 0.0:
+        return u, du
+    return u - C*gu/g2, du - C*gdu/g2
+
+
+@njit(cache=True)
+def schwarzschild_orbit(u, du, phi, dphi, M, max_steps, record_every, phi_out, r_out,
+                        b, check_every, project, max_drift):
+    """
+    Loop of integrate_rk4; returns (points written, steps taken, final u,
+    du, drift checks, projections, largest drift, sum of drifts, aborted)
+    """
+    n = 0
+    taken = max_steps
+    checks, projections = 0, 0
+    drift_max, drift_sum = 0.0, 0.0
+    aborted = False
+    for step in range(max_steps):
+        r = 1/u
+        if r <= 1.51*M or r > 50:
+            taken = step
+            break
+        if step % record_every == 0:
+            phi_out[n] = phi
+            r_out[n] = r
+            n += 1
+        u, du = schwarzschild_rk4_step(u, du, dphi, M)
+        phi += dphi
+
+        if check_every and (step + 1) % check_every == 0:
+            drift = abs(b*b*(du*du + u*u*(1 - 2*M*u)) - 1)
+            checks += 1
+            drift_sum += drift
+            drift_max = max(drift_max, drift)
+            if drift > max_drift:
+                taken = step + 1
+                aborted = True
+                break
+            if project:
+                u, du = schwarzschild_project(u, du, b, M)
+                projections += 1
+    return n, taken, u, du, checks, projections, drift_max, drift_sum, aborted
+
+
+# --------------------------------------------------
+# Kerr (simplified equatorial)
+# --------------------------------------------------
+@njit(cache=True)
+def kerr_rhs(r, phi, p_r, p_phi, M, a):
+    if r < 0.5:
+        return 0.0, 0.0, 0.0, 0.0
+    r2 = r*r
+    Delta = r2 - 2*M*r + a*a
+    if abs(Delta) < 1e-10:
+        Delta = 1e-10
+    dr = p_r
+    dphi = (2*M*a*r)/(Delta*r2)*p_r + p_phi/r2
+    dpr = -(M/r2)*(r2 - a*a)*p_r*p_r/r2 + (r - M)/Delta*p_r*p_r
+    return dr, dphi, dpr, 0.0
+
+
+@njit(cache=True)
+def kerr_rk4_step(r, phi, p_r, p_phi, dt, M, a):
+    a1, b1, c1, d1 = kerr_rhs(r, phi, p_r, p_phi, M, a)
+    a2, b2, c2, d2 = kerr_rhs(r + 0.5*dt*a1, phi + 0.5*dt*b1,
+                              p_r + 0.5*dt*c1, p_phi + 0.5*dt*d1, M, a)
+    a3, b3, c3, d3 = kerr_rhs(r + 0.5*dt*a2, phi + 0.5*dt*b2,
+                              p_r + 0.5*dt*c2, p_phi + 0.5*dt*d2, M, a)
+    a4, b4, c4, d4 = kerr_rhs(r + dt*a3, phi + dt*b3,
+                              p_r + dt*c3, p_phi + dt*d3, M, a)
+    return (r + dt*(a1 + 2*a2 + 2*a3 + a4)/6,
+            phi + dt*(b1 + 2*b2 + 2*b3 + b4)/6,
+            p_r + dt*(c1 + 2*c2 + 2*c3 + c4)/6,
+            p_phi + dt*(d1 + 2*d2 + 2*d3 + d4)/6)
+
+
+@njit(cache=True)
+def kerr_scale(r, M, a):
+    """sqrt(Delta) exp(M/r - M a^2 / 3r^3), so that p_r / kerr_scale is conserved"""
+    Delta = r*r - 2*M*r + a*a
+    if Delta <= 0.0:
+        return math.nan
+    return math.sqrt(Delta)*math.exp(M/r - M*a*a/(3*r*r*r))
+
+
+@njit(cache=True)
+def kerr_photon(r, phi, p_r, p_phi, M, a, dt, max_steps, r_plus, record_every,
+                r_out, phi_out, check_every, project, max_drift):
+    """
+    Loop of simulate_photon. r_out/phi_out[0] must already hold the start
+    point; returns (points written, last r checked, steps taken, final r,
+    phi, p_r, p_phi, drift checks, projections, largest drift, sum of
+    drifts, aborted).
+    """
+    r0 = r
+    I0 = p_r/kerr_scale(r, M, a)
+    r_checked = r
+    n = 1
+    taken = max_steps
+    checks, projections = 0, 0
+    drift_max, drift_sum = 0.0, 0.0
+    aborted = False
+    for step in range(max_steps):
+        r_checked = r
+        if r <= r_plus*1.05 or r > r0*1.5:
+            taken = step
+            break
+        if step % record_every == 0:
+            r_out[n] = r
+            phi_out[n] = phi
+            n += 1
+        r, phi, p_r, p_phi = kerr_rk4_step(r, phi, p_r, p_phi, dt, M, a)
+
+        if check_every and (step + 1) % check_every == 0:
+            scale = kerr_scale(r, M, a)
+            if math.isnan(scale):
+                continue
+            drift = abs(p_r/scale - I0)
+            if I0 != 0.0:
+                drift /= abs(I0)
+            checks += 1
+            drift_sum += drift
+            drift_max = max(drift_max, drift)
+            if drift > max_drift:
+                r_checked = r
+                taken = step + 1
+                aborted = True
+                break
+            if project:
+                p_r = I0*scale
+                projections += 1
+    return (n, r_checked, taken, r, phi, p_r, p_phi,
+            checks, projections, drift_max, drift_sum, aborted)
+
+
+# --------------------------------------------------
+# Kerr, full 3-D (Mino time)
+# --------------------------------------------------
+@njit(cache=True)
+def kerr3d_rhs(u, th, udot, thdot, lam, eta, a, M):
+    s, c = math.sin(th), math.cos(th)
+    C = a*a - a*lam
+    K = eta + (lam - a)*(lam - a)
+    phidot = a*(1 + C*u*u)/(1 - 2*M*u + a*a*u*u) - a + lam/(s*s)
+    uddot = 2*C*u*(1 + C*u*u) - K*(u - 3*M*u*u + 2*a*a*u*u*u)
+    thddot = c*(lam*lam/(s*s*s) - a*a*s)
+    return udot, thdot, phidot, uddot, thddot
+
+
+@njit(cache=True)
+def kerr3d_trace(state, lam, eta, rate, h, a, M, u_stop, max_steps,
+                 fate, theta_out, phi_out, steps_out):
+    """
+    Per-ray loop of kerr3d.trace_rays: RK4 in Mino time, with
+    dtau = h/(rate + |lam| cot^2 theta), until u crosses 0
+    (fate 0, angles interpolated to u = 0), u >= u_stop (fate 1) or
+    max_steps (fate 2)
+    """
+    for i in range(state.shape[1]):
+        u, th, phi, udot, thdot = state[0, i], state[1, i], state[2, i], state[3, i], state[4, i]
+        L, Q = lam[i], eta[i]
+        fate[i] = 2
+        steps_out[i] = max_steps
+        for step in range(max_steps):
+            t = math.tan(th)
+            dt = h/(rate[i] + abs(L)/(t*t))
+            a1, b1, c1, d1, e1 = kerr3d_rhs(u, th, udot, thdot, L, Q, a, M)
+            a2, b2, c2, d2, e2 = kerr3d_rhs(u + 0.5*dt*a1, th + 0.5*dt*b1, udot + 0.5*dt*d1,
+                                            thdot + 0.5*dt*e1, L, Q, a, M)
+            a3, b3, c3, d3, e3 = kerr3d_rhs(u + 0.5*dt*a2, th + 0.5*dt*b2, udot + 0.5*dt*d2,
+                                            thdot + 0.5*dt*e2, L, Q, a, M)
+            a4, b4, c4, d4, e4 = kerr3d_rhs(u + dt*a3, th + dt*b3, udot + dt*d3,
+                                            thdot + dt*e3, L, Q, a, M)
+            u_new = u + dt*(a1 + 2*a2 + 2*a3 + a4)/6
+            th_new = th + dt*(b1 + 2*b2 + 2*b3 + b4)/6
+            phi_new = phi + dt*(c1 + 2*c2 + 2*c3 + c4)/6
+            udot += dt*(d1 + 2*d2 + 2*d3 + d4)/6
+            thdot += dt*(e1 + 2*e2 + 2*e3 + e4)/6
+
+            if u_new <= 0 or u_new >= u_stop:
+                frac = u/(u - u_new) if u_new <= 0 else 1.0
+                th += frac*(th_new - th)
+                phi += frac*(phi_new - phi)
+                fate[i] = 0 if u_new <= 0 else 1
+                steps_out[i] = step + 1
+                break
+            u, th, phi = u_new, th_new, phi_new
+        theta_out[i] = th
+        phi_out[i] = phi
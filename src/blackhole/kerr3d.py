@@ -0,0 +1,258 @@
+"""
+Full Kerr null geodesics in Boyer-Lindquist coordinates, for shadow images
+seen from any inclination.
+
+A photon of energy E = 1 is labelled by its angular momentum lam = L/E and
+Carter constant eta = Q/E^2. In Mino time tau (Sigma dtau = affine dlambda)
+the radial and polar motions separate. With u = 1/r (as in the u(phi)
+Schwarzschild solvers, so nothing grows like r^4 far from the hole):
+
+    (du/dtau)^2  = S(u)      = (1 + (a^2 - a lam) u^2)^2 - K (u^2 - 2M u^3 + a^2 u^4)
+    (dth/dtau)^2 = Theta(th) = eta + a^2 cos^2 th - lam^2 cot^2 th
+    dphi/dtau    = a (1 + (a^2 - a lam) u^2)/(1 - 2M u + a^2 u^2) - a + lam/sin^2 th
+
+with K = eta + (lam - a)^2. u and theta are integrated in second-order form
+u'' = S'(u)/2, theta'' = Theta'(theta)/2 (as equatorial_fate does in
+kerr.py), so turning points need no sign bookkeeping.
+
+The camera is a distant observer at r_obs and inclination i (degrees from
+the spin axis). A pixel maps to Bardeen's screen coordinates (alpha, beta),
+and those give lam = -alpha sin i and eta = beta^2 + (alpha^2 - a^2) cos^2 i.
+Every ray is traced backwards from the camera. It is masked out once it
+reaches the horizon (r <= HORIZON_MARGIN r_plus) or escapes (u crosses 0,
+where theta and phi are interpolated to their values at infinity). Rays
+still going after max_steps are UNFINISHED. The RK4 step is
+dtau = h/(|alpha, beta| + M + |lam| cot^2 theta), set per ray and per step.
+That sweeps about h radians of orbit per step, and the last term shortens
+the step where a ray skims the spin axis and phi whips round.
+
+The pixel grid is split into chunks of CHUNK rays, which run on a process
+pool (blackhole.sweep). Each chunk goes through the Numba kernel when it is
+available, and otherwise advances as one NumPy batch that compacts out
+finished rays.
+"""
+
+import numpy as np
+
+from blackhole import kernels
+from blackhole.kerr import critical_impact_parameter, horizon_radius
+from blackhole.render import checker_sky
+from blackhole.sweep import sweep
+
+ESCAPED, CAPTURED, UNFINISHED = 0, 1, 2
+
+CHUNK = 16384
+HORIZON_MARGIN = 1.01
+POLE_OFFSET = 1e-4  # degrees; the BL azimuth is undefined on the axis itself
+
+
+# --------------------------------------------------
+# Camera
+# --------------------------------------------------
+def screen_coordinates(width, height, fov, r_obs):
+    """
+    Pixel-centre screen coordinates (alpha of each column, beta of each row)
+    for a vertical field of view fov in degrees; row 0 is the top
+    """
+    if not 0 < fov < 180:
+        raise ValueError("fov must be between 0 and 180 degrees")
+    scale = r_obs*2*np.tan(np.radians(fov)/2)/height
+    alpha = (np.arange(width) + 0.5 - width/2)*scale
+    beta = (height/2 - np.arange(height) - 0.5)*scale
+    return alpha, beta
+
+
+def _inclination(inclination):
+    """Inclination in radians, nudged off the poles"""
+    if not 0 <= inclination <= 180:
+        raise ValueError("inclination must be between 0 and 180 degrees")
+    return np.radians(np.clip(inclination, POLE_OFFSET, 180 - POLE_OFFSET))
+
+
+def constants_of_motion(alpha, beta, inclination, a=0.0):
+    """(lam, eta) of the rays at screen coordinates (alpha, beta)"""
+    i = _inclination(inclination)
+    alpha, beta = np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float)
+    return -alpha*np.sin(i), beta**2 + (alpha**2 - a**2)*np.cos(i)**2
+
+
+def critical_curve(a=0.0, inclination=90.0, M=1.0, n=1000):
+    """
+    Shadow edge (alpha, beta) on the screen: the images of the spherical
+    photon orbits (Bardeen 1973), as one closed curve of up to 2n points
+    """
+    i = _inclination(inclination)
+    if a == 0:
+        angle = np.linspace(0, 2*np.pi, 2*n)
+        b = critical_impact_parameter(M)
+        return b*np.cos(angle), b*np.sin(angle)
+
+    # Equatorial prograde and retrograde photon orbits bound the photon region
+    r_pro = 2*M*(1 + np.cos(2/3*np.arccos(-abs(a)/M)))
+    r_retro = 2*M*(1 + np.cos(2/3*np.arccos(abs(a)/M)))
+    r = np.linspace(r_pro, r_retro, n)
+    lam = -(r**2*(r - 3*M) + a**2*(r + M))/(a*(r - M))
+    eta = r**3*(4*a**2*M - r*(r - 3*M)**2)/(a**2*(r - M)**2)
+    beta2 = eta + a**2*np.cos(i)**2 - lam**2/np.tan(i)**2
+    keep = beta2 >= 0
+    alpha, beta = -lam[keep]/np.sin(i), np.sqrt(beta2[keep])
+    return np.r_[alpha, alpha[::-1]], np.r_[beta, -beta[::-1]]
+
+
+# --------------------------------------------------
+# Geodesic equations (Mino time)
+# --------------------------------------------------
+def radial_potential(u, lam, eta, a=0.0, M=1.0):
+    """S(u) = (du/dtau)^2"""
+    C = a**2 - a*lam
+    K = eta + (lam - a)**2
+    return (1 + C*u**2)**2 - K*(u**2 - 2*M*u**3 + a**2*u**4)
+
+
+def geodesic_rhs(u, th, udot, thdot, lam, eta, a=0.0, M=1.0):
+    """d/dtau of (u, theta, phi, du/dtau, dtheta/dtau); works on arrays"""
+    sin, cos = np.sin(th), np.cos(th)
+    C = a**2 - a*lam
+    K = eta + (lam - a)**2
+    phidot = a*(1 + C*u**2)/(1 - 2*M*u + a**2*u**2) - a + lam/sin**2
+    uddot = 2*C*u*(1 + C*u**2) - K*(u - 3*M*u**2 + 2*a**2*u**3)
+    thddot = cos*(lam**2/sin**3 - a**2*sin)
+    return udot, thdot, phidot, uddot, thddot
+
+
+def initial_state(alpha, beta, r_obs, inclination, a=0.0, M=1.0):
+    """
+    (u, theta, phi, du/dtau, dtheta/dtau) at the camera of rays traced back
+    towards the hole, plus their (lam, eta)
+    """
+    alpha, beta = np.broadcast_arrays(np.asarray(alpha, dtype=float),
+                                      np.asarray(beta, dtype=float))
+    lam, eta = constants_of_motion(alpha.ravel(), beta.ravel(), inclination, a)
+    S = radial_potential(1/r_obs, lam, eta, a, M)
+    n = alpha.size
+    state = np.array([np.full(n, 1/r_obs), np.full(n, _inclination(inclination)),
+                      np.zeros(n), np.sqrt(np.maximum(S, 0.0)), -beta.ravel()])
+    return state, lam, eta
+
+
+def sky_direction(theta, phi):
+    """(lon, lat) of BL angles theta, phi that may have run past a pole"""
+    theta = np.mod(theta, 2*np.pi)
+    flipped = theta > np.pi
+    theta = np.where(flipped, 2*np.pi - theta, theta)
+    phi = np.where(flipped, phi + np.pi, phi)
+    return np.mod(phi, 2*np.pi), np.pi/2 - theta
+
+
+# --------------------------------------------------
+# Tracing
+# --------------------------------------------------
+def _trace_numpy(state, lam, eta, rate, h, a, M, u_stop, max_steps):
+    """NumPy batch loop of trace_rays, the same as kernels.kerr3d_trace"""
+    n = state.shape[1]
+    fate = np.full(n, UNFINISHED, dtype=np.int8)
+    steps = np.full(n, max_steps)
+    theta_end, phi_end = state[1].copy(), state[2].copy()
+    ids = np.arange(n)
+
+    for step in range(max_steps):
+        if not len(ids):
+            break
+        dtau = h/(rate + np.abs(lam)/np.tan(state[1])**2)
+        k1 = np.array(geodesic_rhs(state[0], state[1], state[3], state[4], lam, eta, a, M))
+        y = state + 0.5*dtau*k1
+        k2 = np.array(geodesic_rhs(y[0], y[1], y[3], y[4], lam, eta, a, M))
+        y = state + 0.5*dtau*k2
+        k3 = np.array(geodesic_rhs(y[0], y[1], y[3], y[4], lam, eta, a, M))
+        y = state + dtau*k3
+        k4 = np.array(geodesic_rhs(y[0], y[1], y[3], y[4], lam, eta, a, M))
+        new = state + dtau*(k1 + 2*k2 + 2*k3 + k4)/6
+
+        escaped = new[0] <= 0
+        captured = new[0] >= u_stop
+        done = escaped | captured
+        if done.any():
+            # Angles at u = 0 by linear interpolation inside the last step
+            frac = np.where(escaped, state[0]/(state[0] - new[0]), 1.0)[done]
+            end = state[:, done] + frac*(new[:, done] - state[:, done])
+            fate[ids[escaped]] = ESCAPED
+            fate[ids[captured & ~escaped]] = CAPTURED
+            steps[ids[done]] = step + 1
+            theta_end[ids[done]], phi_end[ids[done]] = end[1], end[2]
+            keep = ~done
+            new, lam, eta, rate, ids = new[:, keep], lam[keep], eta[keep], rate[keep], ids[keep]
+        state = new
+
+    theta_end[ids] = state[1]
+    phi_end[ids] = state[2]
+    return fate, theta_end, phi_end, steps
+
+
+def trace_rays(alpha, beta, r_obs=50.0, inclination=60.0, a=0.9, M=1.0, h=0.05,
+               max_steps=5000):
+    """
+    Trace the rays at screen coordinates (alpha, beta) (equal-length 1-D
+    arrays) back from the camera.
+
+    Returns (fate, theta, phi, steps): fate is ESCAPED, CAPTURED or
+    UNFINISHED, and theta, phi are the BL angles at infinity for escaped
+    rays (see sky_direction) and where the ray stopped otherwise.
+    """
+    r_plus = horizon_radius(M, a)
+    if r_obs <= 3*r_plus:
+        raise ValueError("the camera must be well outside the horizon (r_obs > 3 r_plus)")
+    alpha, beta = np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float)
+    state, lam, eta = initial_state(alpha, beta, r_obs, inclination, a, M)
+    rate = np.hypot(alpha, beta).ravel() + M
+    u_stop = 1/(HORIZON_MARGIN*r_plus)
+
+    if kernels.USE_NUMBA:
+        n = state.shape[1]
+        fate = np.empty(n, dtype=np.int8)
+        theta, phi, steps = np.empty(n), np.empty(n), np.empty(n, dtype=np.int64)
+        kernels.kerr3d_trace(state, lam, eta, rate, h, a, M, u_stop, max_steps,
+                             fate, theta, phi, steps)
+        return fate, theta, phi, steps
+    return _trace_numpy(state, lam, eta, rate, h, a, M, u_stop, max_steps)
+
+
+def _trace_chunk(chunk, **kwargs):
+    return trace_rays(*chunk, **kwargs)
+
+
+def trace_camera(width=512, height=512, fov=30.0, r_obs=50.0, inclination=60.0, a=0.9,
+                 M=1.0, h=0.05, max_steps=5000, workers=None, chunk=CHUNK):
+    """
+    Trace every pixel of the camera, chunk rays at a time over workers
+    processes.
+
+    Returns a dict of (height, width) arrays 'fate', 'theta', 'phi', 'steps'
+    (see trace_rays) and the screen coordinates 'alpha' (width,) and 'beta'
+    (height,).
+    """
+    alpha, beta = screen_coordinates(width, height, fov, r_obs)
+    A, B = np.meshgrid(alpha, beta)
+    A, B = A.ravel(), B.ravel()
+    chunks = [(A[i:i + chunk], B[i:i + chunk]) for i in range(0, A.size, chunk)]
+    runs = sweep(_trace_chunk, chunks, workers, r_obs=r_obs, inclination=inclination,
+                 a=a, M=M, h=h, max_steps=max_steps)
+
+    out = {name: np.concatenate([run[k] for run in runs]).reshape(height, width)
+           for k, name in enumerate(('fate', 'theta', 'phi', 'steps'))}
+    out.update(alpha=alpha, beta=beta)
+    return out
+
+
+def render_kerr_shadow(width=512, height=512, fov=30.0, r_obs=50.0, inclination=60.0,
+                       a=0.9, M=1.0, sky=checker_sky, h=0.05, workers=None):
+    """
+    (height, width, 3) float image of the Kerr shadow against the sky:
+    captured and unfinished rays are black, escaped ones look up
+    sky(lon, lat) in the direction they came from.
+    """
+    traced = trace_camera(width, height, fov, r_obs, inclination, a, M, h, workers=workers)
+    image = np.zeros((height, width, 3))
+    lit = traced['fate'] == ESCAPED
+    if lit.any():
+        image[lit] = sky(*sky_direction(traced['theta'][lit], traced['phi'][lit]))
+    return image
@@ -0,0 +1,173 @@
+"""
+Persistent Schwarzschild deflection table.
+
+alpha(b) and r_min(b) for rays from infinity are integrated once with the
+u(phi) RK4 solver (integrate_escape_batch) and stored as a versioned .npz in
+the cache directory. Everything scales with M, so the table is kept in units
+of M and one file serves every mass.
+
+The grid variable is x = ln(b/b_crit - 1): alpha diverges like -x near
+b_crit, so in x it is smooth and nearly linear, and a monotone (PCHIP) cubic
+interpolates it to ~1e-8. Closer to b_crit than the first node the strong
+deflection limit alpha = -ln(b/b_crit - 1) + const is used, and
+r_min - 3M ~ sqrt(b - b_crit), both matched to the first node. Beyond b_max
+the weak-field series takes over.
+"""
+
+import os
+
+import numpy as np
+
+from blackhole.analytic import critical_impact_parameter
+from blackhole.schwarzschild import integrate_escape_batch
+
+FORMAT_VERSION = 1
+CACHE_ENV = 'BLACKHOLE_CACHE_DIR'
+
+_TABLES = {}
+
+
+def default_cache_dir():
+    """$BLACKHOLE_CACHE_DIR, or ~/.cache/blackhole"""
+    return os.environ.get(CACHE_ENV) or os.path.join(
+        os.path.expanduser('~'), '.cache', 'blackhole')
+
+
+# --------------------------------------------------
+# Monotone cubic (PCHIP)
+# --------------------------------------------------
+def pchip_slopes(x, y):
+    """Fritsch-Carlson node derivatives that keep each interval monotone"""
+    h = np.diff(x)
+    delta = np.diff(y)/h
+    d = np.zeros_like(y)
+
+    # Interior: weighted harmonic mean, zero at local extrema
+    w1 = 2*h[1:] + h[:-1]
+    w2 = h[1:] + 2*h[:-1]
+    same = delta[:-1]*delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hm = (w1 + w2)/(w1/delta[:-1] + w2/delta[1:])
+    d[1:-1] = np.where(same, hm, 0.0)
+
+    # Ends: one-sided three-point formula, clipped to stay shape-preserving
+    for end, (h0, h1, d0, d1) in ((0, (h[0], h[1], delta[0], delta[1])),
+                                  (-1, (h[-1], h[-2], delta[-1], delta[-2]))):
+        s = ((2*h0 + h1)*d0 - h0*d1)/(h0 + h1)
+        if np.sign(s) != np.sign(d0):
+            s = 0.0
+        elif np.sign(d0) != np.sign(d1) and abs(s) > 3*abs(d0):
+            s = 3*d0
+        d[end] = s
+    return d
+
+
+def pchip_eval(x, y, d, xq):
+    """Evaluate the Hermite cubic through (x, y) with slopes d at xq"""
+    xq = np.asarray(xq, dtype=float)
+    i = np.clip(np.searchsorted(x, xq) - 1, 0, len(x) - 2)
+    h = x[i + 1] - x[i]
+    t = (xq - x[i])/h
+    t2, t3 = t*t, t*t*t
+    return ((2*t3 - 3*t2 + 1)*y[i] + (t3 - 2*t2 + t)*h*d[i]
+            + (-2*t3 + 3*t2)*y[i + 1] + (t3 - t2)*h*d[i + 1])
+
+
+# --------------------------------------------------
+# Table
+# --------------------------------------------------
+def table_path(dphi, n_points, b_max, eps_min, directory=None):
+    """Cache file name; every parameter that changes the table is in it"""
+    name = (f"deflection_v{FORMAT_VERSION}_dphi{dphi:g}_n{n_points}"
+            f"_bmax{b_max:g}_eps{eps_min:g}.npz")
+    return os.path.join(directory or default_cache_dir(), name)
+
+
+class DeflectionTable:
+    """alpha(b), r_min(b) and fate for M = 1, rescaled on lookup"""
+
+    def __init__(self, x, alpha, r_min, dphi):
+        self.x, self.alpha, self.r_min = x, alpha, r_min
+        self.dphi = dphi
+        self.d_alpha = pchip_slopes(x, alpha)
+        # r_min itself grows like e^x; r_min/b is bounded and smooth
+        self.b = critical_impact_parameter()*(1 + np.exp(x))
+        self.d_rmin = pchip_slopes(x, r_min/self.b)
+
+        # Strong-field constants matched at the first node
+        eps0 = np.exp(x[0])
+        self.alpha_edge = alpha[0] + x[0]
+        self.rmin_edge = (r_min[0] - 3)/np.sqrt(eps0)
+
+    @classmethod
+    def build(cls, dphi=1e-3, n_points=2048, b_max=1e3, eps_min=1e-8):
+        """Integrate one ray per node (b in units of M)"""
+        b_crit = critical_impact_parameter()
+        x = np.linspace(np.log(eps_min), np.log(b_max/b_crit - 1), n_points)
+        phi_inf, u_peri = integrate_escape_batch(b_crit*(1 + np.exp(x)), dphi=dphi)
+        if not np.all(np.isfinite(phi_inf)):
+            raise RuntimeError("deflection table: some rays did not escape; "
+                               "use a smaller dphi or a larger eps_min")
+        return cls(x, phi_inf - np.pi, 1/u_peri, dphi)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if int(data['version']) != FORMAT_VERSION:
+                raise ValueError(f"{path}: table format {int(data['version'])}, "
+                                 f"expected {FORMAT_VERSION}")
+            return cls(data['x'], data['alpha'], data['r_min'], float(data['dphi']))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = path + '.tmp.npz'
+        np.savez(tmp, version=FORMAT_VERSION, x=self.x, alpha=self.alpha,
+                 r_min=self.r_min, dphi=self.dphi)
+        os.replace(tmp, path)
+
+    def __call__(self, b, M=1.0):
+        """
+        Same contract as analytic.deflection: (alpha, r_min, fate) with
+        alpha and r_min NaN for captured rays.
+        """
+        b = np.asarray(b, dtype=float)/M
+        escaped = b > critical_impact_parameter()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.log(b/critical_impact_parameter() - 1)
+            eps = np.exp(x)
+
+            alpha = pchip_eval(self.x, self.alpha, self.d_alpha, x)
+            r_min = b*pchip_eval(self.x, self.r_min/self.b, self.d_rmin, x)
+
+            near = x < self.x[0]
+            alpha = np.where(near, self.alpha_edge - x, alpha)
+            r_min = np.where(near, 3 + self.rmin_edge*np.sqrt(eps), r_min)
+
+            far = x > self.x[-1]
+            alpha = np.where(far, 4/b + 15*np.pi/4/b**2 + 128/3/b**3
+                             + 3465*np.pi/64/b**4, alpha)
+            r_min = np.where(far, b - 1 - 1.5/b - 4/b**2, r_min)
+
+        alpha = np.where(escaped, alpha, np.nan)
+        r_min = np.where(escaped, r_min*M, np.nan)
+        fate = np.where(escaped, 'escaped', 'captured')
+        return alpha, r_min, fate
+
+
+def deflection_table(dphi=1e-3, n_points=2048, b_max=1e3, eps_min=1e-8,
+                     directory=None):
+    """
+    Load the table for these parameters from the cache directory, building
+    and saving it first if needed. Kept in memory after the first call.
+    """
+    path = table_path(dphi, n_points, b_max, eps_min, directory)
+    table = _TABLES.get(path)
+    if table is not None:
+        return table
+    try:
+        table = DeflectionTable.load(path)
+    except (OSError, ValueError, KeyError):
+        table = DeflectionTable.build(dphi, n_points, b_max, eps_min)
+        table.save(path)
+    _TABLES[path] = table
+    return table
@@ -0,0 +1,279 @@
+"""
+Newtonian light bending (phase 1 baseline), natural units G = c = 1.
+
+compute_trajectory runs the hand-unrolled RK4 of phase 1 by default;
+method= selects one of the symplectic splittings instead (see
+integrate_symplectic), which keep the energy error bounded and the angular
+momentum exact to round-off however long the run.
+"""
+
+import time
+
+import numpy as np
+
+from blackhole import kernels
+from blackhole.buffers import TrajectoryBuffer, recorded_points
+from blackhole.stats import CUTOFF, MAX_STEPS, make_stats
+
+
+def acceleration(x, y, G=1.0, M=1.0):
+    """Acceleration Function (Newtonian Gravity)"""
+    r = np.sqrt(x**2 + y**2)
+    ax = -2 * G * M * x / r**3
+    ay = -2 * G * M * y / r**3
+    return ax, ay
+
+
+def invariants(x, y, vx, vy, G=1.0, M=1.0):
+    """Energy per unit mass (potential -2GM/r, as in acceleration) and angular momentum"""
+    return 0.5*(vx**2 + vy**2) - 2*G*M/np.sqrt(x**2 + y**2), x*vy - y*vx
+
+
+def energy_drift(start, end, G=1.0, M=1.0):
+    """Relative energy change between two (x, y, vx, vy) states"""
+    e0 = invariants(*start, G, M)[0]
+    return abs(invariants(*end, G, M)[0] - e0)/abs(e0)
+
+
+def angular_momentum_drift(start, end):
+    """Relative angular momentum change between two (x, y, vx, vy) states"""
+    l0 = invariants(*start)[1]
+    return abs(invariants(*end)[1] - l0)/abs(l0)
+
+
+def _stats(start_state, end_state, steps, nfev, taken, G, M, start):
+    """Stats dict; constraint_error is the energy drift, plus angular_momentum_error"""
+    reason = CUTOFF if taken < steps else MAX_STEPS
+    record = make_stats(taken, nfev, reason, start,
+                        energy_drift(start_state, end_state, G, M))
+    record['angular_momentum_error'] = float(angular_momentum_drift(start_state, end_state))
+    return record
+
+
+def compute_trajectory_euler(x0=-10.0, y0=1.0, vx0=1.0, vy0=0.0, G=1.0, M=1.0,
+                             dt=0.01, steps=3000, r_cutoff=1.5, record_every=1, stats=False):
+    """
+    Forward Euler (the v1.0 integrator); stops once r < r_cutoff. Like the
+    original script, the path holds the points after each step, not (x0, y0).
+    With stats a stats dict (blackhole.stats) is returned as a third item.
+    """
+    start = time.perf_counter() if stats else None
+    x, y, vx, vy = x0, y0, vx0, vy0
+    buf = TrajectoryBuffer(2, recorded_points(steps, record_every))
+    xs, ys = buf.rows
+    n = 0
+    taken = steps
+    for step in range(steps):
+        r = np.sqrt(x**2 + y**2)
+        if r < r_cutoff:
+            taken = step
+            break
+        ax, ay = acceleration(x, y, G, M)
+        vx += ax * dt
+        vy += ay * dt
+        x += vx * dt
+        y += vy * dt
+        if step % record_every == 0:
+            if n == len(xs):
+                xs, ys = buf.grow(n)
+            xs[n], ys[n] = x, y
+            n += 1
+    if stats:
+        return (*buf.trim(n), _stats((x0, y0, vx0, vy0), (x, y, vx, vy), steps, taken,
+                                     taken, G, M, start))
+    return buf.trim(n)
+
+
+def compute_trajectory(x0=-10.0, y0=1.0, vx0=1.0, vy0=0.0, G=1.0, M=1.0,
+                       dt=0.01, steps=3000, r_cutoff=0.5, record_every=1, stats=False,
+                       method='rk4'):
+    """
+    RK4 Integrator; stops early if r < r_cutoff (singularity).
+
+    Only every record_every-th step is stored in the returned path. With
+    stats a stats dict (blackhole.stats) is returned as a third item.
+    method='euler' runs compute_trajectory_euler and the SPLITTINGS names
+    run integrate_symplectic instead.
+    """
+    if method == 'euler':
+        return compute_trajectory_euler(x0, y0, vx0, vy0, G, M, dt, steps, r_cutoff,
+                                        record_every, stats)
+    if method != 'rk4':
+        return integrate_symplectic(x0, y0, vx0, vy0, G, M, dt, steps, r_cutoff,
+                                    method, record_every, stats)
+    start = time.perf_counter() if stats else None
+    n_max = recorded_points(steps, record_every)
+    if kernels.USE_NUMBA:
+        xs, ys = np.empty(n_max), np.empty(n_max)
+        n, taken, *end = kernels.newton_trajectory(x0, y0, vx0, vy0, G, M, dt, steps,
+                                                   r_cutoff, record_every, xs, ys)
+        if stats:
+            return (xs[:n].copy(), ys[:n].copy(),
+                    _stats((x0, y0, vx0, vy0), end, steps, 4*taken, taken, G, M, start))
+        return xs[:n].copy(), ys[:n].copy()
+
+    x, y = x0, y0
+    vx, vy = vx0, vy0
+
+    buf = TrajectoryBuffer(2, n_max)
+    xs, ys = buf.rows
+    n = 0
+    taken = steps
+
+    for step in range(steps):
+        r = np.sqrt(x**2 + y**2)
+
+        # Stop if too close to singularity
+        if r < r_cutoff:
+            taken = step
+            break
+
+        # --- k1 ---
+        ax1, ay1 = acceleration(x, y, G, M)
+        k1_vx = ax1 * dt
+        k1_vy = ay1 * dt
+        k1_x = vx * dt
+        k1_y = vy * dt
+
+        # --- k2 ---
+        ax2, ay2 = acceleration(x + 0.5 * k1_x, y + 0.5 * k1_y, G, M)
+        k2_vx = ax2 * dt
+        k2_vy = ay2 * dt
+        k2_x = (vx + 0.5 * k1_vx) * dt
+        k2_y = (vy + 0.5 * k1_vy) * dt
+
+        # --- k3 ---
+        ax3, ay3 = acceleration(x + 0.5 * k2_x, y + 0.5 * k2_y, G, M)
+        k3_vx = ax3 * dt
+        k3_vy = ay3 * dt
+        k3_x = (vx + 0.5 * k2_vx) * dt
+        k3_y = (vy + 0.5 * k2_vy) * dt
+
+        # --- k4 ---
+        ax4, ay4 = acceleration(x + k3_x, y + k3_y, G, M)
+        k4_vx = ax4 * dt
+        k4_vy = ay4 * dt
+        k4_x = (vx + k3_vx) * dt
+        k4_y = (vy + k3_vy) * dt
+
+        # Update velocity
+        vx += (k1_vx + 2*k2_vx + 2*k3_vx + k4_vx) / 6
+        vy += (k1_vy + 2*k2_vy + 2*k3_vy + k4_vy) / 6
+
+        # Update position
+        x += (k1_x + 2*k2_x + 2*k3_x + k4_x) / 6
+        y += (k1_y + 2*k2_y + 2*k3_y + k4_y) / 6
+
+        if step % record_every == 0:
+            if n == len(xs):
+                xs, ys = buf.grow(n)
+            xs[n] = x
+            ys[n] = y
+            n += 1
+
+    if stats:
+        return (*buf.trim(n), _stats((x0, y0, vx0, vy0), (x, y, vx, vy), steps, 4*taken,
+                                     taken, G, M, start))
+    return buf.trim(n)
+
+
+# --------------------------------------------------
+# Symplectic integrators
+# --------------------------------------------------
+_THETA = 1/(2 - 2**(1/3))
+_W1, _W0 = _THETA, -2**(1/3)*_THETA
+_XI, _LAMBDA, _CHI = 0.1786178958448091, -0.2123418310626054, -0.06626458266981849
+
+# (drift coefficients c, kick coefficients d): each step applies, for every i,
+# x += c[i] dt v and then v += d[i] dt a(x)
+SPLITTINGS = {
+    # Kick-drift-kick leapfrog, 2nd order, 1 force evaluation per step
+    'verlet': ([0.0, 1.0], [0.5, 0.5]),
+    # Yoshida's triple jump of velocity Verlet, 4th order, 3 per step
+    'yoshida4': ([0.0, _W1, _W0, _W1], [_W1/2, (_W0 + _W1)/2, (_W0 + _W1)/2, _W1/2]),
+    # Forest-Ruth, position first, 4th order, 3 per step
+    'forest_ruth': ([_THETA/2, (1 - _THETA)/2, (1 - _THETA)/2, _THETA/2],
+                    [_THETA, 1 - 2*_THETA, _THETA, 0.0]),
+    # Omelyan et al.'s position-extended Forest-Ruth-like scheme: 4th order,
+    # 4 per step, error constant about 100x smaller than Forest-Ruth
+    'pefrl': ([_XI, _CHI, 1 - 2*(_CHI + _XI), _CHI, _XI],
+              [(1 - 2*_LAMBDA)/2, _LAMBDA, _LAMBDA, (1 - 2*_LAMBDA)/2, 0.0]),
+}
+METHODS = ('euler', 'rk4') + tuple(SPLITTINGS)
+
+
+def integrate_symplectic(x0=-10.0, y0=1.0, vx0=1.0, vy0=0.0, G=1.0, M=1.0,
+                         dt=0.01, steps=3000, r_cutoff=0.5, method='verlet',
+                         record_every=1, stats=False):
+    """
+    compute_trajectory with a symplectic splitting from SPLITTINGS.
+
+    Same stopping rule and output as the RK4 version; the acceleration at
+    the end of a step is reused at the start of the next when the scheme
+    begins with a kick. With stats the stats dict also carries
+    'angular_momentum_error'.
+    """
+    if method not in SPLITTINGS:
+        raise ValueError(f"unknown method {method!r}; expected one of {METHODS}")
+    start = time.perf_counter() if stats else None
+    c, d = (np.array(coeffs) for coeffs in SPLITTINGS[method])
+    n_max = recorded_points(steps, record_every)
+
+    if kernels.USE_NUMBA:
+        xs, ys = np.empty(n_max), np.empty(n_max)
+        n, taken, nfev, *end = kernels.newton_split(x0, y0, vx0, vy0, G, M, dt, steps,
+                                                    r_cutoff, record_every, c, d, xs, ys)
+        path = xs[:n].copy(), ys[:n].copy()
+    else:
+        x, y, vx, vy = x0, y0, vx0, vy0
+        buf = TrajectoryBuffer(2, n_max)
+        xs, ys = buf.rows
+        n, taken, nfev = 0, steps, 0
+        stale = True
+        for step in range(steps):
+            if np.sqrt(x**2 + y**2) < r_cutoff:
+                taken = step
+                break
+            for ci, di in zip(c, d):
+                if ci != 0.0:
+                    x += ci*dt*vx
+                    y += ci*dt*vy
+                    stale = True
+                if di != 0.0:
+                    if stale:
+                        ax, ay = acceleration(x, y, G, M)
+                        nfev += 1
+                        stale = False
+                    vx += di*dt*ax
+                    vy += di*dt*ay
+
+            if step % record_every == 0:
+                if n == len(xs):
+                    xs, ys = buf.grow(n)
+                xs[n] = x
+                ys[n] = y
+                n += 1
+        path = buf.trim(n)
+        end = x, y, vx, vy
+
+    if stats:
+        return (*path, _stats((x0, y0, vx0, vy0), end, steps, nfev, taken, G, M, start))
+    return path
+
+
+def conservation_report(methods=METHODS, x0=-10.0, y0=1.0, vx0=1.0, vy0=0.0, G=1.0,
+                        M=1.0, dt=0.01, steps=3000, r_cutoff=0.5):
+    """
+    {method: {'energy_drift', 'angular_momentum_drift', 'steps', 'nfev',
+    'reason', 'wall_time'}}: relative drifts at the end of the same run
+    integrated with each method
+    """
+    report = {}
+    for method in methods:
+        *_, stats = compute_trajectory(x0, y0, vx0, vy0, G, M, dt, steps, r_cutoff,
+                                       stats=True, method=method)
+        report[method] = {'energy_drift': stats['constraint_error'],
+                          'angular_momentum_drift': stats['angular_momentum_error'],
+                          'steps': stats['steps'], 'nfev': stats['nfev'],
+                          'reason': stats['reason'], 'wall_time': stats['wall_time']}
+    return report
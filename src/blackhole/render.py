@@ -0,0 +1,149 @@
+"""
+Schwarzschild shadow / lensed-sky image renderer.
+
+A static pinhole observer at r_obs looks straight at the hole. By spherical
+symmetry a pixel's ray only depends on its angle theta from the optical axis
+(through the impact parameter b = r_obs sin(theta) / sqrt(1 - 2M/r_obs)),
+while its azimuth psi just rotates the orbital plane. So one 1-D table of
+rays is integrated with the u(phi) RK4 step and every pixel is mapped
+through it: a 4K frame costs a few thousand integrations, not 8 million.
+Given a lookup.DeflectionTable (table=deflection_table()) even those are
+skipped: the angle to infinity comes from the stored deflection minus the
+inbound leg between infinity and r_obs, which is an elliptic integral.
+
+Rays inside the critical angle (b < sqrt(27) M) fall into the hole and are
+drawn black; the others are followed back to infinity and look up the
+celestial sphere in the direction they came from.
+"""
+
+import numpy as np
+
+from blackhole.analytic import critical_impact_parameter, swept_angle
+from blackhole.schwarzschild import integrate_escape_batch
+
+ROW_BLOCK = 256
+
+
+# --------------------------------------------------
+# 1-D ray table
+# --------------------------------------------------
+def impact_parameter(theta, r_obs, M=1.0):
+    """Impact parameter of a ray leaving a static observer at angle theta"""
+    return r_obs*np.sin(theta)/np.sqrt(1 - 2*M/r_obs)
+
+
+def critical_angle(r_obs, M=1.0):
+    """Angular radius of the shadow seen from r_obs"""
+    return np.arcsin(critical_impact_parameter(M)*np.sqrt(1 - 2*M/r_obs)/r_obs)
+
+
+def escape_angles(b, r_obs, M=1.0, dphi=0.002, max_steps=100000, table=None):
+    """
+    Total angle swept by rays traced back from r_obs to infinity (NaN if
+    captured). With a DeflectionTable nothing is integrated.
+    """
+    if table is None:
+        return integrate_escape_batch(b, r_obs, M, dphi, max_steps)[0]
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    alpha = table(b, M)[0]
+    with np.errstate(invalid='ignore'):
+        inbound = swept_angle(b, np.inf, M) - swept_angle(b, r_obs, M)
+    return alpha + np.pi - inbound
+
+
+def ray_table(r_obs, theta_max, M=1.0, n_rays=2048, dphi=0.002, table=None):
+    """
+    (theta, phi_inf) for n_rays escaping rays between the shadow edge and
+    theta_max, spaced geometrically towards the edge where phi_inf diverges.
+    """
+    theta_crit = critical_angle(r_obs, M)
+    theta = theta_crit + np.geomspace(1e-9, max(theta_max - theta_crit, 1e-8), n_rays)
+    phi_inf = escape_angles(impact_parameter(theta, r_obs, M), r_obs, M, dphi,
+                            table=table)
+    ok = np.isfinite(phi_inf)
+    return theta[ok], phi_inf[ok]
+
+
+# --------------------------------------------------
+# Sky
+# --------------------------------------------------
+def checker_sky(lon, lat, n_checks=18):
+    """Two-colour checkerboard on the celestial sphere, RGB in [0, 1]"""
+    i = np.floor(lon/(2*np.pi)*2*n_checks).astype(int)
+    j = np.floor((lat + np.pi/2)/np.pi*n_checks).astype(int)
+    light = ((i + j) % 2 == 0)[..., None]
+    return np.where(light, [0.9, 0.75, 0.4], [0.15, 0.2, 0.45])
+
+
+def texture_sky(texture):
+    """Sky function sampling an equirectangular (H, W, 3) image"""
+    texture = np.asarray(texture, dtype=float)
+    h, w = texture.shape[:2]
+
+    def sky(lon, lat):
+        col = np.clip((lon/(2*np.pi)*w).astype(int), 0, w - 1)
+        row = np.clip(((np.pi/2 - lat)/np.pi*h).astype(int), 0, h - 1)
+        return texture[row, col]
+    return sky
+
+
+# --------------------------------------------------
+# Image
+# --------------------------------------------------
+def render_shadow(width=640, height=480, fov=30.0, r_obs=50.0, M=1.0,
+                  sky=checker_sky, n_rays=2048, dphi=0.002, table=None):
+    """
+    Render a (height, width, 3) float image of the hole against the sky.
+
+    fov is the vertical field of view in degrees. The observer sits on the
+    -z axis looking towards +z; sky(lon, lat) gets the direction each
+    pixel's light came from. Pixels are processed ROW_BLOCK rows at a time
+    so the working set stays small at 4K. table (a lookup.DeflectionTable)
+    replaces the n_rays integrations with lookups.
+    """
+    if r_obs <= 3*M:
+        raise ValueError("observer must be outside the photon sphere (r_obs > 3M)")
+    if not 0 < fov < 180:
+        raise ValueError("fov must be between 0 and 180 degrees")
+
+    scale = 2*np.tan(np.radians(fov)/2)/height
+    xs = (np.arange(width) + 0.5 - width/2)*scale
+    ys = (height/2 - np.arange(height) - 0.5)*scale
+
+    theta_max = np.arctan(np.hypot(xs[-1], ys[0]))
+    theta_crit = critical_angle(r_obs, M)
+    if theta_max > theta_crit:
+        table_theta, table_phi = ray_table(r_obs, theta_max, M, n_rays, dphi, table)
+
+    image = np.zeros((height, width, 3))
+    for start in range(0, height, ROW_BLOCK):
+        x, y = np.meshgrid(xs, ys[start:start + ROW_BLOCK])
+        theta = np.arctan(np.hypot(x, y))
+        lit = theta > theta_crit
+        if not lit.any():
+            continue
+
+        theta, psi = theta[lit], np.arctan2(y[lit], x[lit])
+        phi_inf = np.interp(theta, table_theta, table_phi)
+
+        # Asymptotic direction in the plane of the optical axis (-z from the
+        # hole to the observer) and the pixel's azimuth
+        s = np.sin(phi_inf)
+        dx, dy, dz = s*np.cos(psi), s*np.sin(psi), -np.cos(phi_inf)
+        lon = np.mod(np.arctan2(dx, dz), 2*np.pi)
+        lat = np.arcsin(np.clip(dy, -1, 1))
+
+        block = image[start:start + ROW_BLOCK]
+        block[lit] = sky(lon, lat)
+
+    return image
+
+
+def save_image(image, path):
+    """Write an image as .npy (raw floats) or any format matplotlib saves (PNG)"""
+    path = str(path)
+    if path.endswith('.npy'):
+        np.save(path, image)
+    else:
+        import matplotlib.pyplot as plt
+        plt.imsave(path, np.clip(image, 0, 1))
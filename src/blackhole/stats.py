@@ -0,0 +1,104 @@
+"""
+Integrator instrumentation.
+
+With stats=True the single-ray integrators (newton.compute_trajectory,
+schwarzschild.integrate_rk4 / integrate_rk45 / integrate_euler /
+integrate_photon_orbit, kerr.simulate_photon / simulate_photon_rk45) return
+one more item, a stats dict:
+
+    steps             steps taken (accepted steps for the adaptive solvers)
+    nfev              right-hand-side evaluations
+    rejected          rejected steps (0 for fixed-step loops)
+    reason            why the loop stopped, one of REASONS
+    wall_time         seconds spent in the call
+    constraint_error  relative drift of the solver's conserved quantity at
+                      the last state
+    angular_momentum_error
+                      newton only: relative angular momentum drift
+
+integrate_rk4 and simulate_photon can also watch their constraint while
+they run (check_every); their stats then carry drift_stats() as well.
+
+The counters are derived after the loop from the final state (the Numba
+kernels hand it back), so with stats=False nothing extra runs per step.
+summarize() aggregates the records of a sweep, and instrumented_sweep() runs
+a sweep with stats on and returns the results plus that summary.
+"""
+
+import time
+
+import numpy as np
+
+from blackhole.sweep import sweep
+
+HORIZON = 'horizon'              # capture radius reached
+ESCAPE = 'escape'                # escape radius reached
+WINDING = 'winding'              # abs(phi) > 20 pi (photon orbit scan)
+TURNING_POINT = 'turning_point'  # forbidden region hit (photon orbit scan)
+CUTOFF = 'cutoff'                # Newtonian r < r_cutoff
+DRIFT = 'drift'                  # constraint drift above max_drift
+MAX_STEPS = 'max_steps'          # step cap reached
+REASONS = (HORIZON, ESCAPE, WINDING, TURNING_POINT, CUTOFF, DRIFT, MAX_STEPS)
+
+SLOWEST = 5
+
+
+def make_stats(steps, nfev, reason, start, constraint_error=np.nan, rejected=0):
+    """Stats dict of a call that began at time.perf_counter() == start"""
+    return {'steps': int(steps), 'nfev': int(nfev), 'rejected': int(rejected),
+            'reason': reason, 'wall_time': time.perf_counter() - start,
+            'constraint_error': float(constraint_error)}
+
+
+def drift_stats(checks, projections, drift_max, drift_sum):
+    """Constraint monitoring fields: checks made, projections applied, largest
+    and mean drift seen at a check (before projecting)"""
+    return {'drift_checks': int(checks), 'projections': int(projections),
+            'drift_max': float(drift_max),
+            'drift_mean': float(drift_sum/checks) if checks else 0.0}
+
+
+def summarize(records):
+    """
+    Aggregate stats dicts of a sweep.
+
+    Totals of steps, nfev, rejected and wall_time, the count per reason, the
+    largest constraint error, and the indices of the rays that hit the step
+    cap ('capped'), that were stopped by the drift threshold ('aborted') and
+    of the SLOWEST slowest rays. Records with drift_stats add 'drift_max'.
+    """
+    records = list(records)
+    steps = np.array([rec['steps'] for rec in records], dtype=int)
+    wall = np.array([rec['wall_time'] for rec in records])
+    errors = np.array([rec['constraint_error'] for rec in records])
+    reasons = {}
+    for rec in records:
+        reasons[rec['reason']] = reasons.get(rec['reason'], 0) + 1
+
+    summary = {'rays': len(records),
+               'steps': int(steps.sum()),
+               'nfev': sum(rec['nfev'] for rec in records),
+               'rejected': sum(rec['rejected'] for rec in records),
+               'wall_time': float(wall.sum()),
+               'steps_max': int(steps.max()) if len(records) else 0,
+               'steps_mean': float(steps.mean()) if len(records) else 0.0,
+               'reasons': reasons,
+               'capped': [i for i, rec in enumerate(records) if rec['reason'] == MAX_STEPS],
+               'aborted': [i for i, rec in enumerate(records) if rec['reason'] == DRIFT],
+               'slowest': [int(i) for i in np.argsort(-wall, kind='stable')[:SLOWEST]],
+               'max_constraint_error': float(np.nanmax(errors)) if np.isfinite(errors).any()
+                                       else np.nan}
+    drifts = [rec['drift_max'] for rec in records if 'drift_max' in rec]
+    if drifts:
+        summary['drift_max'] = max(drifts)
+    return summary
+
+
+def instrumented_sweep(func, items, workers=None, **kwargs):
+    """
+    sweep(func, items, stats=True, ...) split into ([result without its stats
+    record, ...], summarize(records)).
+    """
+    runs = sweep(func, items, workers, stats=True, **kwargs)
+    results = [run[:-1] for run in runs]
+    return results, summarize(run[-1] for run in runs)
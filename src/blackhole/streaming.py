@@ -0,0 +1,38 @@
+"""
+Helpers for the streaming integrators (stream_rk4, stream_photon_orbit,
+stream_photon).
+
+A stream yields fixed-size chunks while it integrates, each a tuple of NumPy
+arrays laid out like the matching non-streaming function's return value,
+and finally one summary dict (fate, closest approach, points). Nothing is
+kept behind the consumer, so plotting or reducing a very long near-critical
+orbit runs in memory bounded by the chunk size.
+"""
+
+import numpy as np
+
+DEFAULT_CHUNK = 4096
+
+
+def new_chunk(ncols, chunk_size):
+    """Fresh (ncols, chunk_size) block and its row views"""
+    return tuple(np.empty((ncols, chunk_size)))
+
+
+def is_summary(item):
+    """True for the final summary item of a stream"""
+    return isinstance(item, dict)
+
+
+def collect(stream):
+    """Drain a stream into full arrays; returns (arrays, summary)"""
+    chunks, summary = [], None
+    for item in stream:
+        if is_summary(item):
+            summary = item
+        else:
+            chunks.append(item)
+    if not chunks:
+        return (), summary
+    arrays = tuple(np.concatenate(cols) for cols in zip(*chunks))
+    return arrays, summary
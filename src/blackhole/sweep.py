@@ -0,0 +1,55 @@
+"""
+Process-pool executor for parameter sweeps (impact parameters, spins, ...).
+
+Each item is integrated independently, so sweeps scale with the number of
+cores. Results always come back in input order.
+"""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Sweeps smaller than this run serially: pool start-up costs more than it saves
+MIN_PARALLEL_ITEMS = 4
+
+
+def default_workers():
+    """Number of worker processes used when none is given"""
+    return os.cpu_count() or 1
+
+
+def _pool_context():
+    # Fork where the platform has it: workers start with the parent's
+    # imports (Numba kernels, matplotlib) already loaded, where a 'spawn' or
+    # 'forkserver' child re-imports __main__ and everything it imports. The
+    # phase scripts keep their work under __main__ so either way is safe.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def sweep(func, items, workers=None, chunksize=None,
+          min_parallel=MIN_PARALLEL_ITEMS, **kwargs):
+    """
+    Return [func(item, **kwargs) for item in items], spread over processes.
+
+    func must be picklable (a module-level function or a functools.partial
+    of one). workers defaults to the CPU count; chunksize defaults to about
+    four chunks per worker. Sweeps with fewer than min_parallel items, or a
+    single worker, run serially in this process.
+    """
+    items = list(items)
+    call = partial(func, **kwargs) if kwargs else func
+
+    if workers is None:
+        workers = default_workers()
+    workers = max(1, min(workers, len(items)))
+    if workers == 1 or len(items) < min_parallel:
+        return [call(item) for item in items]
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(items) / (4*workers)))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        return list(pool.map(call, items, chunksize=chunksize))
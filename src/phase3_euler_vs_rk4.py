@@ -3,390 +3,320 @@
 # Schwarzschild Light Bending - Side-by-Side Demonstration
 # =======================================================
 
+from functools import partial
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
-import matplotlib.patches as patches
 
-print("=" * 70)
-print("EULER vs RK4 COMPARISON: SCHWARZSCHILD LIGHT BENDING")
-print("=" * 70)
-print()
+from blackhole.animation import PathAnimation
+from blackhole.config import EulerConfig, SchwarzschildConfig, run
+from blackhole.decimate import plot_path
+from blackhole.export import export_figures, export_gif
 
 # -------------------------------
 # Constants and Initial Conditions
 # -------------------------------
 M = 1.0           # Black hole mass
-dt_euler = 0.01   # Euler time step
-dphi_rk4 = 0.001  # RK4 angular step
+ANIMATION_SECONDS = 6
 
 # Same initial conditions for both methods
 x0, y0 = -10.0, 1.0
 vx0, vy0 = 1.0, 0.0
 
-print("Initial Conditions:")
-print(f"  Position: ({x0}, {y0})")
-print(f"  Velocity: ({vx0}, {vy0})")
-print(f"  Black hole mass: {M}")
-print()
+# Euler: dt = 0.01, clamped 1/(1 - 2M/r) factor
+EULER = EulerConfig(x0, y0, vx0, vy0, M, dt=0.01, max_steps=5000)
+# RK4 on u(phi) from the same radius; b = 3 matches the initial conditions
+RK4 = SchwarzschildConfig(r0=np.hypot(x0, y0), b=3.0, M=M, dphi=0.001)
 
-# -------------------------------
-# PART 1: EULER METHOD
-# -------------------------------
-print("=" * 70)
-print("PART 1: EULER METHOD (Naive Approximation)")
-print("=" * 70)
-
-def schwarzschild_accel(x, y, M):
-    """Approximate Schwarzschild acceleration (NOT accurate for GR)"""
-    r = np.sqrt(x**2 + y**2)
-    if r < 2.1*M:  # Very close to horizon
-        return 0, 0
-    factor = (1 - 2*M/r)
-    if factor < 0.01:  # Numerical safety
-        factor = 0.01
-    ax = -2*M*x/(r**3 * factor)
-    ay = -2*M*y/(r**3 * factor)
-    return ax, ay
-
-# Euler integration
-x, y = x0, y0
-vx, vy = vx0, vy0
-x_euler = [x]
-y_euler = [y]
-steps_euler = 0
-max_steps_euler = 5000
-
-for _ in range(max_steps_euler):
-    r = np.sqrt(x**2 + y**2)
-    if r <= 2*M or r > 50:  # Stop at horizon or far away
-        break
-    ax, ay = schwarzschild_accel(x, y, M)
-    vx += ax * dt_euler
-    vy += ay * dt_euler
-    x += vx * dt_euler
-    y += vy * dt_euler
-    x_euler.append(x)
-    y_euler.append(y)
-    steps_euler += 1
-
-x_euler = np.array(x_euler)
-y_euler = np.array(y_euler)
-r_euler = np.sqrt(x_euler**2 + y_euler**2)
-
-print(f"✓ Euler integration complete")
-print(f"  Steps taken: {steps_euler}")
-print(f"  Final position: ({x_euler[-1]:.2f}, {y_euler[-1]:.2f})")
-print(f"  Closest approach: {np.min(r_euler):.3f} Rs")
-print(f"  Note: This is INACCURATE - Euler fails for stiff equations!")
-print()
 
 # -------------------------------
-# PART 2: RK4 METHOD
+# PARTS 1 & 2: EULER AND RK4 RAYS
 # -------------------------------
-print("=" * 70)
-print("PART 2: RK4 METHOD (Accurate General Relativity)")
-print("=" * 70)
-
-def schwarzschild_geodesic(u, du, M=1.0):
-    """TRUE Schwarzschild null geodesic equation"""
-    return -u + 3*M*u**2
-
-def rk4_step(u, du, dphi, M=1.0):
-    """4th order Runge-Kutta integration"""
-    k1 = dphi * schwarzschild_geodesic(u, du, M)
-    l1 = dphi * du
-    
-    k2 = dphi * schwarzschild_geodesic(u + 0.5*l1, du + 0.5*k1, M)
-    l2 = dphi * (du + 0.5*k1)
-    
-    k3 = dphi * schwarzschild_geodesic(u + 0.5*l2, du + 0.5*k2, M)
-    l3 = dphi * (du + 0.5*k2)
-    
-    k4 = dphi * schwarzschild_geodesic(u + l3, du + k3, M)
-    l4 = dphi * (du + k3)
-    
-    du_new = du + (k1 + 2*k2 + 2*k3 + k4)/6
-    u_new = u + (l1 + 2*l2 + 2*l3 + l4)/6
-    
-    return u_new, du_new
-
-# RK4 integration with same initial conditions
-r0 = np.sqrt(x0**2 + y0**2)
-phi0 = np.arctan2(y0, x0)
-b = 3.0  # Impact parameter adjusted to match initial conditions
-
-u0 = 1.0/r0
-du0 = np.sqrt(1.0/b**2 - u0**2*(1 - 2*M/r0))
-
-phi_vals = []
-r_vals = []
-u, du, phi = u0, du0, phi0
-steps_rk4 = 0
-max_steps_rk4 = 20000
-
-for _ in range(max_steps_rk4):
-    r = 1/u
-    if r <= 1.51*M or r > 50:
-        break
-    phi_vals.append(phi)
-    r_vals.append(r)
-    u, du = rk4_step(u, du, dphi_rk4, M)
-    phi += dphi_rk4
-    steps_rk4 += 1
-
-phi_vals = np.array(phi_vals)
-r_vals = np.array(r_vals)
-x_rk4 = r_vals * np.cos(phi_vals)
-y_rk4 = r_vals * np.sin(phi_vals)
-
-print(f"✓ RK4 integration complete")
-print(f"  Steps taken: {steps_rk4}")
-print(f"  Final position: ({x_rk4[-1]:.2f}, {y_rk4[-1]:.2f})")
-print(f"  Closest approach: {np.min(r_vals):.3f} Rs")
-print(f"  This is ACCURATE - RK4 handles the geodesic equation correctly!")
-print()
+def rk4_trajectory(config=RK4):
+    """RK4 ray rotated to start at the Euler starting point; returns x, y, r"""
+    # integrate_rk4 starts at phi = pi; shift to phi0. Both runs are cached
+    # on disk, so re-running to tweak plots skips them.
+    phi_vals, r_vals = run(config, cache=True)
+    phi0 = np.arctan2(y0, x0)
+    phi_vals = phi_vals - np.pi + phi0
+    return r_vals * np.cos(phi_vals), r_vals * np.sin(phi_vals), r_vals
+
 
 # -------------------------------
 # PART 3: SIDE-BY-SIDE COMPARISON PLOTS
 # -------------------------------
-print("=" * 70)
-print("PART 3: CREATING COMPARISON VISUALIZATIONS")
-print("=" * 70)
+# The builders run in export worker processes, so they are module-level and
+# get the trajectories as arguments (bound with functools.partial)
 
 # Plot 1: Side-by-side individual plots
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
-
-# Euler plot
-ax1.plot(x_euler, y_euler, color='red', linewidth=2, label='Euler Trajectory (WRONG)', alpha=0.8)
-ax1.scatter(0, 0, color='black', s=150, label='Black Hole', zorder=5)
-circle1 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
-                     linestyle='--', linewidth=2, label='Photon Sphere (1.5 Rs)')
-ax1.add_patch(circle1)
-horizon1 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
-                      linestyle=':', linewidth=1.5, alpha=0.7, label='Event Horizon (2 Rs)')
-ax1.add_patch(horizon1)
-ax1.set_xlim(-12, 12)
-ax1.set_ylim(-8, 8)
-ax1.set_aspect('equal')
-ax1.set_xlabel('x (Schwarzschild radii)', fontsize=12)
-ax1.set_ylabel('y (Schwarzschild radii)', fontsize=12)
-ax1.set_title('EULER METHOD (Unstable & Inaccurate)', fontsize=14, fontweight='bold', color='red')
-ax1.legend(fontsize=9, loc='upper right')
-ax1.grid(True, alpha=0.3)
-
-# RK4 plot
-ax2.plot(x_rk4, y_rk4, color='blue', linewidth=2, label='RK4 Trajectory (CORRECT)', alpha=0.8)
-ax2.scatter(0, 0, color='black', s=150, label='Black Hole', zorder=5)
-circle2 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
-                     linestyle='--', linewidth=2, label='Photon Sphere (1.5 Rs)')
-ax2.add_patch(circle2)
-horizon2 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
-                      linestyle=':', linewidth=1.5, alpha=0.7, label='Event Horizon (2 Rs)')
-ax2.add_patch(horizon2)
-ax2.set_xlim(-12, 12)
-ax2.set_ylim(-8, 8)
-ax2.set_aspect('equal')
-ax2.set_xlabel('x (Schwarzschild radii)', fontsize=12)
-ax2.set_ylabel('y (Schwarzschild radii)', fontsize=12)
-ax2.set_title('RK4 METHOD (Stable & Accurate GR)', fontsize=14, fontweight='bold', color='blue')
-ax2.legend(fontsize=9, loc='upper right')
-ax2.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('data/comparison_side_by_side.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("✓ Side-by-side comparison saved: comparison_side_by_side.png")
+def build_side_by_side(x_euler, y_euler, x_rk4, y_rk4):
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+
+    # Euler plot
+    plot_path(ax1, x_euler, y_euler, color='red', linewidth=2, label='Euler Trajectory (WRONG)', alpha=0.8)
+    ax1.scatter(0, 0, color='black', s=150, label='Black Hole', zorder=5)
+    circle1 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
+                         linestyle='--', linewidth=2, label='Photon Sphere (1.5 Rs)')
+    ax1.add_patch(circle1)
+    horizon1 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
+                          linestyle=':', linewidth=1.5, alpha=0.7, label='Event Horizon (2 Rs)')
+    ax1.add_patch(horizon1)
+    ax1.set_xlim(-12, 12)
+    ax1.set_ylim(-8, 8)
+    ax1.set_aspect('equal')
+    ax1.set_xlabel('x (Schwarzschild radii)', fontsize=12)
+    ax1.set_ylabel('y (Schwarzschild radii)', fontsize=12)
+    ax1.set_title('EULER METHOD (Unstable & Inaccurate)', fontsize=14, fontweight='bold', color='red')
+    ax1.legend(fontsize=9, loc='upper right')
+    ax1.grid(True, alpha=0.3)
+
+    # RK4 plot
+    plot_path(ax2, x_rk4, y_rk4, color='blue', linewidth=2, label='RK4 Trajectory (CORRECT)', alpha=0.8)
+    ax2.scatter(0, 0, color='black', s=150, label='Black Hole', zorder=5)
+    circle2 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
+                         linestyle='--', linewidth=2, label='Photon Sphere (1.5 Rs)')
+    ax2.add_patch(circle2)
+    horizon2 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
+                          linestyle=':', linewidth=1.5, alpha=0.7, label='Event Horizon (2 Rs)')
+    ax2.add_patch(horizon2)
+    ax2.set_xlim(-12, 12)
+    ax2.set_ylim(-8, 8)
+    ax2.set_aspect('equal')
+    ax2.set_xlabel('x (Schwarzschild radii)', fontsize=12)
+    ax2.set_ylabel('y (Schwarzschild radii)', fontsize=12)
+    ax2.set_title('RK4 METHOD (Stable & Accurate GR)', fontsize=14, fontweight='bold', color='blue')
+    ax2.legend(fontsize=9, loc='upper right')
+    ax2.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
 
 # Plot 2: Overlay comparison
-fig, ax = plt.subplots(figsize=(10, 10))
-
-ax.plot(x_euler, y_euler, color='red', linewidth=2.5, label='Euler (WRONG)', 
-        alpha=0.7, linestyle='-')
-ax.plot(x_rk4, y_rk4, color='blue', linewidth=2.5, label='RK4 (CORRECT)', 
-        alpha=0.7, linestyle='-')
-
-# Mark starting point
-ax.scatter(x0, y0, color='green', s=200, marker='*', 
-           label='Starting Point', zorder=6, edgecolors='black', linewidth=1)
-
-# Black hole
-ax.scatter(0, 0, color='black', s=200, label='Black Hole', zorder=5)
-
-# Photon sphere
-circle = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
-                    linestyle='--', linewidth=2.5, label='Photon Sphere (1.5 Rs)')
-ax.add_patch(circle)
-
-# Event horizon
-horizon = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
-                     linestyle=':', linewidth=2, alpha=0.7, label='Event Horizon (2 Rs)')
-ax.add_patch(horizon)
-
-# Divergence region annotation
-min_len = min(len(x_euler), len(x_rk4))
-mid_idx = min_len // 2
-ax.annotate('Divergence begins here', 
-            xy=(x_euler[mid_idx], y_euler[mid_idx]), 
-            xytext=(x_euler[mid_idx]-3, y_euler[mid_idx]+2),
-            arrowprops=dict(arrowstyle='->', color='red', lw=2),
-            fontsize=11, color='red', fontweight='bold')
-
-ax.set_xlim(-12, 12)
-ax.set_ylim(-8, 8)
-ax.set_aspect('equal')
-ax.set_xlabel('x (Schwarzschild radii)', fontsize=13)
-ax.set_ylabel('y (Schwarzschild radii)', fontsize=13)
-ax.set_title('EULER vs RK4: Direct Comparison\n(Same Initial Conditions)', 
-             fontsize=15, fontweight='bold')
-ax.legend(fontsize=11, loc='upper right')
-ax.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('data/comparison_overlay.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("✓ Overlay comparison saved: comparison_overlay.png")
+def build_overlay(x_euler, y_euler, x_rk4, y_rk4):
+    fig, ax = plt.subplots(figsize=(10, 10))
+
+    plot_path(ax, x_euler, y_euler, color='red', linewidth=2.5, label='Euler (WRONG)', 
+            alpha=0.7, linestyle='-')
+    plot_path(ax, x_rk4, y_rk4, color='blue', linewidth=2.5, label='RK4 (CORRECT)', 
+            alpha=0.7, linestyle='-')
+
+    # Mark starting point
+    ax.scatter(x0, y0, color='green', s=200, marker='*', 
+               label='Starting Point', zorder=6, edgecolors='black', linewidth=1)
+
+    # Black hole
+    ax.scatter(0, 0, color='black', s=200, label='Black Hole', zorder=5)
+
+    # Photon sphere
+    circle = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
+                        linestyle='--', linewidth=2.5, label='Photon Sphere (1.5 Rs)')
+    ax.add_patch(circle)
+
+    # Event horizon
+    horizon = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
+                         linestyle=':', linewidth=2, alpha=0.7, label='Event Horizon (2 Rs)')
+    ax.add_patch(horizon)
+
+    # Divergence region annotation
+    min_len = min(len(x_euler), len(x_rk4))
+    mid_idx = min_len // 2
+    ax.annotate('Divergence begins here', 
+                xy=(x_euler[mid_idx], y_euler[mid_idx]), 
+                xytext=(x_euler[mid_idx]-3, y_euler[mid_idx]+2),
+                arrowprops=dict(arrowstyle='->', color='red', lw=2),
+                fontsize=11, color='red', fontweight='bold')
+
+    ax.set_xlim(-12, 12)
+    ax.set_ylim(-8, 8)
+    ax.set_aspect('equal')
+    ax.set_xlabel('x (Schwarzschild radii)', fontsize=13)
+    ax.set_ylabel('y (Schwarzschild radii)', fontsize=13)
+    ax.set_title('EULER vs RK4: Direct Comparison\n(Same Initial Conditions)', 
+                 fontsize=15, fontweight='bold')
+    ax.legend(fontsize=11, loc='upper right')
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
 
 # Plot 3: Distance from black hole over time
-fig, ax = plt.subplots(figsize=(12, 6))
-
-steps_euler_plot = np.arange(len(r_euler))
-steps_rk4_plot = np.arange(len(r_vals))
-
-ax.plot(steps_euler_plot, r_euler, color='red', linewidth=2, 
-        label='Euler Method', alpha=0.8)
-ax.plot(steps_rk4_plot, r_vals, color='blue', linewidth=2, 
-        label='RK4 Method', alpha=0.8)
-
-# Mark photon sphere and event horizon
-ax.axhline(y=1.5, color='orange', linestyle='--', linewidth=2, 
-           label='Photon Sphere (1.5 Rs)', alpha=0.7)
-ax.axhline(y=2.0, color='gray', linestyle=':', linewidth=2, 
-           label='Event Horizon (2 Rs)', alpha=0.7)
-
-ax.set_xlabel('Integration Step', fontsize=12)
-ax.set_ylabel('Distance from Black Hole (Rs)', fontsize=12)
-ax.set_title('Radial Distance vs Integration Steps\n(Shows RK4 Stability vs Euler Instability)', 
-             fontsize=14, fontweight='bold')
-ax.legend(fontsize=11, loc='upper right')
-ax.grid(True, alpha=0.3)
-ax.set_ylim(0, 12)
-
-plt.tight_layout()
-plt.savefig('data/comparison_distance.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("✓ Distance comparison saved: comparison_distance.png")
+def build_distance(x_euler, y_euler, x_rk4, y_rk4):
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    r_euler = np.sqrt(x_euler**2 + y_euler**2)
+    r_vals = np.sqrt(x_rk4**2 + y_rk4**2)
+
+    steps_euler_plot = np.arange(len(r_euler))
+    steps_rk4_plot = np.arange(len(r_vals))
+
+    plot_path(ax, steps_euler_plot, r_euler, dense=False, color='red', linewidth=2, 
+            label='Euler Method', alpha=0.8)
+    plot_path(ax, steps_rk4_plot, r_vals, dense=False, color='blue', linewidth=2, 
+            label='RK4 Method', alpha=0.8)
+
+    # Mark photon sphere and event horizon
+    ax.axhline(y=1.5, color='orange', linestyle='--', linewidth=2, 
+               label='Photon Sphere (1.5 Rs)', alpha=0.7)
+    ax.axhline(y=2.0, color='gray', linestyle=':', linewidth=2, 
+               label='Event Horizon (2 Rs)', alpha=0.7)
+
+    ax.set_xlabel('Integration Step', fontsize=12)
+    ax.set_ylabel('Distance from Black Hole (Rs)', fontsize=12)
+    ax.set_title('Radial Distance vs Integration Steps\n(Shows RK4 Stability vs Euler Instability)', 
+                 fontsize=14, fontweight='bold')
+    ax.legend(fontsize=11, loc='upper right')
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, 12)
+    plt.tight_layout()
+    return fig
+
 
 # -------------------------------
 # PART 4: ANIMATED COMPARISON
 # -------------------------------
-print()
-print("=" * 70)
-print("PART 4: CREATING ANIMATED COMPARISON")
-print("=" * 70)
-
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
-
-# Setup Euler subplot
-ax1.set_xlim(-12, 12)
-ax1.set_ylim(-8, 8)
-ax1.set_aspect('equal')
-ax1.set_xlabel('x (Schwarzschild radii)', fontsize=11)
-ax1.set_ylabel('y (Schwarzschild radii)', fontsize=11)
-ax1.set_title('EULER METHOD\n(Unstable)', fontsize=13, fontweight='bold', color='red')
-ax1.scatter(0, 0, color='black', s=120, zorder=5)
-ax1.grid(True, alpha=0.3)
-
-circle1 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
-                     linestyle='--', linewidth=2)
-ax1.add_patch(circle1)
-horizon1 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
-                      linestyle=':', linewidth=1.5, alpha=0.7)
-ax1.add_patch(horizon1)
-
-line1, = ax1.plot([], [], lw=2, color='red', alpha=0.8)
-point1, = ax1.plot([], [], 'ro', markersize=10)
-
-# Setup RK4 subplot
-ax2.set_xlim(-12, 12)
-ax2.set_ylim(-8, 8)
-ax2.set_aspect('equal')
-ax2.set_xlabel('x (Schwarzschild radii)', fontsize=11)
-ax2.set_ylabel('y (Schwarzschild radii)', fontsize=11)
-ax2.set_title('RK4 METHOD\n(Stable & Accurate)', fontsize=13, fontweight='bold', color='blue')
-ax2.scatter(0, 0, color='black', s=120, zorder=5)
-ax2.grid(True, alpha=0.3)
-
-circle2 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
-                     linestyle='--', linewidth=2)
-ax2.add_patch(circle2)
-horizon2 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
-                      linestyle=':', linewidth=1.5, alpha=0.7)
-ax2.add_patch(horizon2)
-
-line2, = ax2.plot([], [], lw=2, color='blue', alpha=0.8)
-point2, = ax2.plot([], [], 'bo', markersize=10)
-
-plt.tight_layout()
-
-# Animation update function
-def update(frame):
-    # Calculate indices for both trajectories
-    idx_euler = min(frame * 5, len(x_euler) - 1)
-    idx_rk4 = min(frame * 20, len(x_rk4) - 1)
-    
-    if idx_euler > 0:
-        line1.set_data(x_euler[:idx_euler], y_euler[:idx_euler])
-        point1.set_data([x_euler[idx_euler-1]], [y_euler[idx_euler-1]])
-    
-    if idx_rk4 > 0:
-        line2.set_data(x_rk4[:idx_rk4], y_rk4[:idx_rk4])
-        point2.set_data([x_rk4[idx_rk4-1]], [y_rk4[idx_rk4-1]])
-    
-    return line1, point1, line2, point2
-
-# Create animation
-max_frames = max(len(x_euler) // 5, len(x_rk4) // 20)
-ani = FuncAnimation(fig, update, frames=max_frames, interval=30, blit=True)
-
-print("  Rendering animation (this may take a minute)...")
-ani.save('data/comparison_animation.gif', writer=PillowWriter(fps=30))
-plt.close()
-print("✓ Animated comparison saved: comparison_animation.gif")
+def build_comparison_animation(x_euler, y_euler, x_rk4, y_rk4):
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+
+    # Setup Euler subplot
+    ax1.set_xlim(-12, 12)
+    ax1.set_ylim(-8, 8)
+    ax1.set_aspect('equal')
+    ax1.set_xlabel('x (Schwarzschild radii)', fontsize=11)
+    ax1.set_ylabel('y (Schwarzschild radii)', fontsize=11)
+    ax1.set_title('EULER METHOD\n(Unstable)', fontsize=13, fontweight='bold', color='red')
+    ax1.scatter(0, 0, color='black', s=120, zorder=5)
+    ax1.grid(True, alpha=0.3)
+
+    circle1 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
+                         linestyle='--', linewidth=2)
+    ax1.add_patch(circle1)
+    horizon1 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
+                          linestyle=':', linewidth=1.5, alpha=0.7)
+    ax1.add_patch(horizon1)
+
+    # Setup RK4 subplot
+    ax2.set_xlim(-12, 12)
+    ax2.set_ylim(-8, 8)
+    ax2.set_aspect('equal')
+    ax2.set_xlabel('x (Schwarzschild radii)', fontsize=11)
+    ax2.set_ylabel('y (Schwarzschild radii)', fontsize=11)
+    ax2.set_title('RK4 METHOD\n(Stable & Accurate)', fontsize=13, fontweight='bold', color='blue')
+    ax2.scatter(0, 0, color='black', s=120, zorder=5)
+    ax2.grid(True, alpha=0.3)
+
+    circle2 = plt.Circle((0,0), 1.5*M, color='orange', fill=False, 
+                         linestyle='--', linewidth=2)
+    ax2.add_patch(circle2)
+    horizon2 = plt.Circle((0,0), 2.0*M, color='gray', fill=False, 
+                          linestyle=':', linewidth=1.5, alpha=0.7)
+    ax2.add_patch(horizon2)
+
+    plt.tight_layout()
+
+    anim = PathAnimation(fig)
+    anim.add_path(ax1, x_euler, y_euler, marker='ro', markersize=10, lw=2, color='red', alpha=0.8)
+    anim.add_path(ax2, x_rk4, y_rk4, marker='bo', markersize=10, lw=2, color='blue', alpha=0.8)
+    return anim
+
 
 # -------------------------------
 # SUMMARY
 # -------------------------------
-print()
-print("=" * 70)
-print("SUMMARY: EULER vs RK4 COMPARISON")
-print("=" * 70)
-print()
-print("NUMERICAL METHODS COMPARED:")
-print("┌─────────────┬──────────────┬─────────────────────────────────┐")
-print("│ Method      │ Result       │ Explanation                     │")
-print("├─────────────┼──────────────┼─────────────────────────────────┤")
-print("│ Euler       │ ✗ FAILS      │ • Unstable for stiff equations  │")
-print("│             │              │ • Accumulates large errors      │")
-print("│             │              │ • Wrong trajectory near BH      │")
-print("├─────────────┼──────────────┼─────────────────────────────────┤")
-print("│ RK4         │ ✓ WORKS      │ • Stable & accurate             │")
-print("│             │              │ • 4th order error control       │")
-print("│             │              │ • Correct GR geodesic solution  │")
-print("└─────────────┴──────────────┴─────────────────────────────────┘")
-print()
-print("KEY PHYSICS:")
-print("  • Photon Sphere at r = 1.5 Rs (unstable circular orbit)")
-print("  • Event Horizon at r = 2.0 Rs (point of no return)")
-print("  • Light bends MORE in GR than in Newtonian gravity")
-print("  • The 3Mu² term in geodesic equation is pure GR effect")
-print()
-print("OUTPUTS GENERATED:")
-print("  1. comparison_side_by_side.png   - Individual trajectories")
-print("  2. comparison_overlay.png        - Direct overlay comparison")
-print("  3. comparison_distance.png       - Radial distance over time")
-print("  4. comparison_animation.gif      - Dynamic side-by-side animation")
-print()
-print("=" * 70)
-print("COMPARISON DEMONSTRATION COMPLETE!")
-print("=" * 70)
+def print_summary():
+    print("=" * 70)
+    print("SUMMARY: EULER vs RK4 COMPARISON")
+    print("=" * 70)
+    print()
+    print("NUMERICAL METHODS COMPARED:")
+    print("┌─────────────┬──────────────┬─────────────────────────────────┐")
+    print("│ Method      │ Result       │ Explanation                     │")
+    print("├─────────────┼──────────────┼─────────────────────────────────┤")
+    print("│ Euler       │ ✗ FAILS      │ • Unstable for stiff equations  │")
+    print("│             │              │ • Accumulates large errors      │")
+    print("│             │              │ • Wrong trajectory near BH      │")
+    print("├─────────────┼──────────────┼─────────────────────────────────┤")
+    print("│ RK4         │ ✓ WORKS      │ • Stable & accurate             │")
+    print("│             │              │ • 4th order error control       │")
+    print("│             │              │ • Correct GR geodesic solution  │")
+    print("└─────────────┴──────────────┴─────────────────────────────────┘")
+    print()
+    print("KEY PHYSICS:")
+    print("  • Photon Sphere at r = 1.5 Rs (unstable circular orbit)")
+    print("  • Event Horizon at r = 2.0 Rs (point of no return)")
+    print("  • Light bends MORE in GR than in Newtonian gravity")
+    print("  • The 3Mu² term in geodesic equation is pure GR effect")
+    print()
+    print("OUTPUTS GENERATED:")
+    print("  1. comparison_side_by_side.png   - Individual trajectories")
+    print("  2. comparison_overlay.png        - Direct overlay comparison")
+    print("  3. comparison_distance.png       - Radial distance over time")
+    print("  4. comparison_animation.gif      - Dynamic side-by-side animation")
+    print()
+    print("=" * 70)
+    print("COMPARISON DEMONSTRATION COMPLETE!")
+    print("=" * 70)
+
+
+def main(output_dir='data'):
+    print("=" * 70)
+    print("EULER vs RK4 COMPARISON: SCHWARZSCHILD LIGHT BENDING")
+    print("=" * 70)
+    print()
+    print("Initial Conditions:")
+    print(f"  Position: ({x0}, {y0})")
+    print(f"  Velocity: ({vx0}, {vy0})")
+    print(f"  Black hole mass: {M}")
+    print()
+
+    print("=" * 70)
+    print("PART 1: EULER METHOD (Naive Approximation)")
+    print("=" * 70)
+    x_euler, y_euler = run(EULER, cache=True)
+    r_euler = np.sqrt(x_euler**2 + y_euler**2)
+    print(f"✓ Euler integration complete")
+    print(f"  Steps taken: {len(x_euler) - 1}")
+    print(f"  Final position: ({x_euler[-1]:.2f}, {y_euler[-1]:.2f})")
+    print(f"  Closest approach: {np.min(r_euler):.3f} Rs")
+    print(f"  Note: This is INACCURATE - Euler fails for stiff equations!")
+    print()
+
+    print("=" * 70)
+    print("PART 2: RK4 METHOD (Accurate General Relativity)")
+    print("=" * 70)
+    x_rk4, y_rk4, r_vals = rk4_trajectory()
+    print(f"✓ RK4 integration complete")
+    print(f"  Steps taken: {len(r_vals)}")
+    print(f"  Final position: ({x_rk4[-1]:.2f}, {y_rk4[-1]:.2f})")
+    print(f"  Closest approach: {np.min(r_vals):.3f} Rs")
+    print(f"  This is ACCURATE - RK4 handles the geodesic equation correctly!")
+    print()
+
+    print("=" * 70)
+    print("PART 3: CREATING COMPARISON VISUALIZATIONS")
+    print("=" * 70)
+    paths = (x_euler, y_euler, x_rk4, y_rk4)
+
+    # Render the three 300-dpi figures in worker processes
+    figure_jobs = [(partial(build_side_by_side, *paths), f'{output_dir}/comparison_side_by_side.png'),
+                   (partial(build_overlay, *paths), f'{output_dir}/comparison_overlay.png'),
+                   (partial(build_distance, *paths), f'{output_dir}/comparison_distance.png')]
+    for path in export_figures(figure_jobs, dpi=300, bbox_inches='tight'):
+        print(f"✓ Saved: {path}")
+
+    print()
+    print("=" * 70)
+    print("PART 4: CREATING ANIMATED COMPARISON")
+    print("=" * 70)
+
+    # Both rays finish on the last frame; frames rendered in worker processes
+    print("  Rendering animation...")
+    export_gif(partial(build_comparison_animation, *paths),
+               f'{output_dir}/comparison_animation.gif', duration=ANIMATION_SECONDS, fps=30)
+    print("✓ Animated comparison saved: comparison_animation.gif")
+
+    print()
+    print_summary()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,204 +3,194 @@ PHASE 5: KERR BLACK HOLE LIGHT BENDING
 Frame Dragging - Rotating Spacetime Effect
 """
 
+from functools import partial
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
 from matplotlib.patches import Circle
 
-print("="*70)
-print("PHASE 5: KERR BLACK HOLE - ROTATING SPACETIME")
-print("="*70)
-
-M = 1.0
-a = 0.7  # Spin parameter
-r_plus = M + np.sqrt(M**2 - a**2)
-r_ergo = 2*M
-
-print(f"\nBlack Hole: M={M}, spin a={a}")
-print(f"Event horizon: {r_plus:.3f} M")
-
-def kerr_geodesic(state, M=1.0, a=0.0):
-    """Simplified Kerr geodesic equations (equatorial)"""
-    r, phi, p_r, p_phi = state
-    
-    if r < 0.5:
-        return np.array([0., 0., 0., 0.])
-    
-    Delta = r**2 - 2*M*r + a**2
-    if abs(Delta) < 1e-10:
-        Delta = 1e-10
-    
-    dr = p_r
-    dphi = (2*M*a*r)/(Delta*r**2) * p_r + p_phi/r**2
-    dpr = -(M/r**2) * (r**2 - a**2) * p_r**2 / r**2 + (r - M)/Delta * p_r**2
-    dpphi = 0.0
-    
-    return np.array([dr, dphi, dpr, dpphi])
-
-def rk4_step(state, dt, M=1.0, a=0.0):
-    """RK4 integration"""
-    k1 = dt * kerr_geodesic(state, M, a)
-    k2 = dt * kerr_geodesic(state + 0.5*k1, M, a)
-    k3 = dt * kerr_geodesic(state + 0.5*k2, M, a)
-    k4 = dt * kerr_geodesic(state + k3, M, a)
-    return state + (k1 + 2*k2 + 2*k3 + k4)/6
-
-def simulate_photon(r0, phi0, b, M=1.0, a=0.0):
-    """Simulate photon in Kerr spacetime"""
-    p_phi = b
-    p_r = -np.sqrt(max(0, 1.0/b**2 - 1.0/r0**2))
-    
-    state = np.array([r0, phi0, p_r, p_phi])
-    r_vals, phi_vals = [r0], [phi0]
-    
-    for _ in range(50000):
-        r, phi, pr, pphi = state
-        
-        if r <= r_plus*1.05 or r > r0*1.5:
-            break
-            
-        r_vals.append(r)
-        phi_vals.append(phi)
-        state = rk4_step(state, 0.01, M, a)
-    
-    r_vals = np.array(r_vals)
-    phi_vals = np.array(phi_vals)
-    x = r_vals * np.cos(phi_vals)
-    y = r_vals * np.sin(phi_vals)
-    fate = 'captured' if r <= r_plus*2 else 'escaped'
-    
-    return x, y, r_vals, phi_vals, fate
-
-# Simulate with positive spin
-print("\nSimulating photon (a = +0.7)...")
-x, y, r, phi, fate = simulate_photon(15.0, np.pi, 4.5, M, a)
-print(f"  Steps: {len(x)}, Fate: {fate}, Closest: {np.min(r):.3f} M")
-
-# Simulate with negative spin
-print("Simulating photon (a = -0.7)...")
-x_neg, y_neg, r_neg, phi_neg, fate_neg = simulate_photon(15.0, np.pi, 4.5, M, -a)
-print(f"  Steps: {len(x_neg)}, Fate: {fate_neg}, Closest: {np.min(r_neg):.3f} M")
-
-# ===== STATIC PLOT =====
-print("\nCreating static plot...")
-fig, ax = plt.subplots(figsize=(14, 12))
-
-ax.plot(x, y, color='#3498db', linewidth=3, label=f'a = +{a}', alpha=0.9, zorder=3)
-ax.plot(x_neg, y_neg, color='#e74c3c', linewidth=3, label=f'a = -{a}', 
-        alpha=0.7, linestyle='--', zorder=2)
-
-ax.scatter(x[0], y[0], color='#3498db', s=200, marker='*', 
-           edgecolors='black', linewidth=2, zorder=5)
-ax.scatter(x_neg[0], y_neg[0], color='#e74c3c', s=200, marker='*',
-           edgecolors='black', linewidth=2, zorder=5)
-
-# Black hole
-horizon = Circle((0, 0), r_plus, color='black', fill=True, alpha=0.9, zorder=10,
-                edgecolor='white', linewidth=3)
-ax.add_patch(horizon)
-
-ergo = Circle((0, 0), r_ergo, color='purple', fill=False, linestyle=':', 
-             linewidth=3, alpha=0.6, zorder=1, label='Ergosphere')
-ax.add_patch(ergo)
-
-# Rotation arrow
-arrow_props = dict(arrowstyle='->', lw=4, color='yellow', mutation_scale=30)
-ax.annotate('', xy=(r_plus*0.7*np.cos(0.8), r_plus*0.7*np.sin(0.8)),
-            xytext=(r_plus*0.7*np.cos(1.3), r_plus*0.7*np.sin(1.3)),
-            arrowprops=arrow_props, zorder=11)
-ax.text(0, -r_ergo-1.5, '⟳ ROTATION', fontsize=14, fontweight='bold',
-        ha='center', color='yellow',
-        bbox=dict(boxstyle='round', facecolor='black', alpha=0.8))
-
-ax.set_xlim(-18, 18)
-ax.set_ylim(-15, 15)
-ax.set_aspect('equal')
-ax.set_xlabel('x (M)', fontsize=16, fontweight='bold')
-ax.set_ylabel('y (M)', fontsize=16, fontweight='bold')
-ax.set_title(f'Phase 5: Kerr Black Hole - FRAME DRAGGING\n' +
-             f'Asymmetric Light Bending (a = {a})',
-             fontsize=18, fontweight='bold', pad=20)
-ax.legend(fontsize=13, loc='upper right', framealpha=0.95)
-ax.grid(True, alpha=0.3)
-
-explanation = (
-    f'FRAME DRAGGING:\n'
-    f'• Blue: a = +{a} (↺)\n'
-    f'• Red: a = -{a} (↻)\n'
-    f'• ASYMMETRIC!\n'
-    f'• Rotation drags\n'
-    f'  spacetime itself'
-)
-props = dict(boxstyle='round', facecolor='lightyellow', alpha=0.95,
-            edgecolor='black', linewidth=2)
-ax.text(0.02, 0.98, explanation, transform=ax.transAxes, fontsize=11,
-        verticalalignment='top', bbox=props, family='monospace', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('phase5_kerr_single_ray.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("✓ Static plot saved")
-
-# ===== ANIMATION =====
-print("\nCreating animation...")
-fig, ax = plt.subplots(figsize=(12, 12))
-
-ax.set_xlim(-18, 18)
-ax.set_ylim(-15, 15)
-ax.set_aspect('equal')
-ax.set_title(f'Phase 5: Kerr Black Hole - Frame Dragging (a={a})',
-             fontsize=17, fontweight='bold', pad=15)
-ax.set_xlabel('x (M)', fontsize=15, fontweight='bold')
-ax.set_ylabel('y (M)', fontsize=15, fontweight='bold')
-ax.grid(True, alpha=0.3)
-
-# Static elements
-ax.add_patch(Circle((0, 0), r_plus, color='black', fill=True, alpha=0.9,
-                   zorder=10, edgecolor='white', linewidth=3))
-ax.add_patch(Circle((0, 0), r_ergo, color='purple', fill=False,
-                   linestyle=':', linewidth=3, alpha=0.6, zorder=1))
-ax.annotate('', xy=(r_plus*0.7*np.cos(0.8), r_plus*0.7*np.sin(0.8)),
-           xytext=(r_plus*0.7*np.cos(1.3), r_plus*0.7*np.sin(1.3)),
-           arrowprops=dict(arrowstyle='->', lw=4, color='yellow', mutation_scale=30),
-           zorder=11)
-
-line, = ax.plot([], [], color='#3498db', linewidth=3, alpha=0.9, zorder=3)
-point, = ax.plot([], [], 'o', color='#3498db', markersize=12,
-                markeredgecolor='black', markeredgewidth=2, zorder=5)
-
-trail_points = []
-for i in range(15):
-    tp, = ax.plot([], [], 'o', color='#3498db', markersize=8-i*0.4,
-                 alpha=0.7-i*0.045, zorder=4)
-    trail_points.append(tp)
-
-status = ax.text(0.02, 0.02, '', transform=ax.transAxes, fontsize=11,
-                verticalalignment='bottom',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.9))
-
-def update(frame):
-    idx = min(frame * 20, len(x) - 1)
-    if idx > 0:
-        line.set_data(x[:idx], y[:idx])
-        point.set_data([x[idx]], [y[idx]])
+from blackhole.animation import PathAnimation
+from blackhole.config import KerrConfig, run
+from blackhole.critical import find_critical_impact
+from blackhole.decimate import plot_path
+from blackhole.kerr import critical_impact_parameter, equatorial_fate
+from blackhole.sweep import sweep
+
+# Photon from r0 = 15 M, phi0 = pi with b = 4.5 M around M = 1, spin a = 0.7
+# (the KerrConfig defaults); the comparison run flips the spin
+CONFIG = KerrConfig()
+
+# Animation length (the frame count no longer follows the step count)
+ANIMATION_SECONDS = 6
+
+
+def simulate(config=CONFIG):
+    """The ray for +a and -a (through the sweep executor and the trajectory cache)"""
+    a = config.a
+    print(f"\nBlack Hole: M={config.M}, spin a={a}")
+    print(f"Event horizon: {config.r_plus:.3f} M")
+
+    print(f"\nSimulating photons (a = +{a}, a = -{a})...")
+    spin_runs = sweep(partial(run, cache=True), [config, config.flipped()])
+    x, y, r, phi, fate = spin_runs[0]
+    x_neg, y_neg, r_neg, phi_neg, fate_neg = spin_runs[1]
+    print(f"  a = +{a}: Steps: {len(x)}, Fate: {fate}, Closest: {np.min(r):.3f} M")
+    print(f"  a = -{a}: Steps: {len(x_neg)}, Fate: {fate_neg}, Closest: {np.min(r_neg):.3f} M")
+    return spin_runs
+
+
+def search_critical(config=CONFIG):
+    """Critical impact parameter: prograde (a > 0) vs retrograde (a < 0)"""
+    M, a = config.M, config.a
+    print("\nSearching critical impact parameter...")
+    for spin in (a, -a):
+        search = find_critical_impact(lambda b: equatorial_fate(b, M, spin), 1.0, 10.0,
+                                      tol=1e-10)
+        print(f"  a = {spin:+.1f}: b_crit = {search['b_crit']:.10f} M "
+              f"(theory {critical_impact_parameter(M, spin):.10f} M, "
+              f"{search['integrations']} integrations, {search['wall_time']:.2f} s)")
+
+
+def make_static_plot(config, spin_runs):
+    a, r_plus, r_ergo = config.a, config.r_plus, config.r_ergo
+    x, y = spin_runs[0][:2]
+    x_neg, y_neg = spin_runs[1][:2]
+
+    # ===== STATIC PLOT =====
+    print("\nCreating static plot...")
+    fig, ax = plt.subplots(figsize=(14, 12))
+
+    plot_path(ax, x, y, color='#3498db', linewidth=3, label=f'a = +{a}', alpha=0.9, zorder=3)
+    plot_path(ax, x_neg, y_neg, color='#e74c3c', linewidth=3, label=f'a = -{a}', 
+            alpha=0.7, linestyle='--', zorder=2)
+
+    ax.scatter(x[0], y[0], color='#3498db', s=200, marker='*', 
+               edgecolors='black', linewidth=2, zorder=5)
+    ax.scatter(x_neg[0], y_neg[0], color='#e74c3c', s=200, marker='*',
+               edgecolors='black', linewidth=2, zorder=5)
+
+    # Black hole
+    horizon = Circle((0, 0), r_plus, color='black', fill=True, alpha=0.9, zorder=10,
+                    edgecolor='white', linewidth=3)
+    ax.add_patch(horizon)
+
+    ergo = Circle((0, 0), r_ergo, color='purple', fill=False, linestyle=':', 
+                 linewidth=3, alpha=0.6, zorder=1, label='Ergosphere')
+    ax.add_patch(ergo)
+
+    # Rotation arrow
+    arrow_props = dict(arrowstyle='->', lw=4, color='yellow', mutation_scale=30)
+    ax.annotate('', xy=(r_plus*0.7*np.cos(0.8), r_plus*0.7*np.sin(0.8)),
+                xytext=(r_plus*0.7*np.cos(1.3), r_plus*0.7*np.sin(1.3)),
+                arrowprops=arrow_props, zorder=11)
+    ax.text(0, -r_ergo-1.5, '⟳ ROTATION', fontsize=14, fontweight='bold',
+            ha='center', color='yellow',
+            bbox=dict(boxstyle='round', facecolor='black', alpha=0.8))
+
+    ax.set_xlim(-18, 18)
+    ax.set_ylim(-15, 15)
+    ax.set_aspect('equal')
+    ax.set_xlabel('x (M)', fontsize=16, fontweight='bold')
+    ax.set_ylabel('y (M)', fontsize=16, fontweight='bold')
+    ax.set_title(f'Phase 5: Kerr Black Hole - FRAME DRAGGING\n' +
+                 f'Asymmetric Light Bending (a = {a})',
+                 fontsize=18, fontweight='bold', pad=20)
+    ax.legend(fontsize=13, loc='upper right', framealpha=0.95)
+    ax.grid(True, alpha=0.3)
+
+    explanation = (
+        f'FRAME DRAGGING:\n'
+        f'• Blue: a = +{a} (↺)\n'
+        f'• Red: a = -{a} (↻)\n'
+        f'• ASYMMETRIC!\n'
+        f'• Rotation drags\n'
+        f'  spacetime itself'
+    )
+    props = dict(boxstyle='round', facecolor='lightyellow', alpha=0.95,
+                edgecolor='black', linewidth=2)
+    ax.text(0.02, 0.98, explanation, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', bbox=props, family='monospace', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('phase5_kerr_single_ray.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    print("✓ Static plot saved")
+
+
+def make_animation(config, spin_run):
+    a, r_plus, r_ergo = config.a, config.r_plus, config.r_ergo
+    x, y, r, phi, _ = spin_run
+
+    # ===== ANIMATION =====
+    print("\nCreating animation...")
+    fig, ax = plt.subplots(figsize=(12, 12))
+
+    ax.set_xlim(-18, 18)
+    ax.set_ylim(-15, 15)
+    ax.set_aspect('equal')
+    ax.set_title(f'Phase 5: Kerr Black Hole - Frame Dragging (a={a})',
+                 fontsize=17, fontweight='bold', pad=15)
+    ax.set_xlabel('x (M)', fontsize=15, fontweight='bold')
+    ax.set_ylabel('y (M)', fontsize=15, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+
+    # Static elements
+    ax.add_patch(Circle((0, 0), r_plus, color='black', fill=True, alpha=0.9,
+                       zorder=10, edgecolor='white', linewidth=3))
+    ax.add_patch(Circle((0, 0), r_ergo, color='purple', fill=False,
+                       linestyle=':', linewidth=3, alpha=0.6, zorder=1))
+    ax.annotate('', xy=(r_plus*0.7*np.cos(0.8), r_plus*0.7*np.sin(0.8)),
+               xytext=(r_plus*0.7*np.cos(1.3), r_plus*0.7*np.sin(1.3)),
+               arrowprops=dict(arrowstyle='->', lw=4, color='yellow', mutation_scale=30),
+               zorder=11)
+
+    anim = PathAnimation(fig)
+    anim.add_path(ax, x, y, marker='o', markersize=12, color='#3498db', linewidth=3,
+                  alpha=0.9, zorder=3,
+                  head_kw=dict(color='#3498db', markeredgecolor='black',
+                               markeredgewidth=2, zorder=5))
+
+    trail_points = []
+    for i in range(15):
+        tp, = ax.plot([], [], 'o', color='#3498db', markersize=8-i*0.4,
+                     alpha=0.7-i*0.045, zorder=4)
+        trail_points.append(tp)
+
+    status = ax.text(0.02, 0.02, '', transform=ax.transAxes, fontsize=11,
+                    verticalalignment='bottom',
+                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.9))
+
+    def update(idx):
         for i, tp in enumerate(trail_points):
             tidx = max(0, idx - i*5)
             tp.set_data([x[tidx]], [y[tidx]])
         status.set_text(f'Step: {idx}/{len(x)}\nr = {r[idx]:.2f} M\nφ = {phi[idx]:.2f}')
-    return [line, point] + trail_points + [status]
-
-ani = FuncAnimation(fig, update, frames=range(0, len(x)//20 + 1),
-                   interval=40, blit=True)
-ani.save('phase5_kerr_animation.gif', writer=PillowWriter(fps=30))
-plt.close()
-print("✓ Animation saved")
-
-print("\n" + "="*70)
-print("PHASE 5 COMPLETE!")
-print("="*70)
-print("\nKEY RESULT: Flipping spin (a → -a) FLIPS bending direction!")
-print("This PROVES spacetime rotation (frame dragging)!")
-print("\nOutputs:")
-print("  1. phase5_kerr_single_ray.png")
-print("  2. phase5_kerr_animation.gif")
+
+    anim.add_overlay(ax, trail_points + [status], update)
+    anim.save('phase5_kerr_animation.gif', duration=ANIMATION_SECONDS, fps=30)
+    plt.close()
+    print("✓ Animation saved")
+
+
+def main(config=CONFIG):
+    print("="*70)
+    print("PHASE 5: KERR BLACK HOLE - ROTATING SPACETIME")
+    print("="*70)
+
+    spin_runs = simulate(config)
+    search_critical(config)
+    make_static_plot(config, spin_runs)
+    make_animation(config, spin_runs[0])
+
+    print("\n" + "="*70)
+    print("PHASE 5 COMPLETE!")
+    print("="*70)
+    print("\nKEY RESULT: Flipping spin (a → -a) FLIPS bending direction!")
+    print("This PROVES spacetime rotation (frame dragging)!")
+    print("\nOutputs:")
+    print("  1. phase5_kerr_single_ray.png")
+    print("  2. phase5_kerr_animation.gif")
+
+
+if __name__ == "__main__":
+    main(CONFIG)
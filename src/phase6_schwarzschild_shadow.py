@@ -0,0 +1,56 @@
+"""
+PHASE 6: SCHWARZSCHILD SHADOW
+Full-frame lensed sky seen by a static observer
+
+Usage:
+    python src/phase6_schwarzschild_shadow.py [--width 1920 --height 1080]
+        [--fov 30] [--r-obs 50] [--output phase6_schwarzschild_shadow.png]
+        [--no-table]
+
+The output extension picks the format: .png for an image, .npy for the raw
+(H, W, 3) float array. The ray angles come from the deflection table cached
+in BLACKHOLE_CACHE_DIR (built on the first run); --no-table integrates the
+rays instead.
+"""
+
+import argparse
+import time
+
+from blackhole.lookup import deflection_table
+from blackhole.render import critical_angle, render_shadow, save_image
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--fov', type=float, default=30.0, help="vertical, degrees")
+    parser.add_argument('--r-obs', type=float, default=50.0, help="observer radius (M)")
+    parser.add_argument('--mass', type=float, default=1.0)
+    parser.add_argument('--rays', type=int, default=2048, help="1-D ray table size")
+    parser.add_argument('--output', default='phase6_schwarzschild_shadow.png')
+    parser.add_argument('--no-table', action='store_true',
+                        help="integrate the rays instead of using the deflection table")
+    args = parser.parse_args(argv)
+
+    print("="*70)
+    print("PHASE 6: SCHWARZSCHILD SHADOW")
+    print("="*70)
+    print(f"\n{args.width}x{args.height}, fov {args.fov} deg, observer at r = {args.r_obs} M")
+
+    table = None if args.no_table else deflection_table()
+    start = time.perf_counter()
+    image = render_shadow(args.width, args.height, args.fov, args.r_obs, args.mass,
+                          n_rays=args.rays, table=table)
+    elapsed = time.perf_counter() - start
+
+    print(f"Shadow angular radius: {critical_angle(args.r_obs, args.mass):.5f} rad")
+    source = "integrated rays" if table is None else "table lookups"
+    print(f"Rendered {args.width*args.height} pixels from {args.rays} {source} in {elapsed:.2f} s")
+
+    save_image(image, args.output)
+    print(f"✓ Saved: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+PHASE 7: KERR SHADOW
+Lensed sky around a spinning hole, seen from any inclination
+
+Usage:
+    python src/phase7_kerr_shadow.py [--width 512 --height 512] [--fov 30]
+        [--r-obs 50] [--inclination 60] [--spin 0.9] [--workers N]
+        [--output phase7_kerr_shadow.png]
+
+The output extension picks the format: .png for an image, .npy for the raw
+(H, W, 3) float array.
+"""
+
+import argparse
+import time
+
+from blackhole.kerr3d import render_kerr_shadow
+from blackhole.render import save_image
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--width', type=int, default=512)
+    parser.add_argument('--height', type=int, default=512)
+    parser.add_argument('--fov', type=float, default=30.0, help="vertical, degrees")
+    parser.add_argument('--r-obs', type=float, default=50.0, help="observer radius (M)")
+    parser.add_argument('--inclination', type=float, default=60.0,
+                        help="degrees from the spin axis")
+    parser.add_argument('--spin', type=float, default=0.9)
+    parser.add_argument('--mass', type=float, default=1.0)
+    parser.add_argument('--step', type=float, default=0.05, help="RK4 step (radians of orbit)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', default='phase7_kerr_shadow.png')
+    args = parser.parse_args(argv)
+
+    print("="*70)
+    print("PHASE 7: KERR SHADOW")
+    print("="*70)
+    print(f"\n{args.width}x{args.height}, fov {args.fov} deg, observer at r = {args.r_obs} M, "
+          f"i = {args.inclination} deg, a = {args.spin}")
+
+    start = time.perf_counter()
+    image = render_kerr_shadow(args.width, args.height, args.fov, args.r_obs,
+                               args.inclination, args.spin, args.mass, h=args.step,
+                               workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Traced {args.width*args.height} rays in {elapsed:.2f} s")
+
+    save_image(image, args.output)
+    print(f"✓ Saved: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,30 @@
+"""
+Shared integrators for the phase scripts.
 
+The steppers live in the side-effect-free blackhole package; this module
+re-exports them under one roof, with the per-run config objects, for code
+that used to copy them between scripts:
+
+    from utils_integrators import KerrConfig, run
+    x, y, r, phi, fate = run(KerrConfig(a=-0.7))
+"""
+
+from blackhole.config import (EulerConfig, KerrConfig, NewtonConfig, NewtonEulerConfig,
+                              SchwarzschildConfig, run)
+from blackhole.integrators import dopri45_step, integrate_adaptive
+from blackhole.kerr import kerr_geodesic, rk4_step as kerr_rk4_step, simulate_photon
+from blackhole.newton import acceleration as newton_accel
+from blackhole.newton import compute_trajectory, compute_trajectory_euler
+from blackhole.schwarzschild import euler_accel, integrate_euler, integrate_rk4
+from blackhole.schwarzschild import rk4_step as schwarzschild_rk4_step
+from blackhole.schwarzschild import schwarzschild_geodesic
+
+__all__ = [
+    'EulerConfig', 'KerrConfig', 'NewtonConfig', 'NewtonEulerConfig',
+    'SchwarzschildConfig', 'run',
+    'dopri45_step', 'integrate_adaptive',
+    'kerr_geodesic', 'kerr_rk4_step', 'simulate_photon',
+    'newton_accel', 'compute_trajectory', 'compute_trajectory_euler',
+    'euler_accel', 'integrate_euler', 'integrate_rk4',
+    'schwarzschild_rk4_step', 'schwarzschild_geodesic',
+]
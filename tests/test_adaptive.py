@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from blackhole.kerr import simulate_photon, simulate_photon_rk45
+from blackhole.schwarzschild import integrate_rk4, integrate_rk45
+
+
+def test_rk45_closest_approach_matches_fixed_step():
+    """
+    For an escaping ray the adaptive solver must find the same periapsis as
+    the fixed dphi = 0.001 RK4 run, with far fewer RHS evaluations.
+    """
+
+    for b in [6.0, 8.0]:
+        phi_f, r_f = integrate_rk4(r0=10.0, b=b, dphi=0.001)
+        phi_a, r_a, stats = integrate_rk45(r0=10.0, b=b, rtol=1e-10, atol=1e-12)
+
+        assert np.isclose(stats['r_min'], r_f.min(), rtol=1e-6)
+        assert stats['nfev'] * 10 < 4 * len(r_f)
+
+
+def test_rk45_reports_step_statistics():
+    phi_a, r_a, stats = integrate_rk45(r0=10.0, b=8.0, rtol=1e-6, atol=1e-9)
+
+    # The start, every accepted step but the last, then the exact r = 50 crossing
+    assert stats['accepted'] + 1 == len(r_a)
+    assert r_a[-1] == pytest.approx(50.0, rel=1e-12)
+    assert stats['rejected'] >= 0
+    assert stats['nfev'] >= 6 * (stats['accepted'] + stats['rejected'])
+
+
+def test_kerr_rk45_matches_fixed_step_fate():
+    for a in [0.7, -0.7]:
+        _, _, r_f, _, fate_f = simulate_photon(15.0, np.pi, 4.5, 1.0, a)
+        _, _, r_a, _, fate_a, stats = simulate_photon_rk45(15.0, np.pi, 4.5, 1.0, a)
+
+        assert fate_a == fate_f
+        assert stats['nfev'] * 10 < 4 * len(r_f)
@@ -0,0 +1,69 @@
+import numpy as np
+
+from blackhole.analytic import deflection, photon_fate, swept_angle, turning_points
+from blackhole.schwarzschild import integrate_rk4, integrate_rk45, ray_fate
+
+
+def test_swept_angle_matches_rk4():
+    """
+    The RK4 ray from r0 = 10 sweeps periapsis -> r0 on the way in and
+    periapsis -> r_end on the way out; the elliptic integral must agree.
+    """
+
+    for b in [5.3, 6.0, 8.0]:
+        phi_vals, r_vals = integrate_rk4(r0=10.0, b=b, dphi=0.001)
+        swept = phi_vals[-1] - np.pi
+        analytic = swept_angle(b, 10.0) + swept_angle(b, r_vals[-1])
+
+        assert np.isclose(swept, analytic, rtol=1e-8)
+
+
+def test_periapsis_matches_rk45():
+    bs = np.array([5.3, 6.0, 8.0])
+    _, r_min, fate = deflection(bs)
+
+    for b, r in zip(bs, r_min):
+        _, _, stats = integrate_rk45(r0=10.0, b=b, rtol=1e-10, atol=1e-12)
+        assert np.isclose(r, stats['r_min'], rtol=1e-7)
+    assert np.all(fate == 'escaped')
+
+
+def test_weak_field_and_capture():
+    """Weak-field series in M/b far away; no periapsis below sqrt(27) M"""
+
+    b = np.array([1e3, 1e4, 5.0])
+    alpha, r_min, fate = deflection(b)
+
+    weak = 4/b[:2] + 15*np.pi/4/b[:2]**2 + 128/3/b[:2]**3
+    assert np.allclose(alpha[:2], weak, rtol=1e-8)
+    assert fate[2] == 'captured'
+    assert np.isnan(alpha[2]) and np.isnan(r_min[2])
+    assert np.all(np.isnan(turning_points(5.0)))
+
+
+def test_photon_fate_matches_integration():
+    """The turning-point oracle agrees with the adaptive integrator on both sides of b_crit"""
+
+    bs = np.array([3.0, 5.0, 5.19, 5.2, 5.3, 8.0, 9.5])
+    fate, r_min = photon_fate(bs, r0=10.0)
+    assert fate.tolist() == [ray_fate(b, r0=10.0) for b in bs]
+
+    for b, r in zip(bs[3:], r_min[3:]):
+        _, _, stats = integrate_rk45(r0=10.0, b=b, rtol=1e-10, atol=1e-12)
+        assert np.isclose(r, stats['r_min'], rtol=1e-7)
+    assert np.all(np.isnan(r_min[:3]))
+
+
+def test_photon_fate_critical_and_inner_start():
+    fate, r_min = photon_fate([np.sqrt(27.0)*2, 12.0, 12.0], M=2.0, r0=[20.0, 20.0, 3.0])
+    assert fate.tolist() == ['critical', 'escaped', 'captured']
+    assert r_min[0] == 6.0 and np.isnan(r_min[2])
+
+
+def test_photon_fate_flags_starts_inside_the_periapsis():
+    """Between r_mid and r_peri there is no real du/dphi, so no ray to classify"""
+
+    _, r_mid, r_peri = turning_points(8.0)
+    fate, r_min = photon_fate(8.0, r0=[(r_mid + r_peri)/2, r_peri, 2*r_peri])
+    assert fate.tolist() == ['forbidden', 'escaped', 'escaped']
+    assert np.isnan(r_min[0]) and r_min[1] == r_min[2] == r_peri
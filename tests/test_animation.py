@@ -0,0 +1,57 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from blackhole.animation import PathAnimation, frame_indices
+
+
+def test_frame_budget_does_not_follow_step_count():
+    ends = frame_indices(5000, duration=2, fps=30)
+    assert len(ends) == 60
+    assert ends[-1] == 5000 and np.all(np.diff(ends) > 0)
+    assert len(frame_indices(10, frames=60)) == 10
+
+
+def test_frames_draw_only_new_segments(tmp_path):
+    t = np.linspace(0, 2*np.pi, 3000)
+    fig, ax = plt.subplots(figsize=(3, 3), dpi=50)
+    ax.set_xlim(-1.5, 1.5)
+    ax.set_ylim(-1.5, 1.5)
+    anim = PathAnimation(fig)
+    line, head = anim.add_path(ax, np.cos(t), np.sin(t))
+
+    frames = []
+    for image in anim.frames(frames=30):
+        frames.append(image)
+        assert len(line.get_xdata()) <= 3000//29 + 2
+    plt.close(fig)
+
+    assert len(frames) == 30
+    assert frames[0].shape == (150, 150, 4) and frames[0].dtype == np.uint8
+    # The path accumulates: later frames have more non-white pixels
+    ink = [np.count_nonzero(f[..., :3].min(axis=2) < 200) for f in frames]
+    assert ink[-1] > ink[len(ink)//2] > ink[0]
+
+
+def test_overlay_follows_the_head_and_stays_out_of_the_cache():
+    t = np.linspace(0, 2*np.pi, 500)
+    fig, ax = plt.subplots(figsize=(2, 2), dpi=40)
+    ax.set_xlim(-1.5, 1.5)
+    ax.set_ylim(-1.5, 1.5)
+    anim = PathAnimation(fig)
+    anim.add_path(ax, np.cos(t), np.sin(t), marker=None)
+    label = ax.text(0, 0, '')
+    seen = []
+
+    def update(i):
+        seen.append(i)
+        label.set_text(str(i))
+
+    anim.add_overlay(ax, [label], update)
+    list(anim.frames(frames=10))
+    plt.close(fig)
+
+    assert label.get_animated()
+    assert len(seen) == 10 and seen[-1] == 499 and seen == sorted(seen)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from blackhole.schwarzschild import integrate_rk4, integrate_rk4_batch
+
+
+def test_batch_matches_single_ray():
+    """
+    Each row of the batched integrator must reproduce the scalar
+    integrate_rk4 path for the same impact parameter.
+    """
+
+    bs = np.array([3.0, 5.0, 5.3, 8.0])
+    phi_b, r_b, n_steps = integrate_rk4_batch(bs, r0=10.0, dphi=0.002)
+
+    assert len(r_b) == n_steps.sum()
+    rays = np.split(r_b, np.cumsum(n_steps)[:-1])
+    for i, b in enumerate(bs):
+        phi_s, r_s = integrate_rk4(r0=10.0, b=b, dphi=0.002)
+        assert n_steps[i] == len(r_s)
+        assert np.allclose(phi_b[:n_steps[i]], phi_s)
+        assert np.allclose(rays[i], r_s)
+
+
+def test_batch_skips_rays_that_cannot_start():
+    """b larger than r0 / sqrt(1 - 2M/r0) has no real starting slope"""
+
+    phi_b, r_b, n_steps = integrate_rk4_batch([20.0, 4.0], r0=10.0)
+
+    assert n_steps[0] == 0
+    assert n_steps[1] > 0
+    assert len(r_b) == n_steps[1]
@@ -0,0 +1,43 @@
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def suite():
+    spec = importlib.util.spec_from_file_location(
+        'bench_suite', os.path.join(ROOT, 'benchmarks', 'suite.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_run_appends_history_and_compare_flags_regressions(suite, tmp_path):
+    history = str(tmp_path / 'history.json')
+    assert suite.main(['--history', history, 'run', '--quick', '--repeats', '1',
+                       '--filter', 'compute_trajectory']) == 0
+    record = suite.load_history(history)[0]
+    result = record['results']['compute_trajectory[steps=3000]']
+    assert result['count'] == 4*3000
+    assert result['rate'] > 0 and result['peak_bytes'] > 0
+
+    # Same record twice: nothing flagged
+    suite.append_history(history, record)
+    assert suite.main(['--history', history, 'compare']) == 0
+
+    slower = {**record, 'results': {key: {**value, 'wall_time': 2*value['wall_time'] + 1}
+                                    for key, value in record['results'].items()}}
+    suite.append_history(history, slower)
+    assert suite.main(['--history', history, 'compare', '--threshold', '0.5']) == 1
+
+
+def test_compare_ignores_changes_below_the_noise_floor(suite):
+    old = {'results': {'case': {'wall_time': 1e-5, 'peak_bytes': 1000}}}
+    new = {'results': {'case': {'wall_time': 3e-5, 'peak_bytes': 3000},
+                       'new_case': {'wall_time': 1.0, 'peak_bytes': 1}}}
+    rows = suite.compare(old, new, threshold=0.1)
+    assert [row[0] for row in rows] == ['case', 'case']
+    assert not any(row[-1] for row in rows)
@@ -0,0 +1,47 @@
+import numpy as np
+
+from blackhole import kernels
+from blackhole.buffers import BatchBuffer, TrajectoryBuffer
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import integrate_rk4
+
+
+def test_buffer_grows_geometrically_and_trims():
+    buf = TrajectoryBuffer(2, max_points=10, initial=4)
+    xs, ys = buf.rows
+    for n in range(7):
+        if n == len(xs):
+            xs, ys = buf.grow(n)
+        xs[n], ys[n] = n, -n
+
+    assert buf.data.shape == (2, 8)
+    x, y = buf.trim(7)
+    assert np.array_equal(x, np.arange(7)) and np.array_equal(y, -np.arange(7))
+    assert x.flags['C_CONTIGUOUS'] and x.dtype == np.float64
+
+
+def test_batch_buffer_stores_only_active_points():
+    buf = BatchBuffer(1, 3, initial=2)
+    buf.append(np.array([0, 1, 2]), [0.0, 10.0, 20.0])
+    buf.append(np.array([0, 2]), [1.0, 21.0])
+    buf.append(np.array([2]), [22.0])
+
+    x, = buf.trim()
+    assert buf.filled == 6 and list(buf.counts) == [2, 1, 3]
+    assert list(x) == [0.0, 1.0, 10.0, 20.0, 21.0, 22.0]
+
+
+def test_record_every_is_a_stride_of_the_full_path(monkeypatch):
+    for use_numba in [False, True]:
+        monkeypatch.setattr(kernels, 'USE_NUMBA', use_numba)
+
+        phi, r = integrate_rk4(r0=10.0, b=6.0)
+        phi_k, r_k = integrate_rk4(r0=10.0, b=6.0, record_every=7)
+        assert np.array_equal(phi[::7], phi_k) and np.array_equal(r[::7], r_k)
+
+        full = simulate_photon(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=3000)
+        strided = simulate_photon(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=3000,
+                                  record_every=5)
+        assert strided[2][0] == full[2][0]
+        assert np.array_equal(full[2][1:][::5], strided[2][1:])
+        assert full[4] == strided[4]
@@ -0,0 +1,72 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from blackhole import kernels
+from blackhole.cache import TrajectoryCache, cache_key, cached
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import integrate_rk4
+
+
+def test_hit_returns_same_arrays(tmp_path):
+    cache = TrajectoryCache(str(tmp_path))
+    run = cached(simulate_photon, cache)
+
+    first = run(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=500)
+    second = run(15.0, np.pi, 4.5, M=1.0, a=0.7, max_steps=500)
+
+    assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 1
+    for a, b in zip(first[:4], second[:4]):
+        assert np.array_equal(a, b)
+    assert second[4] == first[4] and isinstance(second[4], str)
+
+
+def test_stats_dict_round_trips(tmp_path):
+    """stats=True results carry a dict; the second call must still hit"""
+    cache = TrajectoryCache(str(tmp_path))
+    run = cached(integrate_rk4, cache)
+
+    phi, r, stats = run(b=3.0, max_steps=200, stats=True)
+    again = run(b=3.0, max_steps=200, stats=True)
+
+    assert cache.stats()['hits'] == 1
+    assert np.array_equal(again[1], r) and again[2] == stats
+
+
+def test_unstorable_result_is_rejected(tmp_path):
+    cache = TrajectoryCache(str(tmp_path))
+    with pytest.raises(TypeError):
+        cache.put('k', (np.zeros(3), object()))
+    assert cache.entries() == []
+
+
+def test_key_depends_on_arguments_not_spelling():
+    assert cache_key(integrate_rk4, 10.0, 3.0) == cache_key(integrate_rk4, b=3.0)
+    assert cache_key(integrate_rk4, b=3.0) != cache_key(integrate_rk4, b=3.0, dphi=0.002)
+
+
+def test_key_depends_on_kernel_backend(monkeypatch):
+    monkeypatch.setattr(kernels, 'USE_NUMBA', True)
+    compiled = cache_key(integrate_rk4, b=3.0)
+    monkeypatch.setattr(kernels, 'USE_NUMBA', False)
+    assert cache_key(integrate_rk4, b=3.0) != compiled
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = TrajectoryCache(str(tmp_path), max_bytes=3*8000)
+    for i in range(3):
+        cache.put(f"k{i}", (np.zeros(900),))
+        os.utime(os.path.join(cache.directory, f"k{i}"), (i, i))
+    cache.get('k0')
+    cache.put('k3', (np.zeros(900),))
+
+    assert cache.evictions == 1
+    assert cache.get('k1') is None
+    assert cache.get('k0') is not None
+
+
+def test_wrapped_integrator_pickles():
+    run = pickle.loads(pickle.dumps(cached(integrate_rk4)))
+    assert run.__name__ == 'integrate_rk4'
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+IMPORT_BUDGET = 0.5
+
+
+def run_python(code, *args):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    out = subprocess.run([sys.executable, '-c', code, *args], env=env,
+                         capture_output=True, text=True, check=True)
+    return out.stdout
+
+
+def test_cli_import_is_fast_and_light():
+    """Startup regression guard: the CLI module pulls in neither numpy nor matplotlib"""
+
+    code = ("import sys, time\n"
+            "t = time.perf_counter()\n"
+            "import blackhole.cli\n"
+            "print(time.perf_counter() - t)\n"
+            "print('numpy' in sys.modules, 'matplotlib' in sys.modules)\n")
+    elapsed, modules = run_python(code).splitlines()
+    assert float(elapsed) < IMPORT_BUDGET
+    assert modules == 'False False'
+
+
+def test_compute_run_emits_json_without_matplotlib(tmp_path):
+    npz, summary_path = tmp_path / 'ray.npz', tmp_path / 'ray.json'
+    code = ("import sys\n"
+            "from blackhole.cli import main\n"
+            "main(sys.argv[1:])\n"
+            "print('matplotlib' in sys.modules)\n")
+    imported = run_python(code, 'schwarzschild', '--b', '7.0', '--npz', str(npz),
+                          '--json', str(summary_path)).strip()
+    summary = json.loads(summary_path.read_text())
+
+    assert imported == 'False'
+    assert summary['command'] == 'schwarzschild'
+    assert summary['fate'] == 'escaped'
+    assert np.isclose(summary['b_crit'], np.sqrt(27))
+
+    arrays = np.load(npz)
+    assert arrays['r'].min() == summary['closest']
+    assert len(arrays['phi']) == summary['points']
+
+
+def test_photon_sphere_scan_reads_the_deflection_table(tmp_path):
+    from blackhole.analytic import deflection
+
+    summary_path = tmp_path / 'scan.json'
+    code = "import sys\nfrom blackhole.cli import main\nmain(sys.argv[1:])\n"
+    env = dict(os.environ, PYTHONPATH=SRC, BLACKHOLE_CACHE_DIR=str(tmp_path))
+    subprocess.run([sys.executable, '-c', code, 'photon-sphere', '--n', '4',
+                    '--json', str(summary_path)], env=env, check=True)
+    summary = json.loads(summary_path.read_text())
+
+    assert any(name.startswith('deflection_') for name in os.listdir(tmp_path))
+    alpha = np.array([np.nan if a is None else a for a in summary['deflection']])
+    assert np.allclose(alpha, deflection(np.array(summary['b']))[0], equal_nan=True)
+    assert summary['integrations'] == 0
@@ -0,0 +1,84 @@
+import dataclasses
+import importlib.util
+import os
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from blackhole.config import EulerConfig, KerrConfig, NewtonConfig, SchwarzschildConfig, run
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import integrate_rk4
+from blackhole.sweep import sweep
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+SCRIPTS = ['phase1_newton_light.py', 'phase2_schwarzschild.py', 'phase5_kerr_light.py',
+           os.path.join('src', 'phase2_schwarzschild_photon_sphere.py')]
+
+
+def test_two_configurations_in_one_process():
+    prograde = KerrConfig(b=6.0, max_steps=3000)
+    retrograde = prograde.flipped()
+    assert retrograde.a == -prograde.a
+    assert retrograde.r_plus == prograde.r_plus
+
+    results = sweep(run, [prograde, retrograde], workers=1)
+    for config, (x, y, r, phi, fate) in zip([prograde, retrograde], results):
+        expected = simulate_photon(15.0, np.pi, 6.0, 1.0, config.a, max_steps=3000)
+        assert np.array_equal(r, expected[2])
+        assert fate == expected[4]
+    assert not np.array_equal(results[0][3], results[1][3])
+
+    # Frozen, hashable and picklable for pools and caches
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        prograde.a = 0.0
+    assert pickle.loads(pickle.dumps(prograde)) == prograde
+    assert len({prograde, retrograde, KerrConfig(b=6.0, max_steps=3000)}) == 2
+
+
+def test_run_matches_solver_calls():
+    phi, r = run(SchwarzschildConfig(b=4.0, dphi=0.002))
+    expected = integrate_rk4(10.0, 4.0, 1.0, 0.002)
+    assert np.array_equal(phi, expected[0]) and np.array_equal(r, expected[1])
+
+    x, y = run(NewtonConfig(steps=100))
+    assert len(x) == 100
+
+    clamped = run(EulerConfig(max_steps=4000))
+    raw = run(EulerConfig(max_steps=4000, r_max=np.inf, clamp=False))
+    assert len(clamped[0]) == len(raw[0])
+    assert not np.array_equal(clamped[0], raw[0])
+
+
+@pytest.mark.parametrize('script', SCRIPTS)
+def test_scripts_import_without_running(script, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    name = os.path.basename(script)[:-3]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SRC, script))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert capsys.readouterr().out == ''
+    assert os.listdir(tmp_path) == []
+
+
+def test_photon_sphere_script_runs_from_anywhere(tmp_path):
+    """The script finds the library itself: no PYTHONPATH, run from another directory"""
+
+    code = ("import importlib.util, sys\n"
+            "import numpy as np\n"
+            "spec = importlib.util.spec_from_file_location('phase4', sys.argv[1])\n"
+            "script = importlib.util.module_from_spec(spec)\n"
+            "spec.loader.exec_module(script)\n"
+            "from blackhole.config import EulerConfig, NewtonEulerConfig, SchwarzschildConfig\n"
+            "script.ANIMATION_SECONDS = 0.1\n"
+            "script.main(NewtonEulerConfig(steps=30), EulerConfig(max_steps=40),\n"
+            "            SchwarzschildConfig(max_steps=200), np.array([4.0, 6.0]))\n")
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONPATH'}
+    env['MPLBACKEND'] = 'Agg'
+    subprocess.run([sys.executable, '-c', code,
+                    os.path.join(SRC, 'src', 'phase2_schwarzschild_photon_sphere.py')],
+                   cwd=tmp_path, env=env, capture_output=True, check=True)
+    assert 'phase4_photon_sphere_scan.png' in os.listdir(tmp_path)
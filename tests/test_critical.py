@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from blackhole.critical import (find_critical_impact, schwarzschild_critical_impact,
+                                schwarzschild_fates)
+from blackhole.kerr import critical_impact_parameter, equatorial_fate
+from blackhole.schwarzschild import ray_fate
+
+
+def test_schwarzschild_b_crit():
+    """Bisection on the fate must land on sqrt(27) M"""
+
+    result = find_critical_impact(ray_fate, 5.0, 5.5, tol=1e-6)
+
+    assert abs(result['b_crit'] - np.sqrt(27)) < 1e-6
+    # log2(0.5 / 1e-6) ~ 19 halvings
+    assert result['iterations'] <= 20
+    assert result['wall_time'] > 0
+
+
+def test_kerr_b_crit_depends_on_spin():
+    """Prograde rays get closer than retrograde ones before capture"""
+
+    for a in [0.7, -0.7]:
+        result = find_critical_impact(lambda b: equatorial_fate(b, 1.0, a),
+                                      1.0, 10.0, tol=1e-6)
+        assert abs(result['b_crit'] - critical_impact_parameter(1.0, a)) < 1e-6
+
+    assert critical_impact_parameter(1.0, 0.7) < np.sqrt(27) < critical_impact_parameter(1.0, -0.7)
+
+
+def test_schwarzschild_analytic_path_skips_integration():
+    """The turning points give b_crit exactly; check=True bisects as well"""
+
+    result = schwarzschild_critical_impact(6.0, 12.0, M=2.0)
+    assert result['b_crit'] == np.sqrt(27)*2.0
+    assert result['integrations'] == 0
+
+    checked = schwarzschild_critical_impact(5.0, 5.5, tol=1e-6, check=True)
+    assert abs(checked['integrated']['b_crit'] - checked['b_crit']) < 1e-6
+    assert checked['integrated']['integrations'] > 0
+
+    with pytest.raises(ValueError):
+        schwarzschild_critical_impact(6.0, 8.0)
+
+
+def test_schwarzschild_fates_agree_with_integration():
+    bs = np.array([3.0, 5.0, 5.3, 8.0])
+    fates, _ = schwarzschild_fates(bs, check=True, workers=1)
+    assert list(fates) == ['captured', 'captured', 'escaped', 'escaped']
+
+
+def test_schwarzschild_fates_take_one_start_per_ray():
+    fates, r_min = schwarzschild_fates([4.0, 6.0], 1.0, r0=np.array([20.0, 30.0]),
+                                       check=True, workers=1)
+    assert list(fates) == ['captured', 'escaped']
+    assert np.isnan(r_min[0]) and 4 < r_min[1] < 6
@@ -0,0 +1,38 @@
+import numpy as np
+
+from blackhole.decimate import decimate_indices, rdp_mask
+from blackhole.schwarzschild import integrate_rk4
+
+
+def _max_deviation(x, y, idx):
+    """Largest distance of any original point from the simplified polyline"""
+    worst = 0.0
+    for i, j in zip(idx[:-1], idx[1:]):
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        px, py = x[i:j + 1] - x[i], y[i:j + 1] - y[i]
+        worst = max(worst, np.max(np.abs(px*dy - py*dx))/np.hypot(dx, dy))
+    return worst
+
+
+def test_straight_line_keeps_endpoints_only():
+    t = np.linspace(0, 1, 1000)
+    assert np.flatnonzero(rdp_mask(3*t, 2*t - 1, 1e-9)).tolist() == [0, 999]
+
+
+def test_ray_stays_within_tolerance_and_keeps_periapsis_dense():
+    phi, r = integrate_rk4(10.0, 5.3, dphi=0.0005, max_steps=40000)
+    x, y = r*np.cos(phi), r*np.sin(phi)
+
+    idx = decimate_indices(x, y, 0.01)
+    assert len(idx) < len(x)//20
+    assert _max_deviation(x, y, idx) <= 0.01 + 1e-12
+
+    near = r[idx] < 1.5*r.min()
+    plain = decimate_indices(x, y, 0.01, dense=False)
+    assert near.sum() > (r[plain] < 1.5*r.min()).sum()
+
+
+def test_max_points_caps_output():
+    phi, r = integrate_rk4(10.0, 5.3, dphi=0.0005, max_steps=40000)
+    idx = decimate_indices(r*np.cos(phi), r*np.sin(phi), 1e-6, max_points=50)
+    assert 2 <= len(idx) <= 50
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from blackhole import kernels
+from blackhole.config import KerrConfig, SchwarzschildConfig, run
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import constraint_error, integrate_rk4, project_constraint
+from blackhole.stats import DRIFT, ESCAPE, HORIZON, instrumented_sweep
+
+def ray(b, **kwargs):
+    return integrate_rk4(10.0, b, **kwargs)
+
+
+# 7.5e-7 above b_crit: the ray winds about twice round the photon sphere
+B_NEAR = 5.1961525
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    if request.param and not kernels.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(kernels, 'USE_NUMBA', request.param)
+
+
+def test_projection_lands_on_the_constraint():
+    u = 0.1
+    du = np.sqrt(1/25 - u**2*(1 - 2*u)) + 1e-6
+    assert constraint_error(u, du, 5.0) > 1e-6
+    # One Newton step: the error goes from 1e-6 to ~(1e-6)^2
+    assert constraint_error(*project_constraint(u, du, 5.0), 5.0) < 1e-10
+
+
+def test_projection_leaves_a_zero_gradient_alone():
+    """du = 0 on the photon sphere: both backends return the point unchanged"""
+
+    u, du = 1/3, 0.0
+    assert project_constraint(u, du, 5.0) == (u, du)
+    if kernels.HAVE_NUMBA:
+        assert kernels.schwarzschild_project(u, du, 5.0, 1.0) == (u, du)
+
+    us, dus = project_constraint(np.array([u, 0.1]), np.array([du, 0.2]), 5.0)
+    assert us[0] == u and dus[0] == du and np.all(np.isfinite(us))
+
+
+def test_projection_keeps_near_critical_rays_at_large_steps(use_numba):
+    reference = integrate_rk4(10.0, B_NEAR, dphi=1e-4, max_steps=10**6)[0][-1]
+
+    phi, r, stats = integrate_rk4(10.0, B_NEAR, dphi=0.1, stats=True, check_every=1)
+    assert stats['reason'] == HORIZON and stats['projections'] == 0
+
+    phi, r, stats = integrate_rk4(10.0, B_NEAR, dphi=0.1, stats=True, project=True)
+    assert stats['reason'] == ESCAPE
+    assert abs(phi[-1] - reference) < 0.2
+    assert stats['projections'] == stats['drift_checks'] == stats['steps']
+    assert stats['drift_max'] < 1e-6 and stats['constraint_error'] < 1e-12
+
+
+def test_cadence_and_abort_threshold(use_numba):
+    plain = integrate_rk4(10.0, 6.0, dphi=0.01)
+    *path, stats = integrate_rk4(10.0, 6.0, dphi=0.01, stats=True, check_every=10)
+    assert all(np.array_equal(a, b) for a, b in zip(plain, path))
+    assert stats['drift_checks'] == stats['steps'] // 10
+    assert 0 < stats['drift_mean'] <= stats['drift_max']
+
+    phi, r, stats = integrate_rk4(10.0, 6.0, dphi=0.1, stats=True, max_drift=1e-9)
+    assert stats['reason'] == DRIFT and stats['drift_max'] > 1e-9
+    assert len(r) == stats['steps']
+
+
+def test_kerr_projection_and_abort(use_numba):
+    *_, fate, stats = simulate_photon(15.0, np.pi, 6.0, 1.0, 0.7, dt=0.5, stats=True,
+                                      project=True)
+    assert fate == 'captured' and stats['constraint_error'] < 1e-14
+    assert stats['drift_max'] < 1e-9
+
+    *_, fate, stats = simulate_photon(15.0, np.pi, 6.0, 1.0, 0.7, dt=0.5, stats=True,
+                                      max_drift=1e-12)
+    assert fate == 'aborted' and stats['reason'] == DRIFT
+
+
+def test_per_ray_threshold_in_a_sweep():
+    # The captured ray drifts most, near r = 1.51 M
+    _, summary = instrumented_sweep(ray, [4.0, 6.0], workers=1, dphi=0.1, max_drift=1e-5)
+    assert summary['aborted'] == [0] and summary['drift_max'] > 1e-5
+
+    config = SchwarzschildConfig(b=4.0, dphi=0.1, max_drift=1e-5)
+    assert len(run(config)[1]) < len(integrate_rk4(10.0, 4.0, dphi=0.1)[1])
+    assert run(KerrConfig(dt=0.5, project=True))[4] == 'captured'
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from blackhole.analytic import turning_points
+from blackhole.integrators import (dense_output, dopri45_stages, integrate_adaptive,
+                                   make_event)
+from blackhole.kerr import horizon_radius, simulate_photon_rk45
+from blackhole.schwarzschild import integrate_rk45, ray_fate
+from blackhole.stats import ESCAPE, HORIZON
+
+
+def oscillator(t, y):
+    return np.array([y[1], -y[0]])
+
+
+def test_dense_output_is_fourth_order_inside_the_step():
+    errors = []
+    for h in (0.4, 0.2):
+        y0 = np.array([1.0, 0.0])
+        y1, _, k = dopri45_stages(oscillator, 0.0, y0, h, oscillator(0.0, y0))
+        interp = dense_output(0.0, y0, h, k)
+        errors.append(abs(interp(0.3*h)[0] - np.cos(0.3*h)))
+        assert np.allclose(interp(0.0), y0, rtol=0, atol=1e-15)
+        assert np.allclose(interp(h), y1, rtol=0, atol=1e-15)
+    assert errors[0]/errors[1] > 2**4.5
+
+
+def test_events_are_located_between_long_steps():
+    events = [make_event('zero', lambda t, y: y[0], -1, terminal=False),
+              make_event('stop', lambda t, y: y[1], +1)]
+    ts, ys, stats = integrate_adaptive(oscillator, 0.0, [1.0, 0.0], 0.1, 1e-10, 1e-12,
+                                       events=events)
+    # cos t falls through zero at pi/2 and -sin t rises through zero at pi
+    assert [event['name'] for event in stats['events']] == ['zero', 'stop']
+    assert stats['events'][0]['t'] == pytest.approx(np.pi/2, abs=1e-9)
+    assert stats['event'] == 'stop' and ts[-1] == pytest.approx(np.pi, abs=1e-9)
+    assert ys[-1] == pytest.approx([-1.0, 0.0], abs=1e-9)
+    assert len(ts) == stats['accepted'] + 1
+
+
+@pytest.mark.parametrize('b', [5.5, 6.0, 8.0])
+def test_periapsis_to_full_precision_with_large_steps(b):
+    r_peri = turning_points(b)[2]
+    phi, r, stats = integrate_rk45(10.0, b, rtol=1e-10, atol=1e-12)
+    assert stats['r_min'] == pytest.approx(r_peri, rel=1e-9)
+    # The output grid alone is far coarser
+    assert abs(r.min() - r_peri) > 1e3*abs(stats['r_min'] - r_peri)
+    assert stats['reason'] == ESCAPE and r[-1] == pytest.approx(50.0, rel=1e-12)
+
+
+def test_capture_stops_on_the_horizon_threshold():
+    phi, r, stats = integrate_rk45(10.0, 4.0)
+    assert stats['reason'] == HORIZON and r[-1] == pytest.approx(1.51, rel=1e-12)
+    assert ray_fate(4.0) == 'captured' and ray_fate(6.0) == 'escaped'
+
+    for a in (0.7, -0.7):
+        *_, fate, stats = simulate_photon_rk45(15.0, np.pi, 4.5, 1.0, a)
+        assert fate == 'captured' and stats['reason'] == HORIZON
+        assert stats['y_end'][0] == pytest.approx(1.05*horizon_radius(1.0, a), rel=1e-12)
@@ -0,0 +1,49 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from blackhole.animation import PathAnimation
+from blackhole.export import export_figures, export_gif
+
+
+def build_animation():
+    t = np.linspace(0, 4*np.pi, 2000)
+    fig, ax = plt.subplots(figsize=(3, 3), dpi=40)
+    ax.set_xlim(-1, 1)
+    ax.set_ylim(-1, 1)
+    anim = PathAnimation(fig)
+    anim.add_path(ax, t/13*np.cos(t), t/13*np.sin(t), color='blue')
+    anim.add_path(ax, -np.cos(t[:300]), np.sin(t[:300]), marker='bo')
+    return anim
+
+
+def build_figure():
+    fig, ax = plt.subplots(figsize=(3, 2))
+    ax.plot(np.sin(np.linspace(0, 10, 200)))
+    ax.set_title('figure')
+    return fig
+
+
+def test_parallel_gif_is_byte_identical(tmp_path):
+    serial, parallel = tmp_path/'serial.gif', tmp_path/'parallel.gif'
+    assert export_gif(build_animation, serial, frames=25, workers=1) == 25
+    assert export_gif(build_animation, parallel, frames=25, workers=3) == 25
+    assert serial.read_bytes() == parallel.read_bytes()
+
+
+def test_parallel_figures_are_byte_identical(tmp_path):
+    jobs = [(build_figure, tmp_path/f'serial_{i}.png') for i in range(2)]
+    export_figures(jobs, dpi=60, workers=1, bbox_inches='tight')
+    jobs = [(build_figure, tmp_path/f'parallel_{i}.png') for i in range(2)]
+    export_figures(jobs, dpi=60, workers=2, bbox_inches='tight')
+
+    for i in range(2):
+        serial = (tmp_path/f'serial_{i}.png').read_bytes()
+        assert serial == (tmp_path/f'parallel_{i}.png').read_bytes()
+
+    # Saved by savefig itself, so the DPI is recorded in the file
+    with Image.open(tmp_path/'parallel_0.png') as image:
+        assert np.allclose(image.info['dpi'], 60, atol=0.1)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from blackhole import kernels
+from blackhole.kerr import simulate_photon
+from blackhole.newton import compute_trajectory
+from blackhole.schwarzschild import integrate_rk4
+
+
+def run_both(monkeypatch, func, *args, **kwargs):
+    """Same call through the compiled kernel and through the NumPy code"""
+
+    monkeypatch.setattr(kernels, 'USE_NUMBA', True)
+    fast = func(*args, **kwargs)
+    monkeypatch.setattr(kernels, 'USE_NUMBA', False)
+    slow = func(*args, **kwargs)
+    return fast, slow
+
+
+def test_newton_kernel_matches_numpy(monkeypatch):
+    fast, slow = run_both(monkeypatch, compute_trajectory, steps=500)
+
+    for f, s in zip(fast, slow):
+        assert len(f) == len(s)
+        assert np.allclose(f, s, rtol=1e-12)
+
+
+def test_schwarzschild_kernel_matches_numpy(monkeypatch):
+    for b in [3.0, 8.0]:
+        fast, slow = run_both(monkeypatch, integrate_rk4, r0=10.0, b=b)
+
+        for f, s in zip(fast, slow):
+            assert len(f) == len(s)
+            assert np.allclose(f, s, rtol=1e-12)
+
+
+def test_kerr_kernel_matches_numpy(monkeypatch):
+    fast, slow = run_both(monkeypatch, simulate_photon, 15.0, np.pi, 4.5, 1.0, 0.7,
+                          max_steps=2000)
+
+    assert fast[4] == slow[4]
+    for f, s in zip(fast[:4], slow[:4]):
+        assert len(f) == len(s)
+        assert np.allclose(f, s, rtol=1e-10)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from blackhole import kernels
+from blackhole.analytic import swept_angle
+from blackhole.kerr import critical_impact_parameter
+from blackhole.kerr3d import (CAPTURED, ESCAPED, critical_curve, render_kerr_shadow,
+                              sky_direction, trace_camera, trace_rays)
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    if request.param and not kernels.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(kernels, 'USE_NUMBA', request.param)
+
+
+@pytest.mark.parametrize('a', [0.0, 0.9])
+def test_equatorial_shadow_edges(use_numba, a):
+    """Seen edge-on, the shadow spans the prograde and retrograde photon orbits"""
+    alpha = np.linspace(-8, 8, 801)
+    fate = trace_rays(alpha, np.zeros_like(alpha), inclination=90.0, a=a)[0]
+    captured = alpha[fate == CAPTURED]
+    assert captured.min() == pytest.approx(-critical_impact_parameter(1.0, a), abs=0.02)
+    assert captured.max() == pytest.approx(critical_impact_parameter(1.0, -a), abs=0.02)
+
+
+def test_inclined_shadow_matches_critical_curve():
+    a, inclination = 0.9, 60.0
+    # The edge is widest on the beta = 0 row, at the ends of the photon region
+    alpha, _ = critical_curve(a, inclination)
+
+    row = np.linspace(-8, 8, 801)
+    fate = trace_rays(row, np.zeros_like(row), inclination=inclination, a=a)[0]
+    captured = row[fate == CAPTURED]
+    assert captured.min() == pytest.approx(alpha.min(), abs=0.02)
+    assert captured.max() == pytest.approx(alpha.max(), abs=0.02)
+
+
+def test_schwarzschild_rays_bend_by_the_exact_angle():
+    alpha, beta = np.array([6.0, 0.0, -10.0, 3.0]), np.array([0.0, 8.0, 5.0, 4.5])
+    fate, theta, phi, _ = trace_rays(alpha, beta, inclination=60.0, a=0.0, h=0.02)
+    assert np.all(fate == ESCAPED)
+
+    lon, lat = sky_direction(theta, phi)
+    i = np.radians(60.0)
+    cos = np.cos(lat)*np.cos(lon)*np.sin(i) + np.sin(lat)*np.cos(i)
+    b = np.hypot(alpha, beta)
+    swept = swept_angle(b, 50.0) + swept_angle(b, np.inf)
+    assert np.allclose(cos, np.cos(swept), atol=1e-5)
+
+    # A weakly bent pixel above the hole sees the sky above the camera's antipode
+    fate, theta, phi, _ = trace_rays(np.array([0.0]), np.array([30.0]), inclination=60.0)
+    lon, lat = sky_direction(theta, phi)
+    assert np.pi - i - 0.6 < np.pi/2 - lat[0] < np.pi - i
+
+
+def test_camera_chunks_and_backends_agree(monkeypatch):
+    kwargs = dict(width=24, height=16, fov=20.0, inclination=75.0, a=0.7)
+    whole = trace_camera(**kwargs, chunk=10**6)
+    chunked = trace_camera(**kwargs, chunk=50, workers=2)
+    assert all(np.array_equal(whole[k], chunked[k]) for k in ('fate', 'theta', 'phi'))
+
+    if kernels.HAVE_NUMBA:
+        monkeypatch.setattr(kernels, 'USE_NUMBA', not kernels.USE_NUMBA)
+        other = trace_camera(**kwargs)
+        assert np.array_equal(whole['fate'], other['fate'])
+        assert np.allclose(whole['theta'], other['theta'], rtol=1e-10)
+
+    image = render_kerr_shadow(24, 16, 20.0, inclination=75.0, a=0.7)
+    assert image.shape == (16, 24, 3)
+    assert np.array_equal(np.all(image == 0, axis=2), whole['fate'] != ESCAPED)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from blackhole import analytic
+from blackhole.kerr import critical_impact_parameter, horizon_radius
+from blackhole.kerr_grid import kerr_grid
+
+SPINS = np.array([-0.9, 0.0, 0.5])
+
+
+def test_fate_edge_follows_each_spin():
+    """Every spin captures just below its own b_crit and lets through just above it"""
+    b_crit = critical_impact_parameter(1.0, SPINS)
+    for a, bc in zip(SPINS, b_crit):
+        grid = kerr_grid([a], [bc - 0.05, bc + 0.05], workers=1)
+        assert grid['fate'].tolist() == [['captured', 'escaped']]
+        assert grid['closest'][0, 0] < 1.02*horizon_radius(1.0, a)
+        assert np.isnan(grid['deflection'][0, 0])
+
+
+def test_schwarzschild_row_is_exact():
+    bs = np.array([5.5, 7.0, 12.0])
+    grid = kerr_grid([0.0], bs, r0=50.0, workers=1)
+    exact = 2*analytic.swept_angle(bs, 50.0) - (np.pi - 2*np.arcsin(bs/50.0))
+    np.testing.assert_allclose(grid['deflection'][0], exact, atol=1e-7)
+    np.testing.assert_allclose(grid['closest'][0], analytic.turning_points(bs)[2], rtol=1e-8)
+
+
+def test_refined_grid_reuses_stored_cells(tmp_path):
+    path = str(tmp_path / 'grid.npz')
+    bs = np.linspace(3.0, 7.0, 5)
+    coarse = kerr_grid(SPINS, bs, path=path)
+    assert (coarse['computed'], coarse['reused']) == (15, 0)
+    np.testing.assert_allclose(coarse['r_plus'], horizon_radius(1.0, SPINS))
+    np.testing.assert_allclose(coarse['r_ergo'], 2.0)
+
+    fine = kerr_grid(SPINS, np.linspace(3.0, 7.0, 9), path=path)
+    assert (fine['computed'], fine['reused']) == (12, 15)
+    assert (fine['fate'][:, ::2] == coarse['fate']).all()
+    np.testing.assert_array_equal(fine['closest'][:, ::2], coarse['closest'])
+
+    # Other settings, other results: nothing is reused
+    assert kerr_grid(SPINS, bs, r0=40.0, path=path)['reused'] == 0
+
+
+def test_spin_above_mass_is_rejected():
+    with pytest.raises(ValueError):
+        kerr_grid([1.2], [4.0])
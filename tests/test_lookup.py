@@ -0,0 +1,37 @@
+import numpy as np
+
+from blackhole import lookup
+from blackhole.analytic import critical_impact_parameter, deflection
+from blackhole.lookup import DeflectionTable, deflection_table, pchip_eval, pchip_slopes
+
+
+def test_table_matches_elliptic_integrals(tmp_path):
+    table = deflection_table(dphi=2e-3, n_points=512, directory=str(tmp_path))
+
+    b_crit = critical_impact_parameter(2.0)
+    b = np.concatenate([b_crit*(1 + np.geomspace(1e-10, 100, 400)), [1e4, 3.0]])
+    alpha, r_min, fate = table(b, M=2.0)
+    alpha_ref, r_min_ref, fate_ref = deflection(b, M=2.0)
+
+    assert np.array_equal(fate, fate_ref)
+    assert np.allclose(alpha, alpha_ref, atol=1e-6, equal_nan=True)
+    assert np.allclose(r_min, r_min_ref, atol=1e-6, equal_nan=True)
+
+
+def test_table_is_saved_and_reloaded(tmp_path, monkeypatch):
+    path = lookup.table_path(5e-3, 64, 100.0, 1e-6, str(tmp_path))
+    first = deflection_table(5e-3, 64, 100.0, 1e-6, directory=str(tmp_path))
+    assert np.array_equal(DeflectionTable.load(path).alpha, first.alpha)
+
+    # A fresh process loads the file instead of integrating again
+    monkeypatch.setattr(lookup, '_TABLES', {})
+    monkeypatch.setattr(DeflectionTable, 'build', None)
+    again = deflection_table(5e-3, 64, 100.0, 1e-6, directory=str(tmp_path))
+    assert np.array_equal(again.r_min, first.r_min)
+
+
+def test_pchip_keeps_monotone_data_monotone():
+    x = np.array([0.0, 1.0, 1.1, 3.0, 3.2])
+    y = np.array([0.0, 0.1, 5.0, 5.1, 9.0])
+    yq = pchip_eval(x, y, pchip_slopes(x, y), np.linspace(0, 3.2, 500))
+    assert np.all(np.diff(yq) >= 0)
@@ -0,0 +1,36 @@
+import numpy as np
+
+from blackhole.analytic import swept_angle
+from blackhole.lookup import deflection_table
+from blackhole.render import critical_angle, escape_angles, render_shadow, save_image
+
+
+def test_escape_angles_match_elliptic_integrals(tmp_path):
+    """Inbound leg r_obs -> periapsis plus outbound leg periapsis -> infinity"""
+
+    b = np.array([5.6, 7.0, 12.0, 30.0])
+    phi_inf = escape_angles(b, r_obs=50.0)
+    expected = swept_angle(b, 50.0) + swept_angle(b, np.inf)
+    assert np.allclose(phi_inf, expected, atol=1e-8)
+
+    table = deflection_table(dphi=2e-3, n_points=512, directory=str(tmp_path))
+    assert np.allclose(escape_angles(b, r_obs=50.0, table=table), expected, atol=1e-7)
+
+
+def test_shadow_size_and_npy_output(tmp_path):
+    width = height = 101
+    fov = 20.0
+    image = render_shadow(width, height, fov, r_obs=40.0, n_rays=256)
+
+    # Centre pixel is inside the shadow, corner sees the sky
+    assert np.all(image[50, 50] == 0)
+    assert np.any(image[0, 0] > 0)
+
+    # Dark pixels cover the disc of the critical angle
+    scale = 2*np.tan(np.radians(fov)/2)/height
+    r_pix = np.tan(critical_angle(40.0))/scale
+    dark = np.all(image == 0, axis=2).sum()
+    assert abs(dark - np.pi*r_pix**2) < 2*np.pi*r_pix
+
+    save_image(image, tmp_path/'shadow.npy')
+    assert np.array_equal(np.load(tmp_path/'shadow.npy'), image)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from blackhole import kernels
+from blackhole.kerr import simulate_photon
+from blackhole.newton import compute_trajectory
+from blackhole.schwarzschild import integrate_photon_orbit, integrate_rk4
+from blackhole.stats import (ESCAPE, HORIZON, MAX_STEPS, TURNING_POINT,
+                             instrumented_sweep)
+
+KEYS = {'steps', 'nfev', 'rejected', 'reason', 'wall_time', 'constraint_error'}
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    if request.param and not kernels.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(kernels, 'USE_NUMBA', request.param)
+
+
+def test_stats_are_extra_and_do_not_change_the_path(use_numba):
+    plain = integrate_rk4(10.0, 3.0)
+    *path, stats = integrate_rk4(10.0, 3.0, stats=True)
+    assert all(np.array_equal(a, b) for a, b in zip(plain, path))
+    assert set(stats) == KEYS
+    assert stats['steps'] == len(plain[1]) and stats['nfev'] == 4*stats['steps']
+    assert stats['reason'] == HORIZON
+    assert stats['constraint_error'] < 1e-10
+
+    assert integrate_rk4(10.0, 8.0, stats=True)[2]['reason'] == ESCAPE
+    capped = integrate_rk4(10.0, 8.0, max_steps=100, stats=True)[2]
+    assert capped['reason'] == MAX_STEPS and capped['steps'] == 100
+
+    # The last allowed step lands inside the horizon but is never checked
+    last = integrate_rk4(10.0, 3.0, max_steps=stats['steps'], stats=True)[2]
+    assert last['reason'] == MAX_STEPS
+
+    x, y, stats = compute_trajectory(-10.0, 3.0, steps=2000, stats=True)
+    assert stats['reason'] == MAX_STEPS and stats['constraint_error'] < 1e-8
+
+    *_, fate, stats = simulate_photon(15.0, np.pi, 4.5, 1.0, 0.7, stats=True)
+    assert fate == 'captured' and stats['reason'] == HORIZON
+    assert stats['constraint_error'] < 1e-10
+
+
+def test_sweep_summary_finds_capped_rays():
+    _, summary = instrumented_sweep(integrate_photon_orbit, [3.0, 20.0], workers=1)
+    assert summary['rays'] == 2
+    assert summary['reasons'] == {HORIZON: 1, TURNING_POINT: 1}
+    assert summary['capped'] == []
+
+    results, summary = instrumented_sweep(integrate_rk4, [10.0, 20.0], workers=1,
+                                          b=3.0, max_steps=1000)
+    assert summary['capped'] == [0, 1]
+    assert summary['steps'] == summary['steps_max']*2 == 2000
+    assert len(results[0]) == 2
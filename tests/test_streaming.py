@@ -0,0 +1,39 @@
+import numpy as np
+
+from blackhole.kerr import simulate_photon, stream_photon
+from blackhole.schwarzschild import (integrate_photon_orbit, integrate_rk4,
+                                     stream_photon_orbit, stream_rk4)
+from blackhole.streaming import collect, is_summary
+
+
+def test_stream_rk4_chunks_reassemble_the_path():
+    chunks = list(stream_rk4(r0=10.0, b=6.0, chunk_size=500))
+    assert is_summary(chunks[-1])
+    assert all(len(c[0]) == 500 for c in chunks[:-2])
+
+    (phi_s, r_s), summary = collect(iter(chunks))
+    phi, r = integrate_rk4(r0=10.0, b=6.0)
+
+    assert np.allclose(phi_s, phi) and np.allclose(r_s, r)
+    assert summary['fate'] == 'escaped'
+    assert summary['closest'] == r.min()
+    assert summary['n_points'] == len(r)
+
+
+def test_stream_photon_orbit_matches_integrate_photon_orbit():
+    for b in [4.0, 6.0]:
+        (x_s, y_s), summary = collect(stream_photon_orbit(b, chunk_size=64))
+        x, y, fate, closest = integrate_photon_orbit(b)
+
+        assert np.allclose(x_s, x) and np.allclose(y_s, y)
+        assert summary['fate'] == fate and summary['closest'] == closest
+
+
+def test_stream_photon_matches_simulate_photon():
+    (x_s, y_s, r_s, phi_s), summary = collect(
+        stream_photon(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=3000, chunk_size=1))
+    x, y, r, phi, fate = simulate_photon(15.0, np.pi, 4.5, 1.0, 0.7, max_steps=3000)
+
+    assert np.allclose(r_s, r, rtol=1e-10) and np.allclose(phi_s, phi, rtol=1e-10)
+    assert summary['fate'] == fate
+    assert np.isclose(summary['closest'], r.min())
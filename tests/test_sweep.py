@@ -0,0 +1,40 @@
+from functools import partial
+
+import numpy as np
+
+from blackhole.kerr import simulate_photon
+from blackhole.schwarzschild import integrate_photon_orbit
+from blackhole.sweep import sweep
+
+
+def test_parallel_sweep_matches_serial_in_order():
+    bs = np.array([3.0, 5.0, 5.5, 6.0, 8.0, 10.0])
+
+    serial = [integrate_photon_orbit(b, M=1.0, r_start=20.0) for b in bs]
+    parallel = sweep(integrate_photon_orbit, bs, workers=3, chunksize=1,
+                     M=1.0, r_start=20.0)
+
+    assert len(parallel) == len(serial)
+    for (xs, ys, fs, cs), (xp, yp, fp, cp) in zip(serial, parallel):
+        assert fs == fp
+        assert cs == cp
+        assert np.array_equal(xs, xp) and np.array_equal(ys, yp)
+
+
+def test_tiny_sweep_runs_serially():
+    """Below min_parallel no pool is started, so unpicklable callables work"""
+
+    calls = []
+    results = sweep(lambda b: calls.append(b) or b**2, [1.0, 2.0], workers=8)
+
+    assert results == [1.0, 4.0]
+    assert calls == [1.0, 2.0]
+
+
+def test_kerr_spins_through_executor():
+    runs = sweep(partial(simulate_photon, 15.0, np.pi, 4.5, 1.0, max_steps=500),
+                 [0.7, -0.7, 0.3, -0.3], workers=2)
+
+    for spin, run in zip([0.7, -0.7, 0.3, -0.3], runs):
+        expected = simulate_photon(15.0, np.pi, 4.5, 1.0, spin, max_steps=500)
+        assert np.array_equal(run[0], expected[0])
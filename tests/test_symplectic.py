@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from blackhole import kernels
+from blackhole.config import NewtonConfig, run
+from blackhole.newton import (METHODS, SPLITTINGS, compute_trajectory, conservation_report,
+                              integrate_symplectic)
+
+# An eccentric bound orbit: E = 0.18 - 2/2 < 0
+ORBIT = dict(x0=2.0, y0=0.0, vx0=0.0, vy0=0.6, r_cutoff=0.0)
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    if request.param and not kernels.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(kernels, 'USE_NUMBA', request.param)
+
+
+@pytest.mark.parametrize('method, order', [('verlet', 2), ('yoshida4', 4),
+                                           ('forest_ruth', 4), ('pefrl', 4)])
+def test_convergence_order(method, order):
+    def end(dt):
+        x, y = integrate_symplectic(**ORBIT, dt=dt, steps=round(5.0/dt), method=method)
+        return np.array([x[-1], y[-1]])
+
+    reference = end(0.0005)
+    coarse, fine = (np.linalg.norm(end(dt) - reference) for dt in (0.02, 0.01))
+    assert np.log2(coarse/fine) == pytest.approx(order, abs=0.4)
+
+
+@pytest.mark.parametrize('method', SPLITTINGS)
+def test_invariants_over_a_long_run(use_numba, method):
+    *_, stats = compute_trajectory(**ORBIT, dt=0.05, steps=20000, stats=True, method=method)
+    assert stats['angular_momentum_error'] < 1e-12
+    assert stats['constraint_error'] < 1e-4
+
+
+def test_report_compares_every_method():
+    report = conservation_report(**ORBIT, dt=0.05, steps=20000)
+    assert set(report) == set(METHODS)
+    # RK4 drifts secularly; the symplectic schemes stay bounded
+    assert all(report[m]['energy_drift'] < report['rk4']['energy_drift']/100
+               for m in SPLITTINGS)
+    assert report['verlet']['nfev'] == 20001
+    assert report['yoshida4']['nfev'] == 3*20000 + 1
+
+
+def test_numba_matches_numpy(monkeypatch):
+    if not kernels.HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    runs = []
+    for flag in (False, True):
+        monkeypatch.setattr(kernels, 'USE_NUMBA', flag)
+        runs.append(integrate_symplectic(-10.0, 3.0, method='forest_ruth', record_every=7))
+    assert np.allclose(runs[0], runs[1], rtol=0, atol=1e-12)
+
+
+def test_method_is_selectable_by_name():
+    a = run(NewtonConfig(y0=3.0, method='pefrl'))
+    b = integrate_symplectic(-10.0, 3.0, method='pefrl')
+    assert all(np.array_equal(u, v) for u, v in zip(a, b))
+    with pytest.raises(ValueError, match='unknown method'):
+        compute_trajectory(method='leapfrog')